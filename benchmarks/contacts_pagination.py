@@ -0,0 +1,111 @@
+"""
+Benchmark: offset vs keyset pagination of a large address book.
+
+Seeds one user with ``pages * limit`` contacts and times page 1 and the
+last page through ``get_contacts`` (OFFSET/LIMIT) and
+``get_contacts_page`` (cursor). Uses a throwaway SQLite database unless
+BENCH_DB_URL points at another database (its tables are recreated).
+
+Run with: python -m benchmarks.contacts_pagination [--pages 1000] [--limit 100]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+
+_db_dir = tempfile.mkdtemp(prefix="bench-")
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+os.environ.setdefault("CLD_NAME", "benchmark")
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.database.models import Base, Contact, User
+from src.repository.contacts import ContactRepository
+from src.repository.pagination import encode_cursor
+
+REPEAT = 20
+
+
+async def seed(session_maker, total: int) -> User:
+    async with session_maker() as session:
+        user = User(username="bench", email="bench@example.com", hashed_password="x")
+        session.add(user)
+        await session.commit()
+        batch = []
+        for i in range(total):
+            batch.append(
+                {
+                    "first_name": f"First{i}",
+                    "last_name": f"Last{i % 977:04d}",
+                    "email": f"contact{i}@example.com",
+                    "phone": "0999999999",
+                    "birthday": date(1990, 1 + i % 12, 1 + i % 28),
+                    "additional_info": "",
+                    "user_id": user.id,
+                }
+            )
+            if len(batch) == 5_000:
+                await session.execute(insert(Contact), batch)
+                batch = []
+        if batch:
+            await session.execute(insert(Contact), batch)
+        await session.commit()
+        return user
+
+
+async def measure(call) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+async def main(pages: int, limit: int):
+    url = os.environ.get("BENCH_DB_URL", os.environ["DB_URL"])
+    engine = create_async_engine(url)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    user = await seed(session_maker, pages * limit)
+
+    async with session_maker() as session:
+        repository = ContactRepository(session)
+        last_skip = (pages - 1) * limit
+        last_id = (
+            await session.execute(
+                select(Contact.id)
+                .filter_by(user_id=user.id)
+                .order_by(Contact.id)
+                .offset(last_skip - 1)
+                .limit(1)
+            )
+        ).scalar_one()
+        cursor = encode_cursor("id", [last_id])
+
+        cases = {
+            "offset page 1": lambda: repository.get_contacts(0, limit, None, user),
+            f"offset page {pages}": lambda: repository.get_contacts(last_skip, limit, None, user),
+            "keyset page 1": lambda: repository.get_contacts_page(limit, None, "id", None, user),
+            f"keyset page {pages}": lambda: repository.get_contacts_page(limit, cursor, "id", None, user),
+        }
+        for name, call in cases.items():
+            median = await measure(call)
+            print(f"{name:<20} {median * 1e3:8.2f} ms")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.limit))
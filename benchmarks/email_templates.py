@@ -0,0 +1,57 @@
+"""
+Render-throughput benchmark for transactional email templates.
+
+Compares resolving and rendering the template through Jinja on every
+message (the old ``FastMail`` behaviour), rendering a precompiled Jinja
+template, and ``EmailTemplateRenderer`` filling its cached static parts.
+Use the messages/s figure to size ``MAIL_BATCH_SIZE`` and the number of
+mail workers.
+
+Run with: python -m benchmarks.email_templates
+"""
+import timeit
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from src.services.email import TEMPLATE_FOLDER
+from src.services.email_templates import EmailTemplateRenderer
+
+ITERATIONS = 20_000
+FIELDS = {
+    "username": "deadpool",
+    "host": "http://localhost:8000/",
+    "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9." + "x" * 120,
+}
+
+
+def report(name: str, render, number: int = ITERATIONS):
+    seconds = timeit.timeit(render, number=number) / number
+    print(f"{name:<22} {seconds * 1e6:8.2f} us/message  {1 / seconds:>10,.0f} messages/s")
+
+
+def main():
+    for email_type in ("verify_email", "reset_password"):
+        print(email_type)
+
+        def render_uncached():
+            env = Environment(
+                loader=FileSystemLoader(TEMPLATE_FOLDER),
+                autoescape=select_autoescape(["html"]),
+            )
+            env.get_template(f"{email_type}.html").render(**FIELDS)
+
+        report("jinja per message", render_uncached, ITERATIONS // 20)
+
+        template = Environment(
+            loader=FileSystemLoader(TEMPLATE_FOLDER),
+            autoescape=select_autoescape(["html"]),
+        ).get_template(f"{email_type}.html")
+        report("jinja precompiled", lambda: template.render(**FIELDS))
+
+        renderer = EmailTemplateRenderer(TEMPLATE_FOLDER)
+        renderer.load()
+        report("cached static parts", lambda: renderer.render(email_type, **FIELDS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Load benchmark: latency of GET /api/contacts during a login storm.
+
+Runs the app in-process against a throwaway SQLite database and compares
+bcrypt running inline on the event loop with bcrypt offloaded to the
+password hashing pool.
+
+Run with: python -m benchmarks.login_storm [--seconds 5] [--logins 8]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+
+_db_dir = tempfile.mkdtemp(prefix="bench-")
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+os.environ.setdefault("CLD_NAME", "benchmark")
+os.environ.setdefault("USER_CACHE_BUS", "local")
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from main import app
+from src.conf.config import settings
+from src.database.db import get_db
+from src.database.models import Base, Contact, User
+from src.database.redis_client import get_redis
+from src.services.auth import Hash, create_access_token
+
+USERNAME = "bench"
+PASSWORD = "12345678"
+
+
+class MemoryRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+async def prepare():
+    engine = create_async_engine(settings.DB_URL)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_maker() as session:
+        user = User(
+            username=USERNAME,
+            email="bench@example.com",
+            hashed_password=Hash().get_password_hash(PASSWORD),
+            confirmed=True,
+            avatar="https://example.com/avatar.png",
+        )
+        session.add(user)
+        await session.flush()
+        for i in range(50):
+            session.add(
+                Contact(
+                    first_name=f"First{i}",
+                    last_name=f"Last{i}",
+                    email=f"contact{i}@example.com",
+                    phone="0999999999",
+                    birthday=date(1990, 1, 1 + i % 28),
+                    additional_info="",
+                    user_id=user.id,
+                )
+            )
+        await session.commit()
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    redis = MemoryRedis()
+
+    async def override_get_redis():
+        return redis
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_redis] = override_get_redis
+    return engine
+
+
+async def login_loop(client: httpx.AsyncClient, deadline: float) -> int:
+    count = 0
+    while time.perf_counter() < deadline:
+        response = await client.post(
+            "/api/auth/login", data={"username": USERNAME, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        count += 1
+    return count
+
+
+async def read_loop(client: httpx.AsyncClient, token: str, deadline: float) -> list[float]:
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies = []
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get("/api/contacts/", headers=headers)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def run_mode(name: str, seconds: float, logins: int, readers: int):
+    token = await create_access_token(data={"sub": USERNAME})
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/api/contacts/", headers={"Authorization": f"Bearer {token}"})
+        deadline = time.perf_counter() + seconds
+        results = await asyncio.gather(
+            *(login_loop(client, deadline) for _ in range(logins)),
+            *(read_loop(client, token, deadline) for _ in range(readers)),
+        )
+    login_count = sum(results[:logins])
+    latencies = sorted(l for batch in results[logins:] for l in batch)
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:<9} logins={login_count:>5}  reads={len(latencies):>6}  "
+        f"p50={p50 * 1e3:8.2f} ms  p99={p99 * 1e3:8.2f} ms  max={latencies[-1] * 1e3:8.2f} ms"
+    )
+
+
+async def main(seconds: float, logins: int, readers: int):
+    # The storm is one client hammering /login; measure hashing, not the limiter.
+    settings.RATE_LIMIT_ENABLED = False
+    engine = await prepare()
+
+    async def verify_inline(self, plain_password, hashed_password):
+        return self.verify_password(plain_password, hashed_password)
+
+    offloaded = Hash.verify_password_async
+    Hash.verify_password_async = verify_inline
+    try:
+        await run_mode("inline", seconds, logins, readers)
+    finally:
+        Hash.verify_password_async = offloaded
+    await run_mode("executor", seconds, logins, readers)
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--logins", type=int, default=8, help="concurrent login loops")
+    parser.add_argument("--readers", type=int, default=4, help="concurrent contact readers")
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds, args.logins, args.readers))
@@ -0,0 +1,64 @@
+"""
+Micro-benchmark for the user cache payload.
+
+Compares the ``CachedUser`` codec with the previous ``jsonpickle`` encoding
+of a whole SQLAlchemy ``User`` instance.
+
+Run with: python -m benchmarks.user_cache_codec
+"""
+import timeit
+from datetime import datetime
+
+import jsonpickle
+
+from src.database.models import User, UserRole
+from src.services.user_cache import CachedUser, encode_user, decode_user
+
+ITERATIONS = 20_000
+
+
+def make_user() -> User:
+    return User(
+        id=42,
+        username="deadpool",
+        email="deadpool@example.com",
+        hashed_password="$2b$12$" + "x" * 53,
+        created_at=datetime(2024, 12, 29, 12, 0, 0),
+        avatar="https://www.gravatar.com/avatar/0123456789abcdef0123456789abcdef",
+        confirmed=True,
+        role=UserRole.USER,
+    )
+
+
+def report(name: str, payload, encode, decode):
+    encode_time = timeit.timeit(encode, number=ITERATIONS) / ITERATIONS
+    decode_time = timeit.timeit(decode, number=ITERATIONS) / ITERATIONS
+    print(
+        f"{name:<12} payload={len(payload):>5} B  "
+        f"encode={encode_time * 1e6:8.2f} us  decode={decode_time * 1e6:8.2f} us"
+    )
+
+
+def main():
+    user = make_user()
+
+    pickled = jsonpickle.encode(user)
+    report(
+        "jsonpickle",
+        pickled,
+        lambda: jsonpickle.encode(user),
+        lambda: jsonpickle.decode(pickled),
+    )
+
+    cached = CachedUser.from_user(user)
+    encoded = encode_user(cached)
+    report(
+        "CachedUser",
+        encoded,
+        lambda: encode_user(CachedUser.from_user(user)),
+        lambda: decode_user(encoded),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,31 @@
+import math
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 from src.api import utils, contacts, auth, users
-from slowapi.errors import RateLimitExceeded
 from starlette.responses import JSONResponse
 
+from src.conf.config import settings
+from src.services.rate_limit import RateLimitExceeded
+from src.services.resources import resources
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create shared clients on startup and release them on shutdown.
+
+    Args:
+    - app: FastAPI application instance.
+    """
+    await resources.startup()
+    yield
+    await resources.shutdown()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 origins = ["*"]
 app.add_middleware(
     CORSMiddleware,
@@ -27,9 +47,15 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     Returns:
     - JSONResponse with status code 429 and an error message.
     """
+    result = exc.result
     return JSONResponse(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
         content={"error": "Перевищено ліміт запитів. Спробуйте пізніше."},
+        headers={
+            "Retry-After": str(max(1, math.ceil(result.retry_after))),
+            "X-RateLimit-Limit": str(result.limit),
+            "X-RateLimit-Remaining": str(result.remaining),
+        },
     )
 
 app.include_router(utils.router, prefix="/api")
@@ -37,6 +63,13 @@ app.include_router(contacts.router, prefix="/api")
 app.include_router(auth.router, prefix="/api")
 app.include_router(users.router, prefix="/api")
 
+if settings.AVATAR_STORAGE == "local":
+    app.mount(
+        settings.AVATAR_LOCAL_URL,
+        StaticFiles(directory=settings.AVATAR_LOCAL_DIR, check_dir=False),
+        name="avatars",
+    )
+
 
 if __name__ == "__main__":
     import uvicorn
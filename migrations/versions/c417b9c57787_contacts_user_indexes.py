@@ -0,0 +1,34 @@
+"""contacts user indexes
+
+Revision ID: c417b9c57787
+Revises: ccffe13a09c7
+Create Date: 2026-10-18 11:48:09.551204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c417b9c57787'
+down_revision: Union[str, None] = 'ccffe13a09c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_contacts_user_id_id", "contacts", ["user_id", "id"])
+    op.create_index(
+        "ix_contacts_user_id_last_name_first_name",
+        "contacts",
+        ["user_id", "last_name", "first_name"],
+    )
+    op.create_index("ix_contacts_user_id_email", "contacts", ["user_id", "email"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contacts_user_id_email", table_name="contacts")
+    op.drop_index("ix_contacts_user_id_last_name_first_name", table_name="contacts")
+    op.drop_index("ix_contacts_user_id_id", table_name="contacts")
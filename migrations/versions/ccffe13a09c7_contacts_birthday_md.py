@@ -0,0 +1,34 @@
+"""contacts birthday_md
+
+Revision ID: ccffe13a09c7
+Revises: e7a5f7383e11
+Create Date: 2026-10-18 11:05:47.218390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ccffe13a09c7'
+down_revision: Union[str, None] = 'e7a5f7383e11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("contacts", sa.Column("birthday_md", sa.SmallInteger(), nullable=True))
+    op.execute(
+        "UPDATE contacts SET birthday_md = "
+        "EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday)"
+    )
+    op.create_index(
+        "ix_contacts_user_id_birthday_md", "contacts", ["user_id", "birthday_md"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contacts_user_id_birthday_md", table_name="contacts")
+    op.drop_column("contacts", "birthday_md")
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
-import jsonpickle
-import redis
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from src.schemas import UserCreate, Token, User, RequestEmail
 from src.services.auth import create_access_token, Hash, get_email_from_token
 from src.services.users import UserService
 from src.database.db import get_db
-from src.services.email import send_email
+from src.database.redis_client import get_redis
+from src.conf.config import settings
+from src.services.user_cache import CachedUser, encode_user
+from src.services.email import queue_email
+from src.services.resources import get_hasher
+from src.services.rate_limit import rate_limit
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -15,18 +19,18 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate, 
-    background_tasks: BackgroundTasks,
     request: Request,
     db: Session = Depends(get_db),
+    hasher: Hash = Depends(get_hasher),
     ):
     """
     Register a new user.
 
     Args:
         user_data (UserCreate): User data to register.
-        background_tasks (BackgroundTasks): Background tasks to be executed.
         request (Request): Request object.
         db (Session, optional): Database session. Defaults to Depends(get_db).
+        hasher (Hash, optional): Shared password hasher. Defaults to Depends(get_hasher).
 
     Returns:
         User: The newly registered user.
@@ -46,17 +50,24 @@ async def register_user(
             status_code=status.HTTP_409_CONFLICT,
             detail="Користувач з таким іменем вже існує",
         )
-    user_data.password = Hash().get_password_hash(user_data.password)
-    new_user = await user_service.create_user(user_data)
-    background_tasks.add_task(
-    send_email, new_user.email, new_user.username, request.base_url, "verify_email"
+    user_data.password = await hasher.get_password_hash_async(user_data.password)
+    # The verification email is committed together with the user.
+    await queue_email(
+        db, user_data.email, user_data.username, request.base_url, "verify_email",
+        commit=False,
     )
+    new_user = await user_service.create_user(user_data)
 
     return new_user
 
-@router.post("/login", response_model=Token)
+@router.post(
+    "/login", response_model=Token, dependencies=[Depends(rate_limit("auth_login"))]
+)
 async def login_user(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(get_db),
+    r: Redis = Depends(get_redis),
+    hasher: Hash = Depends(get_hasher),
 ):
     """
     Login a user.
@@ -64,14 +75,17 @@ async def login_user(
     Args:
         form_data (OAuth2PasswordRequestForm, optional): Form data for login. Defaults to Depends().
         db (Session, optional): Database session. Defaults to Depends(get_db).
+        r (Redis, optional): Shared Redis client. Defaults to Depends(get_redis).
+        hasher (Hash, optional): Shared password hasher. Defaults to Depends(get_hasher).
 
     Returns:
         Token: The access token for the logged-in user.
     """
-    r = redis.Redis(host='localhost', port=6379, db=0)
     user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    if not user or not await hasher.verify_password_async(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неправильний логін або пароль",
@@ -83,10 +97,13 @@ async def login_user(
             detail="Електронна адреса не підтверджена",
         )
 
-    r.set(str(user.username), jsonpickle.encode(user))
-    r.expire(str(user.username), 3600)
+    await r.set(
+        str(user.username),
+        encode_user(CachedUser.from_user(user)),
+        ex=settings.USER_CACHE_TTL_SECONDS,
+    )
 
-    access_token = await create_access_token(data={"sub": user.username})
+    access_token = await create_access_token(data={"sub": user.username}, user=user)
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/confirmed_email/{token}")
@@ -116,7 +133,6 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
 @router.post("/request_email")
 async def request_email(
     body: RequestEmail,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -125,7 +141,6 @@ async def request_email(
 
     Args:
         body (RequestEmail): Email request data.
-        background_tasks (BackgroundTasks): Background tasks to be executed.
         request (Request): Request object.
         db (Session, optional): Database session. Defaults to Depends(get_db).
 
@@ -138,8 +153,8 @@ async def request_email(
     if user.confirmed:
         return {"message": "Ваша електронна пошта вже підтверджена"}
     if user:
-        background_tasks.add_task(
-            send_email, user.email, user.username, request.base_url, "verify_email"
+        await queue_email(
+            db, user.email, user.username, request.base_url, "verify_email"
         )
     return {"message": "Перевірте свою електронну пошту для підтвердження"}
 
@@ -147,7 +162,6 @@ async def request_email(
 @router.post("/request_password_reset")
 async def request_password_reset(
     body: RequestEmail,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -156,7 +170,6 @@ async def request_password_reset(
 
     Args:
         body (RequestEmail): Email request data.
-        background_tasks (BackgroundTasks): Background tasks to be executed.
         request (Request): Request object.
         db (Session, optional): Database session. Defaults to Depends(get_db).
 
@@ -171,8 +184,8 @@ async def request_password_reset(
             status_code=status.HTTP_404_NOT_FOUND, detail="Користувач не знайдений"
         )
 
-    background_tasks.add_task(
-        send_email, user.email, user.username, request.base_url, "reset_password"
+    await queue_email(
+        db, user.email, user.username, request.base_url, "reset_password"
     )
 
     return {"message": "Лист для скидання пароля надіслано на вашу електронну адресу"}
@@ -183,6 +196,7 @@ async def reset_password_confirm(
     token: str,
     new_password: str,
     db: Session = Depends(get_db),
+    hasher: Hash = Depends(get_hasher),
 ):
     """
     Confirm password reset.
@@ -191,6 +205,7 @@ async def reset_password_confirm(
         token (str): Reset token.
         new_password (str): New password.
         db (Session, optional): Database session. Defaults to Depends(get_db).
+        hasher (Hash, optional): Shared password hasher. Defaults to Depends(get_hasher).
 
     Returns:
         dict: Message confirming password reset.
@@ -211,7 +226,7 @@ async def reset_password_confirm(
             status_code=status.HTTP_404_NOT_FOUND, detail="Користувач не знайдений"
         )
 
-    hashed_password = Hash().get_password_hash(new_password)
+    hashed_password = await hasher.get_password_hash_async(new_password)
     await user_service.update_password(email, hashed_password)
 
     return {"message": "Пароль успішно оновлено"}
@@ -1,62 +1,214 @@
+from datetime import date
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Depends, File, Header, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.db import get_db
-from src.schemas import ContactBase, ContactUpdate, ContactResponse
+from src.conf.config import settings
+from src.database.db import get_db, get_read_db, get_session_factory
+from src.schemas import (
+    ContactBase,
+    ContactUpdate,
+    ContactResponse,
+    ContactPage,
+    ContactImportReport,
+    ContactBatchRequest,
+    ContactBatchResponse,
+)
 from src.services.contacts import ContactService
-from src.database.models import User
-from src.services.auth import get_current_user
+from src.services.contact_import import ContactImporter, detect_import_format
+from src.services.contact_export import EXPORT_FORMATS, export_contacts
+from src.services.auth import Principal, get_current_principal
+from src.services.response_cache import ContactResponseCache, get_contacts_cache
+from src.services.etag import etag_matches, parse_version_etag, split_etags, version_etag
+from src.services.rate_limit import rate_limit, user_key
+
+router = APIRouter(
+    prefix="/contacts",
+    tags=["contacts"],
+    dependencies=[Depends(rate_limit("contacts", key=user_key))],
+)
+
+contact_list_adapter = TypeAdapter(List[ContactResponse])
 
-router = APIRouter(prefix="/contacts", tags=["contacts"])
+def _dump_contacts(contacts) -> bytes:
+    return contact_list_adapter.dump_json(
+        contact_list_adapter.validate_python(contacts, from_attributes=True)
+    )
 
 @router.get("/", response_model=List[ContactResponse])
 async def read_contacts(
-    skip: int = 0, limit: int = 100, query: str | None = None, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user),
+    request: Request,
+    skip: int = 0, limit: int = 100, query: str | None = None, db: AsyncSession = Depends(get_db), user: Principal = Depends(get_current_principal),
+    cache: ContactResponseCache = Depends(get_contacts_cache),
 ):
     """
     Get a list of contacts based on skip, limit, and query parameters.
 
+    The serialized response is cached per user until the user's contacts
+    change and carries an ETag; a matching ``If-None-Match`` gets 304.
+    Cache misses read from the primary, so a lagging replica never fills
+    the cache shared by all of the user's clients.
+
     Parameters:
+    - request (Request): FastAPI Request object.
     - skip (int): Number of items to skip.
     - limit (int): Maximum number of items to return.
     - query (str, optional): Query string to filter contacts.
     - db (AsyncSession): AsyncSession dependency.
-    - user (User): User dependency.
+    - user (Principal): Identity of the caller.
+    - cache (ContactResponseCache): Per-user response cache.
 
     Returns:
     - List[ContactResponse]: List of contacts.
     """
+    async def produce():
+        contact_service = ContactService(db)
+        return _dump_contacts(await contact_service.get_contacts(skip, limit, query, user=user))
+
+    return await cache.respond(request, user.id, "list", (skip, limit, query), produce)
+
+@router.get("/page", response_model=ContactPage)
+async def read_contacts_page(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    sort: Literal["id", "last_name"] = "id",
+    query: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
+    user: Principal = Depends(get_current_principal),
+):
+    """
+    Get a page of contacts using keyset (cursor) pagination.
+
+    Unlike ``skip``/``limit`` this does not scan the skipped rows, so deep
+    pages cost the same as the first one.
+
+    Parameters:
+    - limit (int): Maximum number of items to return.
+    - cursor (str, optional): ``next_cursor`` of the previous page.
+    - sort (str): Ordering, ``id`` or ``last_name`` (then first name and id).
+    - query (str, optional): Query string to filter contacts.
+    - db (AsyncSession): AsyncSession dependency.
+    - user (Principal): Identity of the caller.
+
+    Returns:
+    - ContactPage: Contacts of the page and the cursor of the next one.
+    """
     contact_service = ContactService(db)
-    contacts = await contact_service.get_contacts(skip, limit, query, user=user)
-    return contacts
+    try:
+        contacts, next_cursor = await contact_service.get_contacts_page(
+            limit, cursor, sort, query, user
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    return {"items": contacts, "next_cursor": next_cursor}
+
+@router.get("/search", response_model=List[ContactResponse])
+async def search_contacts(
+    q: str = Query(min_length=1, max_length=150),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    user: Principal = Depends(get_current_principal),
+):
+    """
+    Search contacts by first name, last name or email, best matches first.
+
+    Parameters:
+    - q (str): Search text.
+    - limit (int): Maximum number of items to return.
+    - db (AsyncSession): AsyncSession dependency.
+    - user (Principal): Identity of the caller.
+
+    Returns:
+    - List[ContactResponse]: Matching contacts ordered by relevance.
+    """
+    contact_service = ContactService(db)
+    return await contact_service.search_contacts(q, limit, user)
 
 @router.get("/birthdays", response_model=List[ContactResponse])
-async def get_upcoming_birthdays(db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user),):
+async def get_upcoming_birthdays(
+    request: Request,
+    days: int = Query(settings.BIRTHDAY_WINDOW_DAYS, ge=1, le=364),
+    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
+    cache: ContactResponseCache = Depends(get_contacts_cache),
+):
     """
     Get a list of upcoming birthdays for contacts.
 
+    Cached per user and day like the contact list, with ETag support, and
+    likewise filled from the primary.
+
     Parameters:
+    - request (Request): FastAPI Request object.
+    - days (int): Look-ahead window in days, including today.
     - db (AsyncSession): AsyncSession dependency.
-    - user (User): User dependency.
+    - user (Principal): Identity of the caller.
+    - cache (ContactResponseCache): Per-user response cache.
 
     Returns:
-    - List[ContactResponse]: List of contacts with upcoming birthdays.
+    - List[ContactResponse]: Contacts with upcoming birthdays, soonest first.
     """
-    contact_service = ContactService(db)
-    contacts = await contact_service.get_upcoming_birthdays(user)
-    return contacts
+    async def produce():
+        contact_service = ContactService(db)
+        return _dump_contacts(await contact_service.get_upcoming_birthdays(user, days))
+
+    params = (days, date.today().isoformat())
+    return await cache.respond(request, user.id, "birthdays", params, produce)
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_contacts_file(
+    format: Literal["csv", "ndjson", "vcf"] = "csv",
+    session_factory=Depends(get_session_factory),
+    user: Principal = Depends(get_current_principal),
+):
+    """
+    Download all contacts as CSV, NDJSON or vCard.
+
+    The body is streamed from a server-side cursor, so memory use stays
+    constant however many contacts there are.
+
+    Parameters:
+    - format (str): ``csv``, ``ndjson`` or ``vcf``.
+    - session_factory: Factory of the database session used by the stream.
+    - user (Principal): Identity of the caller.
+
+    Returns:
+    - StreamingResponse: Exported contacts as an attachment.
+    """
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        export_contacts(session_factory, user, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="contacts.{extension}"'},
+    )
 
 @router.get("/{contact_id}", response_model=ContactResponse)
-async def read_contact(contact_id: int, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user),):
+async def read_contact(
+    contact_id: int,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    user: Principal = Depends(get_current_principal),
+):
     """
     Get a specific contact by ID.
 
+    The response carries a weak ETag built from the contact id and
+    ``updated_at``; a matching ``If-None-Match`` gets 304 without a body.
+
     Parameters:
     - contact_id (int): ID of the contact to retrieve.
+    - response (Response): Response used to set the ETag header.
+    - if_none_match (str, optional): ETags the client already has.
     - db (AsyncSession): AsyncSession dependency.
-    - user (User): User dependency.
+    - user (Principal): Identity of the caller.
 
     Returns:
     - ContactResponse: Details of the requested contact.
@@ -67,57 +219,176 @@ async def read_contact(contact_id: int, db: AsyncSession = Depends(get_db), user
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
         )
+    etag = version_etag(contact.id, contact.updated_at)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return contact
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
-async def create_contact(body: ContactBase, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user),):
+async def create_contact(body: ContactBase, db: AsyncSession = Depends(get_db), user: Principal = Depends(get_current_principal),
+    cache: ContactResponseCache = Depends(get_contacts_cache),
+):
     """
     Create a new contact.
 
     Parameters:
     - body (ContactBase): Contact data to create.
     - db (AsyncSession): AsyncSession dependency.
-    - user (User): User dependency.
+    - user (Principal): Identity of the caller.
+    - cache (ContactResponseCache): Response cache invalidated by the change.
 
     Returns:
     - ContactResponse: Details of the created contact.
     """
     contact_service = ContactService(db)
-    return await contact_service.create_contact(body, user)
+    contact = await contact_service.create_contact(body, user)
+    await cache.invalidate(user.id)
+    return contact
+
+@router.post("/import", response_model=ContactImportReport)
+async def import_contacts(
+    file: UploadFile = File(),
+    format: Literal["csv", "ndjson"] | None = None,
+    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
+    cache: ContactResponseCache = Depends(get_contacts_cache),
+):
+    """
+    Import contacts from a CSV or NDJSON file.
+
+    The file is streamed in chunks and each chunk of valid rows is inserted
+    with one statement. Invalid rows are skipped and reported by their line
+    number in the file.
+
+    Parameters:
+    - file (UploadFile): CSV with a header row or NDJSON with one contact per line.
+    - format (str, optional): ``csv`` or ``ndjson``; guessed from the file name or content type if omitted.
+    - db (AsyncSession): AsyncSession dependency.
+    - user (Principal): Identity of the caller.
+    - cache (ContactResponseCache): Response cache invalidated by the change.
+
+    Returns:
+    - ContactImportReport: Number of created and failed rows and the per-row errors.
+    """
+    fmt = format or detect_import_format(file.filename, file.content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown file format, pass format=csv or format=ndjson",
+        )
+    try:
+        report = await ContactImporter(db).import_file(file.file, fmt, user)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    finally:
+        await cache.invalidate(user.id)
+    return report
+
+@router.post("/batch", response_model=ContactBatchResponse)
+async def batch_contacts(
+    body: ContactBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
+    cache: ContactResponseCache = Depends(get_contacts_cache),
+):
+    """
+    Create, update and delete contacts in one transaction.
+
+    Creates run as one multi-row insert, updates with the same set of fields
+    as one executemany ``UPDATE`` and deletes as one ``DELETE ... IN``.
+    Operations on contacts that do not exist or belong to another user are
+    reported as ``not_found``; a database error rolls back the whole batch.
+
+    Parameters:
+    - body (ContactBatchRequest): Operations to run; a contact id may appear only once.
+    - db (AsyncSession): AsyncSession dependency.
+    - user (Principal): Identity of the caller.
+    - cache (ContactResponseCache): Response cache invalidated by the change.
+
+    Returns:
+    - ContactBatchResponse: Result of every operation, in request order.
+    """
+    contact_service = ContactService(db)
+    results = await contact_service.apply_batch(body, user)
+    await cache.invalidate(user.id)
+    return {"results": results}
 
 @router.put("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
-    body: ContactUpdate, contact_id: int, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user),
+    body: ContactUpdate, contact_id: int, response: Response,
+    if_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db), user: Principal = Depends(get_current_principal),
+    cache: ContactResponseCache = Depends(get_contacts_cache),
 ):
     """
     Update an existing contact.
 
+    With ``If-Match`` the update is applied only if the contact still has
+    one of the listed ETags, checked in the same UPDATE statement; otherwise
+    412 is returned and nothing changes. ``If-Match: *`` on a missing
+    contact also gets 412.
+
     Parameters:
     - body (ContactUpdate): Contact data to update.
     - contact_id (int): ID of the contact to update.
+    - response (Response): Response used to set the new ETag header.
+    - if_match (str, optional): ETags the client last saw, or ``*``.
     - db (AsyncSession): AsyncSession dependency.
-    - user (User): User dependency.
+    - user (Principal): Identity of the caller.
+    - cache (ContactResponseCache): Response cache invalidated by the change.
 
     Returns:
     - ContactResponse: Details of the updated contact.
     """
+    tags = split_etags(if_match)
+    expected_versions = None
+    if tags and "*" not in tags:
+        expected_versions = [
+            version[1]
+            for version in map(parse_version_etag, tags)
+            if version is not None and version[0] == contact_id
+        ]
+        if not expected_versions:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Contact has been modified",
+            )
+
     contact_service = ContactService(db)
-    contact = await contact_service.update_contact(contact_id, body, user)
+    contact = await contact_service.update_contact(
+        contact_id, body, user, expected_versions
+    )
     if contact is None:
+        if "*" in tags:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Contact does not exist",
+            )
+        if expected_versions is not None and await contact_service.get_contact(contact_id, user):
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Contact has been modified",
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
         )
+    await cache.invalidate(user.id)
+    response.headers["ETag"] = version_etag(contact.id, contact.updated_at)
     return contact
 
 @router.delete("/{contact_id}", response_model=ContactResponse)
-async def remove_contact(contact_id: int, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user),):
+async def remove_contact(contact_id: int, db: AsyncSession = Depends(get_db), user: Principal = Depends(get_current_principal),
+    cache: ContactResponseCache = Depends(get_contacts_cache),
+):
     """
     Remove a contact by ID.
 
     Parameters:
     - contact_id (int): ID of the contact to remove.
     - db (AsyncSession): AsyncSession dependency.
-    - user (User): User dependency.
+    - user (Principal): Identity of the caller.
+    - cache (ContactResponseCache): Response cache invalidated by the change.
 
     Returns:
     - ContactResponse: Details of the removed contact.
@@ -128,4 +399,5 @@ async def remove_contact(contact_id: int, db: AsyncSession = Depends(get_db), us
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
         )
+    await cache.invalidate(user.id)
     return contact
@@ -1,33 +1,48 @@
-from fastapi import APIRouter, Depends, File, Request, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Request, Response, UploadFile, status
 from src.database.db import get_db
-from src.services.upload_file import UploadFileService
+from src.services.avatars import AvatarError, AvatarPipeline, AvatarTooLarge
+from src.services.resources import get_avatar_pipeline
 from src.services.users import UserService
 from src.schemas import User
 from src.services.auth import get_current_admin_user, get_current_user
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from src.conf.config import settings
+from src.services.etag import etag_matches, make_etag
+from src.services.rate_limit import rate_limit, user_key
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 router = APIRouter(prefix="/users", tags=["users"])
-limiter = Limiter(key_func=get_remote_address)
 
 @router.get(
-    "/me", response_model=User, description="No more than 10 requests per minute"
+    "/me",
+    response_model=User,
+    description="No more than 10 requests per minute",
+    dependencies=[Depends(rate_limit("users_me", key=user_key))],
 )
-@limiter.limit("10/minute")
-async def me(request: Request, user: User = Depends(get_current_user)):
+async def me(
+    request: Request,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    user: User = Depends(get_current_user),
+):
     """
     Get the current user details.
 
+    The response carries a weak ETag of the returned fields; a matching
+    ``If-None-Match`` gets 304 without a body.
+
     Parameters:
     - request (Request): FastAPI Request object.
+    - response (Response): Response used to set the ETag header.
+    - if_none_match (str, optional): ETags the client already has.
     - user (User): Current user details.
 
     Returns:
     - User: Details of the current user.
     """
+    etag = make_etag(user.id, user.username, user.email, user.avatar, user.role, user.confirmed)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return user
 
 @router.patch("/avatar", response_model=User, description="For admins only")
@@ -35,23 +50,37 @@ async def update_avatar_user(
     file: UploadFile = File(),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    avatars: AvatarPipeline = Depends(get_avatar_pipeline),
 ):
     """
     Update the user's avatar.
 
+    The image is cropped and resized to a square avatar off the event loop
+    and saved to the configured avatar storage.
+
     Parameters:
     - file (UploadFile): File for the avatar.
     - user (User): Current user details.
     - db (AsyncSession): AsyncSession dependency.
+    - avatars (AvatarPipeline): Shared avatar pipeline.
 
     Returns:
     - User: Updated user details with avatar URL.
     """
     
-    if get_current_admin_user(user):
-        avatar_url = UploadFileService(
-            settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
-        ).upload_file(file, user.username)
+    get_current_admin_user(user)
+    try:
+        avatar_url = await avatars.update(file, user.username)
+    except AvatarTooLarge:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Файл завеликий",
+        )
+    except AvatarError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Некоректне зображення",
+        )
 
     user_service = UserService(db)
     user = await user_service.update_avatar_url(user.email, avatar_url)
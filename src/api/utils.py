@@ -2,7 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from src.database.db import get_db
+from src.database.db import get_db, sessionmanager
+from src.services.local_cache import user_local_cache
+from src.services.auth import hash_executor
+from src.services.avatar_storage import gravatar
+from src.services.token_cache import verified_token_cache
 
 router = APIRouter(tags=["utils"])
 
@@ -33,3 +37,21 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error connecting to the database",
         )
+
+
+@router.get("/metrics")
+async def metrics():
+    """
+    Report in-process cache and pool counters for this worker.
+
+    Returns:
+    - dict: Local user, token and Gravatar URL cache counters, password
+      hashing pool usage and database pool checkout wait time and saturation.
+    """
+    return {
+        "database_pool": sessionmanager.pool_stats(),
+        "user_cache": user_local_cache.stats(),
+        "token_cache": verified_token_cache.stats(),
+        "gravatar_cache": gravatar.cache.stats(),
+        "password_hashing": hash_executor.stats(),
+    }
@@ -3,9 +3,25 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DB_URL: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_APPLICATION_NAME: str = "contacts-api"
+    DB_STATEMENT_TIMEOUT_MS: int | None = None
+    DB_REPLICA_URLS: list[str] = []
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
+    JWT_EMBED_PRINCIPAL: bool = True
+    TOKEN_CACHE_SIZE: int = 4096
+
+    HASH_EXECUTOR: str = "thread"
+    HASH_MAX_WORKERS: int = 4
 
     MAIL_USERNAME: EmailStr = "example@meta.ua"
     MAIL_PASSWORD: str = "secretPassword"
@@ -17,11 +33,55 @@ class Settings(BaseSettings):
     MAIL_SSL_TLS: bool = True
     USE_CREDENTIALS: bool = True
     VALIDATE_CERTS: bool = True
+    MAIL_BATCH_SIZE: int = 50
+    MAIL_MAX_ATTEMPTS: int = 5
+    MAIL_RETRY_BASE_SECONDS: float = 30.0
+    MAIL_RETRY_MAX_SECONDS: float = 3600.0
+    MAIL_POLL_INTERVAL_SECONDS: float = 2.0
+
+    BIRTHDAY_WINDOW_DAYS: int = 7
+    CONTACT_IMPORT_CHUNK_SIZE: int = 1000
+    CONTACT_IMPORT_MAX_ERRORS: int = 100
+    CONTACT_EXPORT_BATCH_SIZE: int = 500
+    CONTACTS_CACHE_TTL_SECONDS: int = 60
 
     CLD_NAME: str
     CLD_API_KEY: int = 326488457974591
     CLD_API_SECRET: str = "secret"
 
+    AVATAR_STORAGE: str = "cloudinary"
+    AVATAR_LOCAL_DIR: str = "static/avatars"
+    AVATAR_LOCAL_URL: str = "/static/avatars"
+    AVATAR_MAX_BYTES: int = 5 * 1024 * 1024
+    AVATAR_MAX_PIXELS: int = 40_000_000
+    AVATAR_CHUNK_SIZE: int = 64 * 1024
+    AVATAR_SIZE: int = 250
+    GRAVATAR_CACHE_SIZE: int = 4096
+
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: str | None = None
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+
+    USER_CACHE_TTL_SECONDS: int = 3600
+    USER_LOCAL_CACHE_SIZE: int = 1024
+    USER_LOCAL_CACHE_TTL_SECONDS: float = 300.0
+    USER_CACHE_BUS: str = "redis"
+    USER_CACHE_BUS_CHANNEL: str = "user-cache-invalidation"
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_ALGORITHM: str = "sliding_window"
+    RATE_LIMIT_STORAGE: str = "redis"
+    RATE_LIMIT_PREFIX: str = "ratelimit"
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = 10000
+    RATE_LIMITS: dict[str, str] = {
+        "auth_login": "5/minute",
+        "users_me": "10/minute",
+        "contacts": "100/minute",
+    }
+
     model_config = ConfigDict(
         extra="ignore", env_file=".env", env_file_encoding="utf-8", case_sensitive=True
     )
@@ -1,26 +1,135 @@
 import contextlib
+import hashlib
+import itertools
+import logging
+import math
+from typing import Callable
+
 from src.conf.config import settings
+from src.database.pool import engine_options
+from src.database.redis_client import redis_manager
 
+from fastapi import Request
+from redis.asyncio import Redis
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from a replica until it writes.
+
+    The engines come from ``info``: ``primary`` and ``replica``. Flushes and
+    INSERT/UPDATE/DELETE statements go to the primary and pin the session
+    there, so later reads in the same session see its own writes.
+    """
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+            self.info["pinned"] = True
+        if self.info.get("pinned"):
+            return self.info["primary"].sync_engine
+        return self.info["replica"].sync_engine
+
+
+logger = logging.getLogger(__name__)
+
+
+class StickyMarkers:
+    """
+    Read-your-writes markers shared by every worker through Redis.
+
+    A client that wrote gets a key that expires after ``ttl`` seconds; while
+    it exists, its reads go to the primary whichever worker serves them.
+    If Redis is unavailable, reads go to the primary.
+
+    Methods:
+    - mark(key): Record that ``key`` just wrote.
+    - is_marked(key) -> bool: Whether ``key`` wrote within ``ttl``.
+    """
+    def __init__(self, redis: Callable[[], Redis], ttl: float, prefix: str = "db:sticky"):
+        self.redis = redis
+        self.ttl = max(1, math.ceil(ttl))
+        self.prefix = prefix
+
+    async def mark(self, key: str) -> None:
+        try:
+            await self.redis().set(f"{self.prefix}:{key}", b"1", ex=self.ttl)
+        except Exception:
+            logger.warning("Failed to store the read-your-writes marker", exc_info=True)
+
+    async def is_marked(self, key: str) -> bool:
+        try:
+            return await self.redis().get(f"{self.prefix}:{key}") is not None
+        except Exception:
+            logger.warning("Read-your-writes marker unavailable, reading from primary", exc_info=True)
+            return True
 
 
 class DatabaseSessionManager:
-    def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+    """
+    Owns the primary engine and any read replica engines.
+
+    Read-your-writes markers live in ``sticky_markers`` (Redis by default),
+    so a read after a write sticks to the primary on any worker.
+
+    Methods:
+    - session(sticky_key=None): Session bound to the primary.
+    - read_session(sticky_key=None): Session that reads from a replica (round robin)
+      unless ``sticky_key`` wrote recently or the session itself writes.
+    - close(): Dispose every engine.
+    - pool_stats() -> dict: Connection pool metrics of the primary and replicas.
+    """
+    def __init__(
+        self,
+        url: str,
+        replica_urls=(),
+        sticky_seconds: float = 0.0,
+        sticky_markers: StickyMarkers | None = None,
+        **engine_kwargs,
+    ):
+        self._engine: AsyncEngine | None = create_async_engine(url, **engine_kwargs)
+        self._replicas: list[AsyncEngine] = [
+            create_async_engine(replica_url, **engine_kwargs) for replica_url in replica_urls
+        ]
+        self._replica_cycle = itertools.cycle(self._replicas or [self._engine])
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+            bind=self._engine,
+            sync_session_class=RoutingSession,
         )
+        if sticky_markers is None and sticky_seconds > 0:
+            sticky_markers = StickyMarkers(lambda: redis_manager.client, sticky_seconds)
+        self._sticky = sticky_markers
+
+    @contextlib.asynccontextmanager
+    async def session(self, sticky_key: str | None = None):
+        async with self._routed_session(self._engine, sticky_key) as session:
+            yield session
 
     @contextlib.asynccontextmanager
-    async def session(self):
+    async def read_session(self, sticky_key: str | None = None):
+        replica = self._engine
+        if self._replicas and not await self._is_sticky(sticky_key):
+            replica = next(self._replica_cycle)
+        async with self._routed_session(replica, sticky_key) as session:
+            yield session
+
+    @contextlib.asynccontextmanager
+    async def _routed_session(self, replica: AsyncEngine, sticky_key: str | None):
         if self._session_maker is None:
             raise Exception("Database session is not initialized")
-        session = self._session_maker()
+        session = self._session_maker(
+            info={"primary": self._engine, "replica": replica}
+        )
         try:
             yield session
         except SQLAlchemyError as e:
@@ -28,9 +137,72 @@ class DatabaseSessionManager:
             raise
         finally:
             await session.close()
+            if self._replicas and self._sticky and sticky_key and session.info.get("wrote"):
+                await self._sticky.mark(sticky_key)
+
+    async def _is_sticky(self, sticky_key: str | None) -> bool:
+        return bool(self._sticky and sticky_key and await self._sticky.is_marked(sticky_key))
+
+    async def close(self):
+        for engine in [self._engine, *self._replicas]:
+            if engine is not None:
+                await engine.dispose()
+
+    def pool_stats(self) -> dict:
+        stats = self._engine_pool_stats(self._engine)
+        if self._replicas:
+            stats["replicas"] = [self._engine_pool_stats(engine) for engine in self._replicas]
+        return stats
+
+    @staticmethod
+    def _engine_pool_stats(engine: AsyncEngine) -> dict:
+        pool = engine.pool
+        if hasattr(pool, "status_dict"):
+            return pool.status_dict()
+        return {"status": pool.status()}
 
-sessionmanager = DatabaseSessionManager(settings.DB_URL)
+sessionmanager = DatabaseSessionManager(
+    settings.DB_URL,
+    replica_urls=settings.DB_REPLICA_URLS,
+    sticky_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+    **engine_options(settings.DB_URL, settings),
+)
+
+def client_key(request: Request) -> str | None:
+    """
+    Identify the client for read-your-writes stickiness.
+
+    Args:
+    - request: Incoming request.
 
-async def get_db():
-    async with sessionmanager.session() as session:
+    Returns:
+    - str | None: Digest of the Authorization header or the client address.
+    """
+    credentials = request.headers.get("authorization")
+    if credentials:
+        return hashlib.sha256(credentials.encode()).hexdigest()
+    return request.client.host if request.client else None
+
+async def get_db(request: Request):
+    async with sessionmanager.session(client_key(request)) as session:
         yield session
+
+async def get_read_db(request: Request):
+    """
+    Dependency for read-mostly endpoints.
+
+    Reads go to a replica, except for clients that wrote within
+    ``DB_READ_YOUR_WRITES_SECONDS``; a write in the session moves it to the
+    primary for the rest of the request.
+    """
+    async with sessionmanager.read_session(client_key(request)) as session:
+        yield session
+
+async def get_session_factory():
+    """
+    Dependency for responses that keep reading after the handler returns.
+
+    Streaming bodies open their own session with the returned factory, so
+    the session lives exactly as long as the stream does.
+    """
+    return sessionmanager.session
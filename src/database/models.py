@@ -1,8 +1,8 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Integer, String, func, Column, ForeignKey, Boolean, Enum as SqlEnum
-from sqlalchemy.orm import mapped_column, Mapped, DeclarativeBase, relationship
+from sqlalchemy import Integer, SmallInteger, String, func, Column, ForeignKey, Boolean, Index, Enum as SqlEnum
+from sqlalchemy.orm import mapped_column, Mapped, DeclarativeBase, relationship, validates
 from sqlalchemy.sql.sqltypes import DateTime, Date
 from datetime import datetime, date
 
@@ -28,6 +28,23 @@ class UserRole(str, Enum):
     ADMIN = "admin"
 
 
+def birthday_key(birthday: date | str | None) -> int | None:
+    """
+    Year-independent sort key of a birthday, ``month * 100 + day`` (MMDD).
+
+    Args:
+    - birthday: Birthday as a date or an ISO date string.
+
+    Returns:
+    - int | None: Key such as 1231 for December 31, or None without a birthday.
+    """
+    if birthday is None:
+        return None
+    if isinstance(birthday, str):
+        birthday = date.fromisoformat(birthday)
+    return birthday.month * 100 + birthday.day
+
+
 class Contact(Base):
     """
     Contact model representing contact information.
@@ -39,6 +56,7 @@ class Contact(Base):
     - email (str): Email address of the contact.
     - phone (str): Phone number of the contact.
     - birthday (date): Birthday of the contact.
+    - birthday_md (int): Month and day of the birthday as MMDD, kept in sync with birthday.
     - additional_info (str): Additional information about the contact.
     - created_at (datetime): Creation timestamp of the contact.
     - updated_at (datetime): Last updated timestamp of the contact.
@@ -52,6 +70,7 @@ class Contact(Base):
     email: Mapped[str] = mapped_column(String(150), nullable=False)
     phone: Mapped[str] = mapped_column(String(50), nullable=False)
     birthday: Mapped[date] = mapped_column(Date)
+    birthday_md: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
     additional_info: Mapped[str] = mapped_column(String(250), nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -64,6 +83,27 @@ class Contact(Base):
     user_id = Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), default=None)
     user = relationship("User", backref="notes")
 
+    __table_args__ = (
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        Index("ix_contacts_user_id_last_name_first_name", "user_id", "last_name", "first_name"),
+        Index("ix_contacts_user_id_email", "user_id", "email"),
+        Index("ix_contacts_user_id_birthday_md", "user_id", "birthday_md"),
+        *(
+            Index(
+                f"ix_contacts_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in ("first_name", "last_name", "email")
+        ),
+    )
+
+    @validates("birthday")
+    def _sync_birthday_md(self, key, value):
+        self.birthday_md = birthday_key(value)
+        return value
+
 
 class User(Base):
     """
@@ -88,3 +128,54 @@ class User(Base):
     avatar = Column(String(255), nullable=True)
     confirmed = Column(Boolean, default=False)
     role = Column(SqlEnum(UserRole), default=UserRole.USER, nullable=False)
+
+
+class EmailStatus(str, Enum):
+    """
+    Enum class for outbox email states.
+
+    Attributes:
+    - PENDING: Waiting for (another) delivery attempt.
+    - SENT: Delivered to the SMTP server.
+    - FAILED: Gave up after the maximum number of attempts.
+    """
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class EmailOutbox(Base):
+    """
+    Transactional email waiting to be delivered by the mail worker.
+
+    Attributes:
+    - id (int): Message ID.
+    - recipient (str): Email address of the recipient.
+    - username (str): Username used in the template.
+    - host (str): Base URL used for links in the template.
+    - email_type (str): Template name without extension, e.g. ``verify_email``.
+    - status (EmailStatus): Delivery state.
+    - attempts (int): Number of failed delivery attempts so far.
+    - next_attempt_at (datetime): Earliest time of the next attempt (UTC).
+    - last_error (str): Error of the last failed attempt.
+    - created_at (datetime): Time the message was queued (UTC).
+    - sent_at (datetime): Time the message was delivered (UTC).
+    """
+    __tablename__ = "email_outbox"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    username: Mapped[str] = mapped_column(String(255), nullable=False)
+    host: Mapped[str] = mapped_column(String(255), nullable=False)
+    email_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[EmailStatus] = mapped_column(
+        SqlEnum(EmailStatus), default=EmailStatus.PENDING, nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
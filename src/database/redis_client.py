@@ -0,0 +1,69 @@
+import redis.asyncio as aioredis
+
+from src.conf.config import settings
+
+
+class RedisSessionManager:
+    """
+    Owns the application-wide asyncio Redis connection pool.
+
+    The pool is created once in the FastAPI lifespan hook and shared by every
+    request, so handlers never open their own TCP connections to Redis.
+
+    Methods:
+    - connect(): Create the connection pool and the client bound to it.
+    - close(): Close the client and disconnect every pooled connection.
+    - client -> Redis: The shared client; raises if the pool is not initialized.
+    """
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db: int = 0,
+        password: str | None = None,
+        max_connections: int = 50,
+        socket_timeout: float | None = None,
+    ):
+        self._pool_options = dict(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+        )
+        self._pool: aioredis.ConnectionPool | None = None
+        self._client: aioredis.Redis | None = None
+
+    async def connect(self):
+        if self._client is not None:
+            return
+        self._pool = aioredis.ConnectionPool(**self._pool_options)
+        self._client = aioredis.Redis(connection_pool=self._pool)
+
+    async def close(self):
+        if self._client is None:
+            return
+        await self._client.aclose()
+        await self._pool.disconnect()
+        self._client = None
+        self._pool = None
+
+    @property
+    def client(self) -> aioredis.Redis:
+        if self._client is None:
+            raise Exception("Redis client is not initialized")
+        return self._client
+
+redis_manager = RedisSessionManager(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    password=settings.REDIS_PASSWORD,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+)
+
+async def get_redis():
+    return redis_manager.client
@@ -1,11 +1,29 @@
-from typing import List
-from datetime import date, timedelta
+from typing import AsyncIterator, List, Sequence
+from datetime import date, datetime, timedelta
 
-from sqlalchemy import String, select, func
+from sqlalchemy import String, select, insert, update, delete, bindparam, func, tuple_, case, or_, literal, literal_column, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import Contact, User
-from src.schemas import ContactBase, ContactUpdate
+from src.database.models import Contact, User, birthday_key
+from src.repository.pagination import encode_cursor, decode_cursor
+from src.schemas import ContactBase, ContactUpdate, ContactBatchRequest
+
+CONTACT_SORT_KEYS = {
+    "id": (Contact.id,),
+    "last_name": (Contact.last_name, Contact.first_name, Contact.id),
+}
+
+EXPORT_COLUMNS = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone,
+    Contact.birthday,
+    Contact.additional_info,
+    Contact.created_at,
+    Contact.updated_at,
+)
 
 class ContactRepository:
     """
@@ -13,11 +31,17 @@ class ContactRepository:
 
     Methods:
     - get_contacts(skip: int, limit: int, query: str | None, user: User) -> List[Contact]: Get a list of contacts.
-    - get_upcoming_birthdays(user: User) -> List[Contact]: Get a list of contacts with upcoming birthdays.
+    - get_contacts_page(limit: int, cursor: str | None, sort: str, query: str | None, user: User) -> tuple[List[Contact], str | None]: Get a page of contacts after a keyset cursor.
+    - search_contacts(query: str, limit: int, user: User) -> List[Contact]: Search contacts ranked by relevance.
+    - get_upcoming_birthdays(user: User, days: int = 7) -> List[Contact]: Get contacts with birthdays in the next ``days`` days.
     - get_contact_by_id(contact_id: int, user: User) -> Contact | None: Get a contact by ID.
+    - stream_contacts(user: User, batch_size: int) -> AsyncIterator[List]: Stream all contacts of a user in batches of rows.
     - create_contact(body: ContactBase, user: User) -> Contact: Create a new contact.
+    - create_contacts(bodies: List[ContactBase], user: User) -> List[int]: Create many contacts with one multi-row insert.
+    - apply_batch(batch: ContactBatchRequest, user: User) -> List[dict]: Run mixed create/update/delete operations in one transaction.
     - remove_contact(contact_id: int, user: User) -> Contact | None: Remove a contact.
-    - update_contact(contact_id: int, body: ContactUpdate, user: User) -> Contact | None: Update a contact.
+    - update_contact(contact_id: int, body: ContactUpdate, user: User, expected_versions: Sequence[datetime] | None = None) -> Contact | None:
+      Update a contact, optionally only if it was last modified at one of ``expected_versions``.
     """
     def __init__(self, session: AsyncSession):
         self.db = session
@@ -25,59 +49,275 @@ class ContactRepository:
     async def get_contacts(self, skip: int, limit: int, query: str | None, user: User) -> List[Contact]:
         if query:
             stmt = (
-                select(Contact).filter_by(user=user)
+                select(Contact).filter_by(user_id=user.id)
                 .filter(
                     Contact.first_name.ilike(f"%{query}%")
                     | Contact.last_name.ilike(f"%{query}%")
                     | Contact.email.ilike(f"%{query}%")
                 )
+                .order_by(Contact.id)
                 .offset(skip)
                 .limit(limit)
             )
         else:
-            stmt = select(Contact).filter_by(user=user).offset(skip).limit(limit)
+            stmt = (
+                select(Contact)
+                .filter_by(user_id=user.id)
+                .order_by(Contact.id)
+                .offset(skip)
+                .limit(limit)
+            )
         contacts = await self.db.execute(stmt)
         return contacts.scalars().all()
     
-    async def get_upcoming_birthdays(self, user: User) -> List[Contact]:
-        today = date.today()
-        end_date = today + timedelta(days=7)
+    async def stream_contacts(self, user: User, batch_size: int) -> AsyncIterator[List]:
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .filter_by(user_id=user.id)
+            .order_by(Contact.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
 
-        query = select(Contact).filter_by(user=user).where(
-            func.to_char(Contact.birthday, "MM-DD").between(
-                today.strftime("%m-%d"), end_date.strftime("%m-%d")
+    async def get_contacts_page(
+        self, limit: int, cursor: str | None, sort: str, query: str | None, user: User
+    ) -> tuple[List[Contact], str | None]:
+        columns = CONTACT_SORT_KEYS[sort]
+        stmt = select(Contact).filter_by(user_id=user.id)
+        if query:
+            stmt = stmt.filter(
+                Contact.first_name.ilike(f"%{query}%")
+                | Contact.last_name.ilike(f"%{query}%")
+                | Contact.email.ilike(f"%{query}%")
+            )
+        if cursor:
+            values = decode_cursor(cursor, sort, tuple(c.type.python_type for c in columns))
+            stmt = stmt.where(tuple_(*columns) > tuple_(*values))
+        stmt = stmt.order_by(*columns).limit(limit + 1)
+
+        contacts = (await self.db.execute(stmt)).scalars().all()
+        if len(contacts) <= limit:
+            return contacts, None
+        contacts = contacts[:limit]
+        last = contacts[-1]
+        return contacts, encode_cursor(sort, [getattr(last, c.key) for c in columns])
+
+    async def search_contacts(self, query: str, limit: int, user: User) -> List[Contact]:
+        matches = or_(
+            Contact.first_name.icontains(query, autoescape=True),
+            Contact.last_name.icontains(query, autoescape=True),
+            Contact.email.icontains(query, autoescape=True),
+        )
+        if self._dialect_name() == "postgresql":
+            # Substring matches and trigram similarity (typos) are both served
+            # by the pg_trgm GIN indexes; rank by the best-matching column.
+            matches = or_(
+                matches,
+                Contact.first_name.op("%")(query),
+                Contact.last_name.op("%")(query),
+                Contact.email.op("%")(query),
+            )
+            rank = func.greatest(
+                func.similarity(Contact.first_name, query),
+                func.similarity(Contact.last_name, query),
+                func.similarity(Contact.email, query),
             )
+        else:
+            lowered = query.lower()
+            prefix = or_(
+                Contact.first_name.istartswith(query, autoescape=True),
+                Contact.last_name.istartswith(query, autoescape=True),
+                Contact.email.istartswith(query, autoescape=True),
+            )
+            rank = case(
+                (func.lower(Contact.first_name) == lowered, 3),
+                (func.lower(Contact.last_name) == lowered, 3),
+                (func.lower(Contact.email) == lowered, 3),
+                (prefix, 2),
+                else_=1,
+            )
+        stmt = (
+            select(Contact)
+            .filter_by(user_id=user.id)
+            .where(matches)
+            .order_by(rank.desc(), Contact.id)
+            .limit(limit)
         )
+        contacts = await self.db.execute(stmt)
+        return contacts.scalars().all()
+
+    def _updated_at_equals(self, value: datetime):
+        if self._dialect_name() == "sqlite":
+            # SQLite keeps timestamps as text and CURRENT_TIMESTAMP has no
+            # fraction, so compare the normalized values instead of strings.
+            return func.datetime(Contact.updated_at) == func.datetime(value)
+        return Contact.updated_at == value
+
+    def _dialect_name(self) -> str:
+        bind = getattr(self.db, "bind", None)
+        return bind.dialect.name if bind is not None else ""
+
+    async def get_upcoming_birthdays(
+        self, user: User, days: int = 7, today: date | None = None
+    ) -> List[Contact]:
+        today = today or date.today()
+        end_date = today + timedelta(days=min(days, 364))
+        start_key, end_key = birthday_key(today), birthday_key(end_date)
+
+        own = Contact.user_id == user.id
+        if end_date.year == today.year:
+            query = (
+                select(Contact)
+                .where(own, Contact.birthday_md.between(start_key, end_key))
+                .order_by(Contact.birthday_md)
+            )
+        else:
+            # A window that crosses New Year is two range scans on
+            # (user_id, birthday_md): [start, 12-31] this year, then [01-01, end].
+            this_year = select(Contact, literal(0).label("lap")).where(
+                own, Contact.birthday_md >= start_key
+            )
+            next_year = select(Contact, literal(1).label("lap")).where(
+                own, Contact.birthday_md <= end_key
+            )
+            query = select(Contact).from_statement(
+                union_all(this_year, next_year).order_by(
+                    literal_column("lap"), literal_column("birthday_md")
+                )
+            )
         contact = await self.db.execute(query)
         return contact.scalars().all()
 
     async def get_contact_by_id(self, contact_id: int, user: User) -> Contact | None:
-        stmt = select(Contact).filter_by(user=user).where(Contact.id == contact_id)
+        stmt = select(Contact).filter_by(user_id=user.id).where(Contact.id == contact_id)
         contact = await self.db.execute(stmt)
         return contact.scalar_one_or_none()
 
     async def create_contact(self, body: ContactBase, user: User) -> Contact:
-        contact = Contact(**body.model_dump(exclude_unset=True), user=user,)
-        self.db.add(contact)
+        values = body.model_dump(exclude_unset=True)
+        values["birthday_md"] = birthday_key(values.get("birthday"))
+        stmt = insert(Contact).values(**values, user_id=user.id).returning(Contact)
+        contact = (await self.db.execute(stmt)).scalar_one()
         await self.db.commit()
-        await self.db.refresh(contact)
-        return await self.get_contact_by_id(contact.id, user)
+        return contact
+
+    async def create_contacts(self, bodies: List[ContactBase], user: User) -> List[int]:
+        ids = await self._insert_contacts(bodies, user)
+        await self.db.commit()
+        return ids
+
+    async def _insert_contacts(self, bodies: List[ContactBase], user: User) -> List[int]:
+        rows = [
+            {
+                **body.model_dump(),
+                "birthday_md": birthday_key(body.birthday),
+                "user_id": user.id,
+            }
+            for body in bodies
+        ]
+        result = await self.db.execute(
+            insert(Contact).returning(Contact.id, sort_by_parameter_order=True), rows
+        )
+        return result.scalars().all()
+
+    async def apply_batch(self, batch: ContactBatchRequest, user: User) -> List[dict]:
+        operations = list(enumerate(batch.operations))
+        creates = [(i, op) for i, op in operations if op.op == "create"]
+        changes = [(i, op) for i, op in operations if op.op != "create"]
+
+        owned = set()
+        if changes:
+            result = await self.db.execute(
+                select(Contact.id).where(
+                    Contact.user_id == user.id,
+                    Contact.id.in_([op.id for _, op in changes]),
+                )
+            )
+            owned = set(result.scalars().all())
+
+        results = {}
+        if creates:
+            ids = await self._insert_contacts([op.data for _, op in creates], user)
+            for (i, op), contact_id in zip(creates, ids):
+                results[i] = {"index": i, "op": op.op, "id": contact_id, "status": "created"}
+
+        updates: dict[tuple, list] = {}
+        for i, op in changes:
+            if op.id not in owned:
+                results[i] = {"index": i, "op": op.op, "id": op.id, "status": "not_found"}
+            elif op.op == "update":
+                values = op.data.model_dump(exclude_unset=True)
+                if "birthday" in values:
+                    values["birthday_md"] = birthday_key(values["birthday"])
+                updates.setdefault(tuple(sorted(values)), []).append(
+                    {"b_id": op.id, **values}
+                )
+                results[i] = {"index": i, "op": op.op, "id": op.id, "status": "updated"}
+            else:
+                results[i] = {"index": i, "op": op.op, "id": op.id, "status": "deleted"}
+
+        table = Contact.__table__
+        for keys, rows in updates.items():
+            if not keys:
+                continue
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"), table.c.user_id == user.id)
+                .values({key: bindparam(key) for key in keys})
+            )
+            await self.db.execute(stmt, rows)
+
+        deleted = [
+            op.id for i, op in changes
+            if op.op == "delete" and results[i]["status"] == "deleted"
+        ]
+        if deleted:
+            await self.db.execute(
+                delete(Contact)
+                .where(Contact.user_id == user.id, Contact.id.in_(deleted))
+                .execution_options(synchronize_session=False)
+            )
+
+        await self.db.commit()
+        return [results[i] for i, _ in operations]
 
     async def remove_contact(self, contact_id: int, user: User) -> Contact | None:
-        contact = await self.get_contact_by_id(contact_id, user)
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+            .execution_options(synchronize_session=False)
+        )
+        contact = (await self.db.execute(stmt)).scalar_one_or_none()
         if contact:
-            await self.db.delete(contact)
             await self.db.commit()
         return contact
 
     async def update_contact(
-        self, contact_id: int, body: ContactUpdate, user: User) -> Contact | None:
-        contact = await self.get_contact_by_id(contact_id, user)
+        self,
+        contact_id: int,
+        body: ContactUpdate,
+        user: User,
+        expected_versions: Sequence[datetime] | None = None,
+    ) -> Contact | None:
+        values = body.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_contact_by_id(contact_id, user)
+        if "birthday" in values:
+            values["birthday_md"] = birthday_key(values["birthday"])
+        conditions = [Contact.id == contact_id, Contact.user_id == user.id]
+        if expected_versions is not None:
+            conditions.append(or_(*(self._updated_at_equals(v) for v in expected_versions)))
+        stmt = (
+            update(Contact)
+            .where(*conditions)
+            .values(**values)
+            .returning(Contact)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        contact = (await self.db.execute(stmt)).scalar_one_or_none()
         if contact:
-            for key, value in body.dict(exclude_unset=True).items():
-                setattr(contact, key, value)
-
             await self.db.commit()
-            await self.db.refresh(contact)
-
         return contact
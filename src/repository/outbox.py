@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import EmailOutbox, EmailStatus
+
+
+class OutboxRepository:
+    """
+    Repository for the transactional email outbox.
+
+    Methods:
+    - enqueue(recipient, username, host, email_type, now, commit=True) -> EmailOutbox: Queue an email for delivery;
+      with ``commit=False`` the row joins the caller's transaction.
+    - claim_due(limit: int, now: datetime) -> List[EmailOutbox]: Lock up to ``limit`` pending emails that are due.
+    - mark_sent(message, now): Record a successful delivery.
+    - mark_failed(message, error, now, max_attempts, retry_base, retry_max): Record a failure and schedule a retry.
+    """
+    def __init__(self, session: AsyncSession):
+        self.db = session
+
+    async def enqueue(
+        self,
+        recipient: str,
+        username: str,
+        host: str,
+        email_type: str,
+        now: datetime,
+        commit: bool = True,
+    ) -> EmailOutbox:
+        message = EmailOutbox(
+            recipient=recipient,
+            username=username,
+            host=host,
+            email_type=email_type,
+            status=EmailStatus.PENDING,
+            attempts=0,
+            next_attempt_at=now,
+            created_at=now,
+        )
+        self.db.add(message)
+        if commit:
+            await self.db.commit()
+        return message
+
+    async def claim_due(self, limit: int, now: datetime) -> List[EmailOutbox]:
+        stmt = (
+            select(EmailOutbox)
+            .where(
+                EmailOutbox.status == EmailStatus.PENDING,
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    def mark_sent(self, message: EmailOutbox, now: datetime) -> None:
+        message.status = EmailStatus.SENT
+        message.sent_at = now
+        message.last_error = None
+
+    def mark_failed(
+        self,
+        message: EmailOutbox,
+        error: str,
+        now: datetime,
+        max_attempts: int,
+        retry_base: float,
+        retry_max: float,
+    ) -> None:
+        message.attempts += 1
+        message.last_error = error[:500]
+        if message.attempts >= max_attempts:
+            message.status = EmailStatus.FAILED
+            return
+        delay = min(retry_base * 2 ** (message.attempts - 1), retry_max)
+        message.next_attempt_at = now + timedelta(seconds=delay)
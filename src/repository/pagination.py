@@ -0,0 +1,52 @@
+import base64
+import binascii
+import json
+
+
+def encode_cursor(sort: str, values: list) -> str:
+    """
+    Encode the keyset position after the last row of a page.
+
+    Args:
+    - sort: Name of the ordering the cursor belongs to.
+    - values: Sort key values of the last row, ending with its id.
+
+    Returns:
+    - str: Opaque, URL-safe cursor.
+    """
+    raw = json.dumps([sort, values], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, types: tuple[type, ...] | None = None) -> list:
+    """
+    Decode a cursor produced by ``encode_cursor`` for the same ordering.
+
+    Args:
+    - cursor: Opaque cursor received from the client.
+    - sort: Ordering the cursor must belong to.
+    - types: Expected Python type of each value, in sort key order.
+
+    Raises:
+    - ValueError: If the cursor is malformed, was issued for another ordering
+      or its values do not match ``types``.
+
+    Returns:
+    - list: Sort key values of the last row, ending with its id.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, values = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if cursor_sort != sort or not isinstance(values, list) or not values:
+        raise ValueError("Invalid cursor")
+    if types is None:
+        valid = all(type(value) in (str, int) for value in values)
+    else:
+        valid = len(values) == len(types) and all(
+            type(value) is expected for value, expected in zip(values, types)
+        )
+    if not valid:
+        raise ValueError("Invalid cursor")
+    return values
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.schemas import UserCreate
+from src.services.invalidation import user_invalidation_bus
 
 class UserRepository:
     """
@@ -50,15 +51,18 @@ class UserRepository:
         user = await self.get_user_by_email(email)
         user.confirmed = True
         await self.db.commit()
+        await user_invalidation_bus.publish(user.username)
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         user = await self.get_user_by_email(email)
         user.avatar = url
         await self.db.commit()
         await self.db.refresh(user)
+        await user_invalidation_bus.publish(user.username)
         return user
 
     async def update_password(self, email: str, new_password) -> None:
         user = await self.get_user_by_email(email)
         user.hashed_password = new_password
         await self.db.commit()
+        await user_invalidation_bus.publish(user.username)
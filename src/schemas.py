@@ -1,6 +1,6 @@
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from typing import Annotated, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, model_validator
 
 from src.database.models import UserRole
 
@@ -31,6 +31,83 @@ class ContactResponse(ContactBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ContactPage(BaseModel):
+    items: List[ContactResponse]
+    next_cursor: Optional[str] = None
+
+
+class ContactImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class ContactImportReport(BaseModel):
+    created: int
+    failed: int
+    errors: List[ContactImportError]
+    errors_truncated: bool = False
+
+
+class ContactBatchCreate(BaseModel):
+    op: Literal["create"]
+    data: ContactBase
+
+
+class ContactBatchUpdate(BaseModel):
+    op: Literal["update"]
+    id: int
+    data: ContactUpdate
+
+
+class ContactBatchDelete(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+ContactBatchOperation = Annotated[
+    Union[ContactBatchCreate, ContactBatchUpdate, ContactBatchDelete],
+    Field(discriminator="op"),
+]
+
+
+class ContactBatchRequest(BaseModel):
+    operations: List[ContactBatchOperation] = Field(min_length=1, max_length=1000)
+
+    @model_validator(mode="after")
+    def check_unique_ids(self):
+        ids = [operation.id for operation in self.operations if operation.op != "create"]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each contact id may appear in only one operation")
+        return self
+
+    @model_validator(mode="after")
+    def check_required_fields(self):
+        # birthday and additional_info are NOT NULL in the database; reject or
+        # default nulls here, as the contact importer does, so the batch
+        # never reaches the session with rows it cannot insert.
+        for i, operation in enumerate(self.operations):
+            if operation.op == "delete":
+                continue
+            data = operation.data
+            birthday_set = operation.op == "create" or "birthday" in data.model_fields_set
+            if birthday_set and data.birthday is None:
+                raise ValueError(f"operations.{i}.data.birthday: Field required")
+            if "additional_info" in data.model_fields_set and data.additional_info is None:
+                data.additional_info = ""
+        return self
+
+
+class ContactBatchResult(BaseModel):
+    index: int
+    op: str
+    id: Optional[int] = None
+    status: Literal["created", "updated", "deleted", "not_found"]
+
+
+class ContactBatchResponse(BaseModel):
+    results: List[ContactBatchResult]
+
+
 class User(BaseModel):
     id: int
     username: str
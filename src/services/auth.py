@@ -2,48 +2,118 @@ from datetime import datetime, timedelta, UTC
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
-import jsonpickle
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
-import redis
+from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 
 from src.database.db import get_db
+from src.database.redis_client import get_redis
 from src.conf.config import settings
 from src.services.users import UserService
+from src.services.user_cache import CachedUser, encode_user, decode_user
+from src.services.local_cache import user_local_cache
+from src.services.executor import BoundedExecutor
+from src.services.token_cache import verified_token_cache
 from src.database.models import User, UserRole
 
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+hash_executor = BoundedExecutor(
+    max_workers=settings.HASH_MAX_WORKERS,
+    kind=settings.HASH_EXECUTOR,
+    name="password-hash",
+)
+
+def _verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+def _get_password_hash(password: str):
+    return pwd_context.hash(password)
+
 class Hash:
     """
     Class to handle password hashing and verification.
 
+    The ``*_async`` variants run bcrypt in ``hash_executor`` so that slow
+    hashing never blocks the event loop.
+
     Methods:
     - verify_password(plain_password, hashed_password): Verify a plain password against a hashed password.
     - get_password_hash(password: str): Get the hashed version of a password.
+    - verify_password_async(plain_password, hashed_password): Verify a password in the hashing pool.
+    - get_password_hash_async(password: str): Hash a password in the hashing pool.
     """
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = pwd_context
 
     def verify_password(self, plain_password, hashed_password):
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return _verify_password(plain_password, hashed_password)
 
     def get_password_hash(self, password: str):
-        return self.pwd_context.hash(password)
+        return _get_password_hash(password)
+
+    async def verify_password_async(self, plain_password, hashed_password):
+        return await hash_executor.run(_verify_password, plain_password, hashed_password)
+
+    async def get_password_hash_async(self, password: str):
+        return await hash_executor.run(_get_password_hash, password)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
-async def create_access_token(data: dict, expires_delta: Optional[int] = None):
+PRINCIPAL_CLAIMS = ("id", "role", "confirmed")
+
+
+class Principal:
+    """
+    Identity of the caller as asserted by a signed access token.
+
+    It is built from token claims without any I/O, so it reflects the user
+    as of token issue time; use ``get_current_user`` where fresh data matters.
+
+    Methods:
+    - from_claims(payload) -> Principal: Build a principal from decoded token claims.
+    - from_user(user) -> Principal: Build a principal from a loaded or cached user.
+    """
+    __slots__ = ("id", "username", "role", "confirmed")
+
+    def __init__(self, id: int, username: str, role: UserRole, confirmed: bool):
+        self.id = id
+        self.username = username
+        self.role = UserRole(role)
+        self.confirmed = bool(confirmed)
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> "Principal":
+        return cls(payload["id"], payload["sub"], payload["role"], payload["confirmed"])
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(user.id, user.username, user.role, user.confirmed)
+
+
+async def create_access_token(data: dict, expires_delta: Optional[int] = None, user=None):
     """
     Create an access token for authentication.
 
     Args:
     - data: Data to be encoded in the token.
     - expires_delta: Expiry duration for the token.
+    - user: Optional user whose id, role and confirmed flag are embedded as claims
+      (when ``JWT_EMBED_PRINCIPAL`` is enabled) for ``get_current_principal``.
 
     Returns:
     - str: Encoded JWT token.
     """
     to_encode = data.copy()
+    if user is not None and settings.JWT_EMBED_PRINCIPAL:
+        to_encode.update(
+            {
+                "id": user.id,
+                "role": UserRole(user.role).value,
+                "confirmed": bool(user.confirmed),
+            }
+        )
     if expires_delta:
         expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
     else:
@@ -54,47 +124,110 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None):
     )
     return encoded_jwt
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-):
+def _credentials_exception():
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def decode_access_token(token: str) -> dict:
     """
-    Get the current user based on the provided token.
+    Verify an access token and return its claims.
+
+    The signature is checked once per token per worker; later calls are
+    served from ``verified_token_cache`` until the token expires.
 
     Args:
     - token: JWT token for authentication.
-    - db: Database session.
+
+    Raises:
+    - HTTPException: 401 if the token is invalid, expired or has no subject.
 
     Returns:
-    - User: Current user object.
+    - dict: Decoded token payload.
     """
-    r = redis.Redis(host='localhost', port=6379, db=0)
-
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
+    payload = verified_token_cache.get(token)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
         )
-        username = payload["sub"]
-        if username is None:
-            raise credentials_exception
-    except JWTError as e:
-        raise credentials_exception
+    except JWTError:
+        raise _credentials_exception()
+    if payload.get("sub") is None:
+        raise _credentials_exception()
+    verified_token_cache.set(token, payload)
+    return payload
+
+async def _load_user(username: str, db: Session, r: Redis) -> CachedUser:
+    cached_user = user_local_cache.get(username)
+    if cached_user is not None:
+        return cached_user
+
     user_service = UserService(db)
-    user = r.get(str(username))
-    if user is None:
+    cached_user = decode_user(await r.get(str(username)))
+    if cached_user is None:
         user = await user_service.get_user_by_username(username)
         if user is None:
-            raise credentials_exception
-        r.set(str(user.username), jsonpickle.encode(user))
-        r.expire(str(user.username), 3600)
-        return user
-    
-    return jsonpickle.decode(user)
+            raise _credentials_exception()
+        cached_user = CachedUser.from_user(user)
+        await r.set(
+            str(cached_user.username),
+            encode_user(cached_user),
+            ex=settings.USER_CACHE_TTL_SECONDS,
+        )
+    user_local_cache.set(cached_user.username, cached_user)
+
+    return cached_user
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+    r: Redis = Depends(get_redis),
+):
+    """
+    Get the current user based on the provided token.
+
+    Args:
+    - token: JWT token for authentication.
+    - db: Database session.
+    - r: Shared Redis client used as the user cache.
+
+    Returns:
+    - CachedUser: Snapshot of the current user.
+    """
+    payload = decode_access_token(token)
+    return await _load_user(payload["sub"], db, r)
+
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+    r: Redis = Depends(get_redis),
+):
+    """
+    Get the caller's identity from the token claims alone.
+
+    Tokens issued with embedded id/role/confirmed claims are resolved
+    without touching Redis or the database. Older tokens fall back to the
+    full user lookup.
+
+    Args:
+    - token: JWT token for authentication.
+    - db: Database session, used only for tokens without principal claims.
+    - r: Shared Redis client, used only for tokens without principal claims.
+
+    Returns:
+    - Principal: Identity of the caller.
+    """
+    payload = decode_access_token(token)
+    if all(claim in payload for claim in PRINCIPAL_CLAIMS):
+        try:
+            return Principal.from_claims(payload)
+        except ValueError:
+            raise _credentials_exception()
+    return Principal.from_user(await _load_user(payload["sub"], db, r))
 
 def create_email_token(data: dict):
     """
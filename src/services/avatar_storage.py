@@ -0,0 +1,177 @@
+import hashlib
+import io
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Tuple
+from urllib.parse import quote
+
+import cloudinary
+import cloudinary.uploader
+from starlette.concurrency import run_in_threadpool
+
+from src.conf.config import settings
+from src.services.local_cache import LocalCache
+
+EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png"}
+
+
+class AvatarStorage(ABC):
+    """
+    Interface of the avatar storage backends.
+
+    Methods:
+    - save(key: str, data: bytes, content_type: str) -> str: Store an image and return its public URL.
+    """
+    @abstractmethod
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        ...
+
+
+class AvatarResolver(ABC):
+    """
+    Interface of read-only avatar sources, such as the default avatars of new users.
+
+    Methods:
+    - url(key: str) -> str: Public URL of the avatar of ``key``, computed without I/O.
+    """
+    @abstractmethod
+    def url(self, key: str) -> str:
+        ...
+
+
+def _version(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()[:12]
+
+
+class CloudinaryStorage(AvatarStorage):
+    """
+    Stores avatars in Cloudinary.
+
+    The blocking Cloudinary SDK call runs in the thread pool, so the event
+    loop keeps serving other requests during the upload.
+
+    Attributes:
+    - cloud_name: Cloudinary cloud name.
+    - api_key: Cloudinary API key.
+    - api_secret: Cloudinary API secret.
+    - folder: Folder prefix of the public ids.
+    """
+    def __init__(self, cloud_name, api_key, api_secret, folder: str = "RestApp"):
+        self.cloud_name = cloud_name
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.folder = folder
+        cloudinary.config(
+            cloud_name=self.cloud_name,
+            api_key=self.api_key,
+            api_secret=self.api_secret,
+            secure=True,
+        )
+
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        public_id = f"{self.folder}/{key}"
+        r = await run_in_threadpool(
+            cloudinary.uploader.upload, io.BytesIO(data), public_id=public_id, overwrite=True
+        )
+        return cloudinary.CloudinaryImage(public_id).build_url(version=r.get("version"))
+
+
+class LocalStorage(AvatarStorage):
+    """
+    Stores avatars as files under ``root``, served from ``base_url``.
+
+    Keys are percent-encoded into file names, so they cannot escape
+    ``root``. URLs carry a content hash to bust client caches on change.
+    """
+    def __init__(self, root: str | Path, base_url: str):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    def _write(self, name: str, data: bytes) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{name}.tmp"
+        tmp.write_bytes(data)
+        tmp.replace(self.root / name)
+
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        name = quote(key, safe="") + EXTENSIONS.get(content_type, "")
+        await run_in_threadpool(self._write, name, data)
+        return f"{self.base_url}/{quote(name)}?v={_version(data)}"
+
+
+class MemoryStorage(AvatarStorage):
+    """
+    Keeps avatars in a dict; a stand-in for tests and local runs.
+
+    Attributes:
+    - files: Stored ``(data, content_type)`` by key.
+    """
+    def __init__(self, base_url: str = "memory://avatars"):
+        self.base_url = base_url.rstrip("/")
+        self.files: Dict[str, Tuple[bytes, str]] = {}
+
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        self.files[key] = (data, content_type)
+        return f"{self.base_url}/{quote(key, safe='')}?v={_version(data)}"
+
+
+class GravatarResolver(AvatarResolver):
+    """
+    Resolves the Gravatar of an email address.
+
+    The URL is the MD5 of the trimmed, lower-cased address, computed
+    locally and memoized in a bounded LRU cache; no request goes to
+    Gravatar until a client loads the image.
+
+    Attributes:
+    - base_url: Gravatar avatar endpoint.
+    - cache: Memoized URLs by normalized email.
+    """
+    def __init__(
+        self,
+        base_url: str = "https://www.gravatar.com/avatar",
+        cache_size: int | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.cache = LocalCache(
+            maxsize=settings.GRAVATAR_CACHE_SIZE if cache_size is None else cache_size,
+            ttl=float("inf"),
+        )
+
+    @staticmethod
+    def normalize(email: str) -> str:
+        return email.strip().lower()
+
+    def url(self, key: str) -> str:
+        email = self.normalize(key)
+        url = self.cache.get(email)
+        if url is None:
+            digest = hashlib.md5(email.encode("utf-8")).hexdigest()
+            url = f"{self.base_url}/{digest}"
+            self.cache.set(email, url)
+        return url
+
+
+gravatar = GravatarResolver()
+
+
+def create_avatar_storage(backend: str | None = None) -> AvatarStorage:
+    """
+    Build the storage backend selected by ``AVATAR_STORAGE``.
+
+    Args:
+    - backend: ``cloudinary``, ``local`` or ``memory``; defaults to the setting.
+
+    Returns:
+    - AvatarStorage: The configured backend.
+    """
+    backend = backend or settings.AVATAR_STORAGE
+    if backend == "cloudinary":
+        return CloudinaryStorage(
+            settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
+        )
+    if backend == "local":
+        return LocalStorage(settings.AVATAR_LOCAL_DIR, settings.AVATAR_LOCAL_URL)
+    if backend == "memory":
+        return MemoryStorage()
+    raise ValueError(f"Unknown avatar storage backend: {backend}")
@@ -0,0 +1,89 @@
+import io
+
+from fastapi import UploadFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+from starlette.concurrency import run_in_threadpool
+
+from src.conf.config import settings
+from src.services.avatar_storage import AvatarStorage
+
+
+class AvatarError(ValueError):
+    """The uploaded file is not a usable image."""
+
+
+class AvatarTooLarge(AvatarError):
+    """The uploaded file exceeds ``AVATAR_MAX_BYTES``."""
+
+
+def process_avatar(data: bytes, size: int, max_pixels: int) -> bytes:
+    """
+    Crop an image to a centered square, resize it and encode it as JPEG.
+
+    Runs Pillow, so call it from a worker thread.
+
+    Args:
+    - data: Raw image bytes.
+    - size: Width and height of the result in pixels.
+    - max_pixels: Largest accepted source image, to reject decompression bombs.
+
+    Returns:
+    - bytes: JPEG-encoded avatar.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if image.width * image.height > max_pixels:
+                raise AvatarError("Image dimensions are too large")
+            image = ImageOps.exif_transpose(image)
+            image = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            out = io.BytesIO()
+            image.save(out, format="JPEG", quality=85, optimize=True)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise AvatarError(f"Invalid image: {e}") from None
+    return out.getvalue()
+
+
+class AvatarPipeline:
+    """
+    Reads, normalizes and stores uploaded avatars without blocking the event loop.
+
+    The upload is read in chunks and rejected as soon as it passes
+    ``max_bytes``. Decoding and resizing run in the thread pool, and the
+    storage backend does its own I/O off the loop.
+
+    Methods:
+    - read(file: UploadFile) -> bytes: Read an upload, enforcing the size limit.
+    - update(file: UploadFile, key: str) -> str: Process and store an avatar and return its URL.
+    """
+    def __init__(
+        self,
+        storage: AvatarStorage,
+        max_bytes: int | None = None,
+        size: int | None = None,
+        chunk_size: int | None = None,
+        max_pixels: int | None = None,
+    ):
+        self.storage = storage
+        self.max_bytes = max_bytes or settings.AVATAR_MAX_BYTES
+        self.size = size or settings.AVATAR_SIZE
+        self.chunk_size = chunk_size or settings.AVATAR_CHUNK_SIZE
+        self.max_pixels = max_pixels or settings.AVATAR_MAX_PIXELS
+
+    async def read(self, file: UploadFile) -> bytes:
+        if file.size is not None and file.size > self.max_bytes:
+            raise AvatarTooLarge("File is too large")
+        buffer = bytearray()
+        while chunk := await file.read(self.chunk_size):
+            buffer += chunk
+            if len(buffer) > self.max_bytes:
+                raise AvatarTooLarge("File is too large")
+        if not buffer:
+            raise AvatarError("File is empty")
+        return bytes(buffer)
+
+    async def update(self, file: UploadFile, key: str) -> str:
+        data = await self.read(file)
+        avatar = await run_in_threadpool(process_avatar, data, self.size, self.max_pixels)
+        return await self.storage.save(key, avatar, "image/jpeg")
@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import AsyncIterator, Callable, List
+
+from src.conf.config import settings
+from src.database.models import User
+from src.repository.contacts import EXPORT_COLUMNS, ContactRepository
+
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "vcf": ("text/vcard; charset=utf-8", "vcf"),
+}
+
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def render_csv(rows: List, header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows([_plain(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+def render_ndjson(rows: List, header: bool) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, map(_plain, row))), ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def _vcard_escape(value: str | None) -> str:
+    if not value:
+        return ""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(",", "\\,")
+        .replace(";", "\\;")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def render_vcf(rows: List, header: bool) -> str:
+    cards = []
+    for row in rows:
+        first_name = _vcard_escape(row.first_name)
+        last_name = _vcard_escape(row.last_name)
+        lines = [
+            "BEGIN:VCARD",
+            "VERSION:3.0",
+            f"N:{last_name};{first_name};;;",
+            f"FN:{' '.join(part for part in (first_name, last_name) if part)}",
+            f"EMAIL:{_vcard_escape(row.email)}",
+            f"TEL:{_vcard_escape(row.phone)}",
+        ]
+        if row.birthday is not None:
+            lines.append(f"BDAY:{row.birthday.isoformat()}")
+        if row.additional_info:
+            lines.append(f"NOTE:{_vcard_escape(row.additional_info)}")
+        lines.append("END:VCARD")
+        cards.append("\r\n".join(lines) + "\r\n")
+    return "".join(cards)
+
+
+RENDERERS: dict[str, Callable[[List, bool], str]] = {
+    "csv": render_csv,
+    "ndjson": render_ndjson,
+    "vcf": render_vcf,
+}
+
+
+async def export_contacts(
+    session_factory,
+    user: User,
+    fmt: str,
+    batch_size: int | None = None,
+) -> AsyncIterator[str]:
+    """
+    Stream every contact of a user in an export format.
+
+    Rows come from a server-side cursor in batches of ``batch_size`` and each
+    batch is rendered to one text chunk, so memory use does not grow with
+    the size of the address book.
+
+    Args:
+    - session_factory: Callable returning an async context manager with a database session.
+    - user: Owner of the contacts.
+    - fmt: ``"csv"``, ``"ndjson"`` or ``"vcf"``.
+    - batch_size: Rows fetched and rendered per chunk.
+
+    Returns:
+    - AsyncIterator[str]: Chunks of the exported file.
+    """
+    render = RENDERERS[fmt]
+    batch_size = batch_size or settings.CONTACT_EXPORT_BATCH_SIZE
+    header = True
+    async with session_factory() as db:
+        async for rows in ContactRepository(db).stream_contacts(user, batch_size):
+            yield render(rows, header)
+            header = False
+    if header and fmt == "csv":
+        yield render_csv([], True)
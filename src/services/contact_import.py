@@ -0,0 +1,150 @@
+import csv
+import io
+import json
+from itertools import islice
+from typing import BinaryIO, Iterator, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from src.conf.config import settings
+from src.database.models import User
+from src.repository.contacts import ContactRepository
+from src.schemas import ContactBase, ContactImportError, ContactImportReport
+
+IMPORT_FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+Row = Tuple[int, dict | None, str | None]
+
+
+def detect_import_format(filename: str | None, content_type: str | None) -> str | None:
+    """
+    Guess the upload format from its file name or content type.
+
+    Args:
+    - filename: Name of the uploaded file.
+    - content_type: Content type sent with the upload.
+
+    Returns:
+    - str | None: ``"csv"``, ``"ndjson"`` or None if it cannot be told.
+    """
+    if filename and "." in filename:
+        suffix = filename[filename.rfind("."):].lower()
+        if suffix in IMPORT_FORMATS:
+            return IMPORT_FORMATS[suffix]
+    if content_type:
+        return IMPORT_FORMATS.get(content_type.split(";")[0].strip().lower())
+    return None
+
+
+def _csv_rows(stream: io.TextIOBase) -> Iterator[Row]:
+    reader = csv.DictReader(stream)
+    for record in reader:
+        row = {key: value for key, value in record.items() if key is not None}
+        if row.get("birthday") == "":
+            row["birthday"] = None
+        yield reader.line_num, row, None
+
+
+def _ndjson_rows(stream: io.TextIOBase) -> Iterator[Row]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_number, None, "Invalid JSON"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, row, None
+
+
+def _read_chunk(rows: Iterator[Row], size: int) -> List[Row]:
+    try:
+        return list(islice(rows, size))
+    except UnicodeDecodeError:
+        raise ValueError("File must be UTF-8 encoded")
+    except csv.Error as e:
+        raise ValueError(f"Malformed CSV: {e}")
+
+
+def _validation_messages(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+class ContactImporter:
+    """
+    Streams contacts from an uploaded CSV or NDJSON file into the database.
+
+    The file is read and validated ``chunk_size`` rows at a time and every
+    chunk of valid rows is stored with a single multi-row insert, so memory
+    use depends on the chunk size rather than the file size. Each chunk is
+    committed on its own; rows that fail validation are skipped and listed
+    in the report (up to ``max_errors`` entries).
+
+    Methods:
+    - import_file(file: BinaryIO, fmt: str, user: User) -> ContactImportReport: Import every row of the file.
+    """
+    def __init__(
+        self,
+        db: AsyncSession,
+        chunk_size: int | None = None,
+        max_errors: int | None = None,
+    ):
+        self.contact_repository = ContactRepository(db)
+        self.chunk_size = chunk_size or settings.CONTACT_IMPORT_CHUNK_SIZE
+        self.max_errors = settings.CONTACT_IMPORT_MAX_ERRORS if max_errors is None else max_errors
+
+    async def import_file(self, file: BinaryIO, fmt: str, user: User) -> ContactImportReport:
+        stream = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        rows = _csv_rows(stream) if fmt == "csv" else _ndjson_rows(stream)
+        report = ContactImportReport(created=0, failed=0, errors=[])
+        try:
+            while True:
+                chunk = await run_in_threadpool(_read_chunk, rows, self.chunk_size)
+                if not chunk:
+                    break
+                valid = []
+                for line_number, row, problem in chunk:
+                    messages = [problem] if problem else self._validate(row, valid)
+                    if messages:
+                        self._record_error(report, line_number, messages)
+                if valid:
+                    ids = await self.contact_repository.create_contacts(valid, user)
+                    report.created += len(ids)
+        finally:
+            stream.detach()
+        return report
+
+    @staticmethod
+    def _validate(row: dict, valid: List[ContactBase]) -> List[str]:
+        try:
+            body = ContactBase.model_validate(row)
+        except ValidationError as e:
+            return _validation_messages(e)
+        if body.birthday is None:
+            return ["birthday: Field required"]
+        if body.additional_info is None:
+            body.additional_info = ""
+        valid.append(body)
+        return []
+
+    def _record_error(self, report: ContactImportReport, line_number: int, messages: List[str]):
+        report.failed += 1
+        if len(report.errors) < self.max_errors:
+            report.errors.append(ContactImportError(row=line_number, errors=messages))
+        else:
+            report.errors_truncated = True
@@ -1,7 +1,9 @@
+from typing import List
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repository.contacts import ContactRepository
-from src.schemas import ContactBase, ContactUpdate
+from src.schemas import ContactBase, ContactUpdate, ContactBatchRequest
 from src.database.models import User
 
 class ContactService:
@@ -10,10 +12,14 @@ class ContactService:
 
     Methods:
     - create_contact(body: ContactBase, user: User): Create a new contact.
+    - create_contacts(bodies: List[ContactBase], user: User): Create many contacts at once.
+    - apply_batch(batch: ContactBatchRequest, user: User): Run mixed contact operations in one transaction.
     - get_contacts(skip: int, limit: int, query: str | None, user: User): Get a list of contacts.
-    - get_upcoming_birthdays(user: User): Get upcoming birthdays from contacts.
+    - get_contacts_page(limit: int, cursor: str | None, sort: str, query: str | None, user: User): Get a keyset-paginated page of contacts.
+    - search_contacts(query: str, limit: int, user: User): Search contacts ranked by relevance.
+    - get_upcoming_birthdays(user: User, days: int): Get upcoming birthdays from contacts.
     - get_contact(contact_id: int, user: User): Get a specific contact by ID.
-    - update_contact(contact_id: int, body: ContactUpdate, user: User): Update a contact.
+    - update_contact(contact_id: int, body: ContactUpdate, user: User, expected_versions=None): Update a contact.
     - remove_contact(contact_id: int, user: User): Remove a contact.
     """
     def __init__(self, db: AsyncSession):
@@ -22,17 +28,35 @@ class ContactService:
     async def create_contact(self, body: ContactBase, user: User):
         return await self.contact_repository.create_contact(body, user)
 
+    async def create_contacts(self, bodies: List[ContactBase], user: User):
+        return await self.contact_repository.create_contacts(bodies, user)
+
+    async def apply_batch(self, batch: ContactBatchRequest, user: User):
+        return await self.contact_repository.apply_batch(batch, user)
+
     async def get_contacts(self, skip: int, limit: int, query: str | None, user: User):
         return await self.contact_repository.get_contacts(skip, limit, query, user)
     
-    async def get_upcoming_birthdays(self, user: User):
-        return await self.contact_repository.get_upcoming_birthdays(user)
+    async def get_contacts_page(
+        self, limit: int, cursor: str | None, sort: str, query: str | None, user: User
+    ):
+        return await self.contact_repository.get_contacts_page(limit, cursor, sort, query, user)
+
+    async def search_contacts(self, query: str, limit: int, user: User):
+        return await self.contact_repository.search_contacts(query, limit, user)
+
+    async def get_upcoming_birthdays(self, user: User, days: int = 7):
+        return await self.contact_repository.get_upcoming_birthdays(user, days)
 
     async def get_contact(self, contact_id: int, user: User):
         return await self.contact_repository.get_contact_by_id(contact_id, user)
 
-    async def update_contact(self, contact_id: int, body: ContactUpdate, user: User):
-        return await self.contact_repository.update_contact(contact_id, body, user)
+    async def update_contact(
+        self, contact_id: int, body: ContactUpdate, user: User, expected_versions=None
+    ):
+        return await self.contact_repository.update_contact(
+            contact_id, body, user, expected_versions
+        )
 
     async def remove_contact(self, contact_id: int, user: User):
         return await self.contact_repository.remove_contact(contact_id, user)
@@ -1,56 +1,74 @@
+from datetime import datetime, UTC
+from email.message import EmailMessage
 from pathlib import Path
 
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
-from fastapi_mail.errors import ConnectionErrors
 from pydantic import EmailStr
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.repository.outbox import OutboxRepository
 from src.services.auth import create_email_token
+from src.services.email_templates import EmailTemplateRenderer
 from src.conf.config import settings
 
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_FROM_NAME=settings.MAIL_FROM_NAME,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=settings.USE_CREDENTIALS,
-    VALIDATE_CERTS=settings.VALIDATE_CERTS,
-    TEMPLATE_FOLDER=Path(__file__).parent / "templates",
-)
-
-async def send_email(email: EmailStr, username: str, host: str, email_type: str):
+TEMPLATE_FOLDER = Path(__file__).parent / "templates"
+
+SUBJECTS = {
+    "reset_password": "Reset your password",
+    "verify_email": "Confirm your email",
+}
+
+email_renderer = EmailTemplateRenderer(TEMPLATE_FOLDER)
+
+def utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+async def queue_email(
+    db: AsyncSession,
+    email: EmailStr,
+    username: str,
+    host: str,
+    email_type: str,
+    commit: bool = True,
+):
     """
-    Send an email to the provided email address.
+    Queue an email in the outbox for the mail worker to deliver.
 
     Args:
+    - db: Database session.
     - email: Email address to send the email to.
     - username: Username for the recipient.
     - host: Host URL for the email content.
     - email_type: Type of email to be sent.
+    - commit: Commit right away; pass False to queue the email in the
+      transaction of a write that the caller commits.
 
-    Raises:
-    - ConnectionErrors: If there is an error with the email connection.
+    Returns:
+    - EmailOutbox: The queued message.
+    """
+    return await OutboxRepository(db).enqueue(
+        str(email), username, str(host), email_type, utcnow(), commit=commit
+    )
+
+def build_message(email: str, username: str, host: str, email_type: str) -> EmailMessage:
+    """
+    Render an outbox email into a MIME message.
+
+    A fresh verification token is created for every delivery attempt.
+
+    Args:
+    - email: Email address to send the email to.
+    - username: Username for the recipient.
+    - host: Host URL for the email content.
+    - email_type: Type of email to be sent.
 
     Returns:
-    - None
+    - EmailMessage: Message ready for SMTP.
     """
-    try:
-        token_verification = create_email_token({"sub": email})
-        message = MessageSchema(
-            subject= "Reset your password" if email_type=="reset_password" else "Confirm your email",
-            recipients=[email],
-            template_body={
-                "host": host,
-                "username": username,
-                "token": token_verification,
-            },
-            subtype=MessageType.html,
-        )
-
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name=f"{email_type}.html")
-    except ConnectionErrors as err:
-        print(err)
+    token_verification = create_email_token({"sub": email})
+    html = email_renderer.render(email_type, username, host, token_verification)
+    message = EmailMessage()
+    message["Subject"] = SUBJECTS.get(email_type, "Confirm your email")
+    message["From"] = f"{settings.MAIL_FROM_NAME} <{settings.MAIL_FROM}>"
+    message["To"] = email
+    message.set_content(html, subtype="html")
+    return message
@@ -0,0 +1,91 @@
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from markupsafe import escape
+
+FIELDS = ("username", "host", "token")
+
+_SLOT = "\x00{}\x00"
+_SLOT_RE = re.compile("\x00(" + "|".join(FIELDS) + ")\x00")
+_PROBE = {"username": "<probe & \"user\">", "host": "http://probe/?a=1&b=2", "token": "pr.obe'"}
+
+
+@dataclass(frozen=True)
+class CompiledEmail:
+    """
+    A template compiled once, with its static output cached.
+
+    ``parts`` alternates static chunks and field names, as produced by
+    ``re.split`` on the slot markers. It is ``None`` when the template
+    transforms the fields in a way the cached chunks cannot reproduce; such
+    templates are rendered through Jinja on every call.
+    """
+    template: Template
+    parts: List[str] | None
+    autoescape: bool
+
+    def render(self, username: str, host: str, token: str) -> str:
+        if self.parts is None:
+            return self.template.render(username=username, host=host, token=token)
+        values = {"username": username, "host": host, "token": token}
+        if self.autoescape:
+            values = {name: str(escape(value)) for name, value in values.items()}
+        return "".join(
+            values[part] if i % 2 else part for i, part in enumerate(self.parts)
+        )
+
+
+class EmailTemplateRenderer:
+    """
+    Renders transactional email templates from precompiled, cached parts.
+
+    Every template in ``folder`` is compiled once on ``load``. Each one is
+    then rendered with marker values for ``username``, ``host`` and
+    ``token``, and the output is split on the markers. A message is built
+    by joining the static chunks with the (escaped) field values, so no
+    Jinja code runs per message.
+
+    Methods:
+    - load(): Compile and cache every template in the folder.
+    - render(email_type: str, username: str, host: str, token: str) -> str: Render a message body.
+    """
+    def __init__(self, folder: Path, suffix: str = ".html"):
+        self.folder = Path(folder)
+        self.suffix = suffix
+        self.env = Environment(
+            loader=FileSystemLoader(self.folder),
+            autoescape=select_autoescape(["html"]),
+        )
+        self._compiled: Dict[str, CompiledEmail] | None = None
+
+    def load(self) -> None:
+        compiled = {}
+        for path in sorted(self.folder.glob(f"*{self.suffix}")):
+            compiled[path.stem] = self._compile(path.name)
+        self._compiled = compiled
+
+    def _compile(self, name: str) -> CompiledEmail:
+        template = self.env.get_template(name)
+        autoescape = self.env.autoescape
+        if callable(autoescape):
+            autoescape = autoescape(name)
+        markers = {field: _SLOT.format(field) for field in FIELDS}
+        parts = _SLOT_RE.split(template.render(**markers))
+        email = CompiledEmail(template, parts, bool(autoescape))
+        # Filters or conditionals on the fields would make the cached
+        # chunks wrong; fall back to Jinja when the probe output differs.
+        if email.render(**_PROBE) != template.render(**_PROBE):
+            email = CompiledEmail(template, None, bool(autoescape))
+        return email
+
+    def render(self, email_type: str, username: str, host: str, token: str) -> str:
+        if self._compiled is None:
+            self.load()
+        try:
+            email = self._compiled[email_type]
+        except KeyError:
+            raise ValueError(f"Unknown email template: {email_type}") from None
+        return email.render(str(username), str(host), str(token))
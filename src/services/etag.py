@@ -0,0 +1,92 @@
+import hashlib
+import re
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+_VERSION_TAG = re.compile(r'^(?:W/)?"(\d+)-(-?\d+)"$')
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a weak entity tag from the parts that identify a representation.
+
+    Args:
+    - parts: Values that change whenever the representation changes.
+
+    Returns:
+    - str: Weak ETag such as ``W/"3f2a..."``.
+    """
+    digest = hashlib.sha1("\x1f".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def split_etags(header: str | None) -> list[str]:
+    """
+    Split an ``If-Match`` or ``If-None-Match`` header into its entity tags.
+
+    Args:
+    - header: Raw header value, possibly a comma-separated list.
+
+    Returns:
+    - list[str]: Non-empty tags in header order, ``*`` included as is.
+    """
+    if not header:
+        return []
+    return [tag for tag in (part.strip() for part in header.split(",")) if tag]
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    """
+    Check an ``If-None-Match`` or ``If-Match`` header against an ETag.
+
+    Comparison is weak: ``W/`` prefixes are ignored and ``*`` matches any
+    current representation.
+
+    Args:
+    - header: Raw header value, possibly a comma-separated list.
+    - etag: Current ETag of the resource.
+
+    Returns:
+    - bool: True if any listed tag matches.
+    """
+    current = etag.removeprefix("W/")
+    for candidate in split_etags(header):
+        if candidate == "*" or candidate.removeprefix("W/") == current:
+            return True
+    return False
+
+
+def version_etag(id: int, updated_at: datetime | None) -> str:
+    """
+    Build a weak ETag that encodes a row's id and ``updated_at`` stamp.
+
+    Unlike ``make_etag`` the tag can be parsed back with ``parse_version_etag``
+    so ``If-Match`` can be checked inside the UPDATE statement.
+
+    Args:
+    - id: Row id.
+    - updated_at: Last modification time (naive, as stored).
+
+    Returns:
+    - str: Weak ETag such as ``W/"12-1760781600000000"``.
+    """
+    stamp = 0
+    if updated_at is not None:
+        stamp = (updated_at.replace(tzinfo=None) - _EPOCH) // timedelta(microseconds=1)
+    return f'W/"{id}-{stamp}"'
+
+
+def parse_version_etag(tag: str) -> tuple[int, datetime] | None:
+    """
+    Parse a tag built by ``version_etag``.
+
+    Args:
+    - tag: Single entity tag, weak or strong.
+
+    Returns:
+    - tuple[int, datetime] | None: Row id and ``updated_at``, or None if the tag is not a version tag.
+    """
+    match = _VERSION_TAG.match(tag.strip())
+    if match is None:
+        return None
+    return int(match.group(1)), _EPOCH + timedelta(microseconds=int(match.group(2)))
@@ -0,0 +1,185 @@
+import asyncio
+import inspect
+import json
+import logging
+import uuid
+from typing import Awaitable, Callable
+
+from redis.asyncio import Redis
+
+from src.conf.config import settings
+from src.database.redis_client import redis_manager
+from src.services.local_cache import user_local_cache
+from src.services.token_cache import verified_token_cache
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str], Awaitable[None] | None]
+
+
+class UserInvalidationBus:
+    """
+    In-memory bus for user-change events.
+
+    Events are delivered only to handlers registered in this process, which
+    makes it a stand-in for tests and single-worker deployments. Publishing
+    still deletes the shared Redis entry returned by ``store`` first, so no
+    worker reloads the stale user from it.
+
+    Methods:
+    - subscribe(handler): Register a callable invoked with the changed username.
+    - publish(username): Drop the shared entry and deliver a user-change event.
+    - start(redis=None): Start delivering events (no-op for the local bus).
+    - stop(): Stop delivering events (no-op for the local bus).
+    """
+    def __init__(self, store: Callable[[], Redis] | None = None):
+        self._handlers: list[Handler] = []
+        self.store = store
+
+    def subscribe(self, handler: Handler) -> None:
+        self._handlers.append(handler)
+
+    async def publish(self, username: str) -> None:
+        await self._delete_shared(username)
+        await self._dispatch(username)
+
+    def _shared_client(self) -> Redis | None:
+        return self.store() if self.store is not None else None
+
+    async def _delete_shared(self, username: str) -> None:
+        try:
+            redis = self._shared_client()
+            if redis is not None:
+                await redis.delete(username)
+        except Exception:
+            logger.exception("Failed to drop the shared cache entry for %s", username)
+
+    async def start(self, redis: Redis | None = None) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def _dispatch(self, username: str) -> None:
+        for handler in self._handlers:
+            result = handler(username)
+            if inspect.isawaitable(result):
+                await result
+
+
+class RedisUserInvalidationBus(UserInvalidationBus):
+    """
+    User-change bus shared by every worker through Redis pub/sub.
+
+    Publishing deletes the shared Redis entry, evicts this worker's caches
+    right away and broadcasts the username; every other worker evicts its
+    local copy when the message arrives. Until ``start`` is called with a
+    Redis client the broadcast is skipped, but the shared entry is still
+    deleted through ``store``.
+
+    The listener polls with ``get_message(timeout=poll_interval)`` instead
+    of blocking in ``listen()``: the shared pool sets ``socket_timeout``, so
+    a blocking read on an idle channel would fail and resubscribe every few
+    seconds, losing events published in between. A poll that times out just
+    means the channel is idle.
+
+    Methods:
+    - publish(username): Drop the shared entry, evict locally and broadcast the event.
+    - start(redis): Subscribe to the channel and run the listener task.
+    - stop(): Cancel the listener task.
+    """
+    def __init__(
+        self,
+        channel: str,
+        reconnect_delay: float = 1.0,
+        store: Callable[[], Redis] | None = None,
+        poll_interval: float = 1.0,
+    ):
+        super().__init__(store)
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.poll_interval = poll_interval
+        self.origin = uuid.uuid4().hex
+        self._redis: Redis | None = None
+        self._listener: asyncio.Task | None = None
+
+    def _shared_client(self) -> Redis | None:
+        return super()._shared_client() or self._redis
+
+    async def publish(self, username: str) -> None:
+        await self._delete_shared(username)
+        await self._dispatch(username)
+        if self._redis is None:
+            return
+        message = json.dumps({"origin": self.origin, "username": username})
+        try:
+            await self._redis.publish(self.channel, message)
+        except Exception:
+            logger.exception("Failed to publish invalidation for %s", username)
+
+    async def start(self, redis: Redis | None = None) -> None:
+        if redis is None or self._listener is not None:
+            return
+        self._redis = redis
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        self._listener = None
+        self._redis = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    while True:
+                        message = await pubsub.get_message(timeout=self.poll_interval)
+                        if message is not None:
+                            await self._handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation listener failed, reconnecting")
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def _handle_message(self, message: dict) -> None:
+        if message.get("type") != "message":
+            return
+        try:
+            event = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if event.get("origin") == self.origin or not event.get("username"):
+            return
+        await self._dispatch(event["username"])
+
+
+def _shared_redis() -> Redis:
+    return redis_manager.client
+
+
+def create_invalidation_bus(backend: str) -> UserInvalidationBus:
+    """
+    Build the user invalidation bus configured in settings.
+
+    Args:
+    - backend: ``"redis"`` for pub/sub across workers or ``"local"`` for the in-process stand-in.
+
+    Returns:
+    - UserInvalidationBus: Configured bus.
+    """
+    if backend == "redis":
+        return RedisUserInvalidationBus(settings.USER_CACHE_BUS_CHANNEL, store=_shared_redis)
+    if backend == "local":
+        return UserInvalidationBus(store=_shared_redis)
+    raise ValueError(f"Unknown user cache bus backend: {backend}")
+
+user_invalidation_bus = create_invalidation_bus(settings.USER_CACHE_BUS)
+user_invalidation_bus.subscribe(user_local_cache.pop)
+user_invalidation_bus.subscribe(verified_token_cache.revoke_subject)
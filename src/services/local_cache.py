@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from src.conf.config import settings
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with a per-entry time to live.
+
+    Each worker keeps its own instance, so it serves hot keys without any
+    network round trip. Entries are evicted in least recently used order
+    once ``maxsize`` is reached and are dropped lazily after they expire.
+
+    Methods:
+    - get(key, default=None): Return a live entry and mark it as recently used.
+    - set(key, value, ttl=None): Store an entry, evicting the oldest one if full.
+    - pop(key, default=None): Remove an entry and return its value.
+    - discard_if(predicate) -> int: Remove every entry whose value matches ``predicate``.
+    - clear(): Remove every entry.
+    - stats() -> dict: Current size and hit/miss/eviction counters.
+    """
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = self._timer() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def discard_if(self, predicate: Callable[[Any], bool]) -> int:
+        keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+user_local_cache = LocalCache(
+    maxsize=settings.USER_LOCAL_CACHE_SIZE,
+    ttl=settings.USER_LOCAL_CACHE_TTL_SECONDS,
+)
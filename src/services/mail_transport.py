@@ -0,0 +1,83 @@
+from email.message import EmailMessage
+from typing import List
+
+import aiosmtplib
+
+
+class SMTPTransport:
+    """
+    SMTP client that keeps one connection open across many messages.
+
+    The connection is opened on the first send and reused until the server
+    drops it, in which case the send is retried once on a new connection.
+
+    Methods:
+    - send(message: EmailMessage): Deliver a message.
+    - close(): Quit the SMTP session.
+    """
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        use_tls: bool = False,
+        start_tls: bool = False,
+        validate_certs: bool = True,
+        timeout: float = 30.0,
+    ):
+        self.username = username
+        self.password = password
+        self._client = aiosmtplib.SMTP(
+            hostname=hostname,
+            port=port,
+            use_tls=use_tls,
+            start_tls=start_tls,
+            validate_certs=validate_certs,
+            timeout=timeout,
+        )
+        self.connections = 0
+
+    async def _connect(self) -> None:
+        await self._client.connect()
+        self.connections += 1
+        if self.username:
+            await self._client.login(self.username, self.password)
+
+    async def send(self, message: EmailMessage) -> None:
+        if not self._client.is_connected:
+            await self._connect()
+        try:
+            await self._client.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            self._client.close()
+            await self._connect()
+            await self._client.send_message(message)
+
+    async def close(self) -> None:
+        if self._client.is_connected:
+            try:
+                await self._client.quit()
+            except aiosmtplib.SMTPException:
+                self._client.close()
+
+
+class MemoryTransport:
+    """
+    In-memory stand-in for ``SMTPTransport`` used in tests and local runs.
+
+    Methods:
+    - send(message: EmailMessage): Store the message, or raise for recipients in ``failing``.
+    - close(): No-op.
+    """
+    def __init__(self, failing: set[str] | None = None):
+        self.sent: List[EmailMessage] = []
+        self.failing = failing or set()
+
+    async def send(self, message: EmailMessage) -> None:
+        if message["To"] in self.failing:
+            raise aiosmtplib.SMTPRecipientRefused(550, "Mailbox unavailable", message["To"])
+        self.sent.append(message)
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,122 @@
+"""
+Mail worker: delivers queued emails from the outbox.
+
+Run with: python -m src.services.mail_worker
+"""
+import asyncio
+import logging
+import signal
+from typing import Callable
+
+from src.conf.config import settings
+from src.database.models import EmailOutbox
+from src.repository.outbox import OutboxRepository
+from src.services.email import build_message, email_renderer, utcnow
+from src.services.mail_transport import SMTPTransport
+
+logger = logging.getLogger(__name__)
+
+
+class MailWorker:
+    """
+    Delivers due outbox emails in batches over one shared transport.
+
+    Each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` so
+    several workers can run side by side. Failed messages are retried with
+    exponential backoff until ``max_attempts`` is reached.
+
+    Methods:
+    - run_once() -> int: Deliver one batch and return the number of claimed emails.
+    - run(stop: asyncio.Event): Deliver batches until ``stop`` is set.
+    """
+    def __init__(
+        self,
+        session_factory,
+        transport,
+        batch_size: int | None = None,
+        max_attempts: int | None = None,
+        retry_base: float | None = None,
+        retry_max: float | None = None,
+        poll_interval: float | None = None,
+        clock: Callable = utcnow,
+    ):
+        self.session_factory = session_factory
+        self.transport = transport
+        self.batch_size = batch_size or settings.MAIL_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.MAIL_MAX_ATTEMPTS
+        self.retry_base = settings.MAIL_RETRY_BASE_SECONDS if retry_base is None else retry_base
+        self.retry_max = settings.MAIL_RETRY_MAX_SECONDS if retry_max is None else retry_max
+        self.poll_interval = (
+            settings.MAIL_POLL_INTERVAL_SECONDS if poll_interval is None else poll_interval
+        )
+        self.clock = clock
+
+    async def run_once(self) -> int:
+        async with self.session_factory() as db:
+            repository = OutboxRepository(db)
+            messages = await repository.claim_due(self.batch_size, self.clock())
+            for message in messages:
+                await self._deliver(repository, message)
+            await db.commit()
+        return len(messages)
+
+    async def _deliver(self, repository: OutboxRepository, message: EmailOutbox) -> None:
+        try:
+            await self.transport.send(
+                build_message(message.recipient, message.username, message.host, message.email_type)
+            )
+        except Exception as e:
+            logger.warning("Delivery of email %s failed: %s", message.id, e)
+            repository.mark_failed(
+                message, str(e), self.clock(), self.max_attempts, self.retry_base, self.retry_max
+            )
+        else:
+            repository.mark_sent(message, self.clock())
+
+    async def run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("Mail worker batch failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+
+def create_transport() -> SMTPTransport:
+    return SMTPTransport(
+        hostname=settings.MAIL_SERVER,
+        port=settings.MAIL_PORT,
+        username=settings.MAIL_USERNAME if settings.USE_CREDENTIALS else None,
+        password=settings.MAIL_PASSWORD if settings.USE_CREDENTIALS else None,
+        use_tls=settings.MAIL_SSL_TLS,
+        start_tls=settings.MAIL_STARTTLS,
+        validate_certs=settings.VALIDATE_CERTS,
+    )
+
+
+async def main() -> None:
+    from src.database.db import sessionmanager
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    email_renderer.load()
+    transport = create_transport()
+    worker = MailWorker(sessionmanager.session, transport)
+    try:
+        await worker.run(stop)
+    finally:
+        await transport.close()
+        await sessionmanager.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
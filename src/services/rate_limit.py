@@ -0,0 +1,227 @@
+import logging
+import re
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+from fastapi import Depends, Request
+from redis.asyncio import Redis
+
+from src.conf.config import settings
+from src.database.redis_client import get_redis
+from src.services.auth import Principal, get_current_principal
+from src.services.local_cache import LocalCache
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# KEYS[1]: sorted set of request timestamps.
+# ARGV: now (s), window (s), limit, unique member.
+# Returns {allowed, remaining, retry_after_ms}.
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, math.ceil(window * 1000))
+    return {1, limit - count - 1, 0}
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, 0, math.ceil((tonumber(oldest[2]) + window - now) * 1000)}
+"""
+
+# KEYS[1]: hash with the token count and the time of the last refill.
+# ARGV: now (s), refill rate (tokens/s), capacity.
+# Returns {allowed, remaining, retry_after_ms}.
+TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry = math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000))
+return {allowed, math.floor(tokens), retry}
+"""
+
+SCRIPTS = {"sliding_window": SLIDING_WINDOW_LUA, "token_bucket": TOKEN_BUCKET_LUA}
+
+
+@dataclass(frozen=True)
+class Rate:
+    """A limit of ``limit`` requests per ``period`` seconds."""
+    limit: int
+    period: float
+
+
+@lru_cache(maxsize=64)
+def parse_rate(value: str) -> Rate:
+    """
+    Parse a rate such as ``10/minute`` or ``100/hour``.
+
+    Args:
+    - value: ``<count>/<second|minute|hour|day>``.
+
+    Returns:
+    - Rate: The parsed limit.
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*", value)
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"Invalid rate limit: {value!r}")
+    return Rate(int(match.group(1)), PERIODS[match.group(2)])
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+
+
+class RateLimitExceeded(Exception):
+    """Raised by ``rate_limit`` dependencies; rendered as 429 in ``main``."""
+
+    def __init__(self, name: str, result: RateLimitResult):
+        super().__init__(name)
+        self.name = name
+        self.result = result
+
+
+class RateLimiter:
+    """
+    Rate limiter shared by every worker through atomic Redis Lua scripts.
+
+    ``sliding_window`` keeps a sorted set of request timestamps per key;
+    ``token_bucket`` keeps a refilling token count. Each check is a single
+    script call, so concurrent workers and nodes never race. Timestamps come
+    from the calling worker, so nodes are expected to keep their clocks in
+    sync. When Redis is unavailable, or ``RATE_LIMIT_STORAGE`` is
+    ``memory``, the same algorithms run on a bounded per-process store.
+
+    Methods:
+    - hit(redis, key: str, rate: Rate) -> RateLimitResult: Count a request against ``key``.
+    - reset(): Forget every locally tracked key.
+    """
+    def __init__(
+        self,
+        algorithm: str | None = None,
+        storage: str | None = None,
+        prefix: str | None = None,
+        local_max_keys: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.algorithm = algorithm or settings.RATE_LIMIT_ALGORITHM
+        if self.algorithm not in SCRIPTS:
+            raise ValueError(f"Unknown rate limit algorithm: {self.algorithm}")
+        self.storage = storage or settings.RATE_LIMIT_STORAGE
+        self.prefix = prefix or settings.RATE_LIMIT_PREFIX
+        self.clock = clock
+        self._local = LocalCache(
+            maxsize=local_max_keys or settings.RATE_LIMIT_LOCAL_MAX_KEYS, ttl=60.0
+        )
+        self._script = None
+        self._script_client = None
+
+    def reset(self) -> None:
+        self._local.clear()
+
+    async def hit(self, redis: Redis | None, key: str, rate: Rate) -> RateLimitResult:
+        key = f"{self.prefix}:{self.algorithm}:{key}"
+        now = self.clock()
+        if redis is not None and self.storage == "redis":
+            try:
+                return await self._hit_redis(redis, key, rate, now)
+            except Exception:
+                logger.warning("Rate limit store unavailable, using local counters", exc_info=True)
+        return self._hit_local(key, rate, now)
+
+    async def _hit_redis(self, redis: Redis, key: str, rate: Rate, now: float) -> RateLimitResult:
+        if self._script is None or self._script_client is not redis:
+            self._script = redis.register_script(SCRIPTS[self.algorithm])
+            self._script_client = redis
+        if self.algorithm == "sliding_window":
+            args = [now, rate.period, rate.limit, f"{now}:{uuid.uuid4().hex}"]
+        else:
+            args = [now, rate.limit / rate.period, rate.limit]
+        allowed, remaining, retry_ms = await self._script(keys=[key], args=args)
+        return RateLimitResult(bool(allowed), rate.limit, int(remaining), int(retry_ms) / 1000)
+
+    def _hit_local(self, key: str, rate: Rate, now: float) -> RateLimitResult:
+        if self.algorithm == "sliding_window":
+            hits = self._local.get(key) or deque()
+            while hits and hits[0] <= now - rate.period:
+                hits.popleft()
+            if len(hits) < rate.limit:
+                hits.append(now)
+                result = RateLimitResult(True, rate.limit, rate.limit - len(hits), 0.0)
+            else:
+                result = RateLimitResult(False, rate.limit, 0, hits[0] + rate.period - now)
+            self._local.set(key, hits, ttl=rate.period)
+            return result
+
+        refill = rate.limit / rate.period
+        tokens, ts = self._local.get(key) or (rate.limit, now)
+        tokens = min(rate.limit, tokens + max(0.0, now - ts) * refill)
+        if tokens >= 1:
+            tokens -= 1
+            result = RateLimitResult(True, rate.limit, int(tokens), 0.0)
+        else:
+            result = RateLimitResult(False, rate.limit, 0, (1 - tokens) / refill)
+        self._local.set(key, (tokens, now), ttl=rate.period)
+        return result
+
+
+rate_limiter = RateLimiter()
+
+
+async def client_key(request: Request) -> str:
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+async def user_key(user: Principal = Depends(get_current_principal)) -> str:
+    return f"user:{user.id}"
+
+
+def rate_limit(name: str, key: Callable = client_key):
+    """
+    Build a dependency enforcing the ``RATE_LIMITS[name]`` limit.
+
+    The limit is read from settings on every request, so a missing entry
+    (or ``RATE_LIMIT_ENABLED=False``) turns the check off.
+
+    Args:
+    - name: Name of the limit in ``RATE_LIMITS``.
+    - key: Dependency returning the caller's key; ``client_key`` (IP) or ``user_key``.
+
+    Returns:
+    - Callable: A FastAPI dependency raising ``RateLimitExceeded``.
+    """
+    async def dependency(caller: str = Depends(key), r: Redis = Depends(get_redis)):
+        value = settings.RATE_LIMITS.get(name)
+        if not settings.RATE_LIMIT_ENABLED or not value:
+            return
+        result = await rate_limiter.hit(r, f"{name}:{caller}", parse_rate(value))
+        if not result.allowed:
+            raise RateLimitExceeded(name, result)
+
+    return dependency
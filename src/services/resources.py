@@ -0,0 +1,79 @@
+import logging
+
+from sqlalchemy import text
+
+from src.database.db import sessionmanager
+from src.database.redis_client import redis_manager
+from src.services.auth import Hash, hash_executor
+from src.services.invalidation import user_invalidation_bus
+from src.services.avatar_storage import create_avatar_storage
+from src.services.avatars import AvatarPipeline
+
+logger = logging.getLogger(__name__)
+
+
+class AppResources:
+    """
+    Application-wide clients shared by every request.
+
+    ``startup`` and ``shutdown`` run in the FastAPI lifespan hook. Each
+    client is also created on first use, so code running without the
+    lifespan (tests, scripts) still gets a single shared instance.
+
+    Methods:
+    - startup(): Connect Redis, build the shared clients and warm the pools.
+    - shutdown(): Stop background listeners and close every client and pool.
+    - avatars -> AvatarPipeline: Shared avatar pipeline on the configured storage.
+    - hasher -> Hash: Shared password hasher.
+    """
+    def __init__(self):
+        self._avatars: AvatarPipeline | None = None
+        self._hasher: Hash | None = None
+
+    @property
+    def avatars(self) -> AvatarPipeline:
+        if self._avatars is None:
+            self._avatars = AvatarPipeline(create_avatar_storage())
+        return self._avatars
+
+    @property
+    def hasher(self) -> Hash:
+        if self._hasher is None:
+            self._hasher = Hash()
+        return self._hasher
+
+    async def startup(self) -> None:
+        await redis_manager.connect()
+        await user_invalidation_bus.start(redis_manager.client)
+        # Build the shared clients now rather than on the first request.
+        for name in ("avatars", "hasher"):
+            getattr(self, name)
+        hash_executor.start()
+        await self._warm_up()
+
+    async def shutdown(self) -> None:
+        await user_invalidation_bus.stop()
+        await redis_manager.close()
+        await sessionmanager.close()
+        hash_executor.shutdown()
+        self._avatars = None
+        self._hasher = None
+
+    async def _warm_up(self) -> None:
+        try:
+            async with sessionmanager.session() as session:
+                await session.execute(text("SELECT 1"))
+        except Exception:
+            logger.warning("Database warm-up failed", exc_info=True)
+        try:
+            await redis_manager.client.ping()
+        except Exception:
+            logger.warning("Redis warm-up failed", exc_info=True)
+
+resources = AppResources()
+
+def get_avatar_pipeline() -> AvatarPipeline:
+    return resources.avatars
+
+def get_hasher() -> Hash:
+    return resources.hasher
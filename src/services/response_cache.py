@@ -0,0 +1,95 @@
+import logging
+import uuid
+from typing import Awaitable, Callable
+
+from fastapi import Depends, Request, Response, status
+from redis.asyncio import Redis
+
+from src.conf.config import settings
+from src.database.redis_client import get_redis
+from src.services.etag import etag_matches, make_etag
+
+logger = logging.getLogger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+class ContactResponseCache:
+    """
+    Per-user cache of serialized contact list responses.
+
+    Entries are JSON bytes keyed by user, the user's generation and the
+    request parameters. The generation is a random token: a missing one
+    (new user, flushed or evicted key) is seeded with a fresh value and
+    every write replaces it, so an ETag issued for an older generation
+    never matches again and older entries become unreachable; those expire
+    on their own after ``CONTACTS_CACHE_TTL_SECONDS``. The ETag is derived
+    from the same key, so a matching ``If-None-Match`` is answered with 304
+    without reading the entry. Redis errors are logged and the request is
+    served uncached.
+
+    ``produce`` must read from the primary: a lagging replica would store
+    a stale body under the current generation for every client of the user.
+
+    Methods:
+    - respond(request, user_id, kind, params, produce) -> Response: Serve from cache or build and store a response.
+    - invalidate(user_id): Replace the user's generation.
+    """
+    def __init__(self, redis: Redis, ttl: int | None = None):
+        self.redis = redis
+        self.ttl = settings.CONTACTS_CACHE_TTL_SECONDS if ttl is None else ttl
+
+    @staticmethod
+    def _generation_key(user_id: int) -> str:
+        return f"contacts:gen:{user_id}"
+
+    async def _generation(self, user_id: int) -> str:
+        key = self._generation_key(user_id)
+        value = await self.redis.get(key)
+        if value is None:
+            await self.redis.set(key, uuid.uuid4().hex, nx=True)
+            value = await self.redis.get(key)
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    async def respond(
+        self,
+        request: Request,
+        user_id: int,
+        kind: str,
+        params: tuple,
+        produce: Callable[[], Awaitable[bytes]],
+    ) -> Response:
+        try:
+            generation = await self._generation(user_id)
+        except Exception:
+            logger.warning("Contacts cache unavailable", exc_info=True)
+            return Response(await produce(), media_type=JSON_MEDIA_TYPE)
+
+        etag = make_etag(user_id, generation, kind, *params)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        key = f"contacts:resp:{user_id}:{etag}"
+        try:
+            body = await self.redis.get(key)
+        except Exception:
+            logger.warning("Contacts cache read failed", exc_info=True)
+            body = None
+        if body is None:
+            body = await produce()
+            try:
+                await self.redis.set(key, body, ex=self.ttl)
+            except Exception:
+                logger.warning("Contacts cache write failed", exc_info=True)
+        return Response(body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+    async def invalidate(self, user_id: int) -> None:
+        try:
+            await self.redis.set(self._generation_key(user_id), uuid.uuid4().hex)
+        except Exception:
+            logger.warning("Contacts cache invalidation failed for %s", user_id, exc_info=True)
+
+
+async def get_contacts_cache(r: Redis = Depends(get_redis)) -> ContactResponseCache:
+    return ContactResponseCache(r)
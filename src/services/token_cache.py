@@ -0,0 +1,52 @@
+import hashlib
+import time
+from typing import Callable
+
+from src.conf.config import settings
+from src.services.local_cache import LocalCache
+
+
+class VerifiedTokenCache:
+    """
+    Per-worker memo of access tokens whose signature was already verified.
+
+    Entries are keyed by a SHA-256 digest of the token, so raw bearer tokens
+    are never held in memory, and expire no later than the token's ``exp``
+    claim. Tokens without ``exp`` are not cached.
+
+    Methods:
+    - get(token) -> dict | None: Claims of a previously verified, unexpired token.
+    - set(token, payload): Remember the claims of a verified token.
+    - revoke(token): Forget a single token, e.g. on logout.
+    - revoke_subject(subject) -> int: Forget every token issued to a subject, e.g. on password reset.
+    - stats() -> dict: Size and hit/miss/eviction counters.
+    """
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.time):
+        self._cache = LocalCache(maxsize=maxsize, ttl=0)
+        self._clock = clock
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        return self._cache.get(self._key(token))
+
+    def set(self, token: str, payload: dict) -> None:
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        ttl = exp - self._clock()
+        if ttl > 0:
+            self._cache.set(self._key(token), payload, ttl=ttl)
+
+    def revoke(self, token: str) -> None:
+        self._cache.pop(self._key(token))
+
+    def revoke_subject(self, subject: str) -> int:
+        return self._cache.discard_if(lambda payload: payload.get("sub") == subject)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+verified_token_cache = VerifiedTokenCache(maxsize=settings.TOKEN_CACHE_SIZE)
@@ -0,0 +1,106 @@
+import json
+
+from src.database.models import UserRole
+
+CACHE_VERSION = 1
+
+
+class CachedUser:
+    """
+    Lightweight, slotted snapshot of a user stored in the user cache.
+
+    It carries the public ``src.schemas.User`` fields plus ``confirmed`` and
+    never the password hash or SQLAlchemy instance state.
+
+    Methods:
+    - from_user(user) -> CachedUser: Build a snapshot from a ``User`` model or any object with the same attributes.
+    """
+    __slots__ = ("id", "username", "email", "avatar", "role", "confirmed")
+
+    def __init__(
+        self,
+        id: int,
+        username: str,
+        email: str,
+        avatar: str | None,
+        role: UserRole,
+        confirmed: bool,
+    ):
+        self.id = id
+        self.username = username
+        self.email = email
+        self.avatar = avatar
+        self.role = UserRole(role)
+        self.confirmed = bool(confirmed)
+
+    @classmethod
+    def from_user(cls, user) -> "CachedUser":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            avatar=user.avatar,
+            role=user.role or UserRole.USER,
+            confirmed=user.confirmed,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, CachedUser):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self):
+        return f"CachedUser(id={self.id!r}, username={self.username!r})"
+
+
+def encode_user(user: CachedUser) -> bytes:
+    """
+    Encode a cached user as a compact, version-tagged JSON array.
+
+    Args:
+    - user: Snapshot to encode.
+
+    Returns:
+    - bytes: Payload ready to be stored in Redis.
+    """
+    return json.dumps(
+        [
+            CACHE_VERSION,
+            user.id,
+            user.username,
+            user.email,
+            user.avatar,
+            user.role.value,
+            user.confirmed,
+        ],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode()
+
+
+def decode_user(payload: bytes | str | None) -> CachedUser | None:
+    """
+    Decode a payload produced by ``encode_user``.
+
+    Anything that is missing, malformed or written with another
+    ``CACHE_VERSION`` is reported as a cache miss.
+
+    Args:
+    - payload: Raw value read from the cache.
+
+    Returns:
+    - CachedUser | None: Decoded user, or None on a miss.
+    """
+    if payload is None:
+        return None
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(data, list) or len(data) != 7 or data[0] != CACHE_VERSION:
+        return None
+    _, user_id, username, email, avatar, role, confirmed = data
+    try:
+        return CachedUser(user_id, username, email, avatar, role, confirmed)
+    except ValueError:
+        return None
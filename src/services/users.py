@@ -1,21 +1,16 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
 
 from src.repository.users import UserRepository
 from src.schemas import UserCreate
+from src.services.avatar_storage import AvatarResolver, gravatar
 
 class UserService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, default_avatars: AvatarResolver | None = None):
         self.repository = UserRepository(db)
+        self.default_avatars = default_avatars or gravatar
 
     async def create_user(self, body: UserCreate):
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:
-            print(e)
-
+        avatar = self.default_avatars.url(body.email)
         return await self.repository.create_user(body, avatar)
 
     async def get_user_by_id(self, user_id: int):
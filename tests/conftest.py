@@ -9,8 +9,11 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from main import app
 from src.database.models import Base, User, Contact
-from src.database.db import get_db
+from src.database.db import get_db, get_read_db, get_session_factory
+from src.database.redis_client import get_redis
 from src.services.auth import create_access_token, Hash
+from src.services.invalidation import user_invalidation_bus
+from src.services.rate_limit import rate_limiter
 
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
@@ -75,6 +78,32 @@ def init_models_wrap():
             await session.commit()
 
     asyncio.run(init_models())
+    fake_redis.store.clear()
+    rate_limiter.reset()
+
+
+class FakeRedis:
+    """In-memory stand-in for the shared asyncio Redis client."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        self.store[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+
+fake_redis = FakeRedis()
 
 
 @pytest.fixture(scope="module")
@@ -89,7 +118,17 @@ def client():
                 await session.rollback()
                 raise
 
+    async def override_get_redis():
+        return fake_redis
+
+    async def override_get_session_factory():
+        return TestingSessionLocal
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = override_get_session_factory
+    app.dependency_overrides[get_redis] = override_get_redis
+    user_invalidation_bus.store = lambda: fake_redis
 
     yield TestClient(app)
 
@@ -0,0 +1,53 @@
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+from unittest.mock import AsyncMock
+
+from src.conf.config import settings
+from src.database.models import User, UserRole
+from src.services.auth import Principal, create_access_token, get_current_principal
+from src.services.user_cache import CachedUser, encode_user
+
+
+def make_user():
+    return User(id=7, username="principal", email="principal@example.com", avatar="", confirmed=True, role=UserRole.ADMIN)
+
+@pytest.mark.asyncio
+async def test_access_token_embeds_principal_claims():
+    token = await create_access_token(data={"sub": "principal"}, user=make_user())
+
+    payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+
+    assert payload["id"] == 7
+    assert payload["role"] == "admin"
+    assert payload["confirmed"] is True
+
+@pytest.mark.asyncio
+async def test_principal_is_resolved_without_io():
+    token = await create_access_token(data={"sub": "principal"}, user=make_user())
+
+    principal = await get_current_principal(token, db=None, r=None)
+
+    assert isinstance(principal, Principal)
+    assert principal.id == 7
+    assert principal.username == "principal"
+    assert principal.role is UserRole.ADMIN
+
+@pytest.mark.asyncio
+async def test_principal_falls_back_to_user_lookup_for_plain_tokens():
+    token = await create_access_token(data={"sub": "legacy"})
+    cached = CachedUser(3, "legacy", "legacy@example.com", None, UserRole.USER, True)
+    r = AsyncMock()
+    r.get.return_value = encode_user(cached)
+
+    principal = await get_current_principal(token, db=None, r=r)
+
+    r.get.assert_awaited_once_with("legacy")
+    assert principal.id == 3
+
+@pytest.mark.asyncio
+async def test_principal_rejects_invalid_token():
+    with pytest.raises(HTTPException) as exc:
+        await get_current_principal("invalid token", db=None, r=None)
+
+    assert exc.value.status_code == 401
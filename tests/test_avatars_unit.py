@@ -0,0 +1,122 @@
+import io
+from urllib.parse import urlsplit
+
+import pytest
+from fastapi import UploadFile
+from PIL import Image
+
+from src.services.avatar_storage import (
+    AvatarStorage,
+    GravatarResolver,
+    LocalStorage,
+    MemoryStorage,
+    create_avatar_storage,
+)
+from src.services.avatars import AvatarError, AvatarPipeline, AvatarTooLarge, process_avatar
+
+
+def image_bytes(size, mode="RGB", fmt="PNG"):
+    out = io.BytesIO()
+    Image.new(mode, size).save(out, format=fmt)
+    return out.getvalue()
+
+
+class CountingFile(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+@pytest.mark.parametrize("size,mode", [((640, 480), "RGB"), ((100, 300), "RGBA"), ((20, 20), "P")])
+def test_process_avatar_crops_to_square(size, mode):
+    data = process_avatar(image_bytes(size, mode), 250, 10_000_000)
+
+    with Image.open(io.BytesIO(data)) as image:
+        assert (image.format, image.mode, image.size) == ("JPEG", "RGB", (250, 250))
+
+
+def test_process_avatar_rejects_invalid_and_huge_images():
+    with pytest.raises(AvatarError):
+        process_avatar(b"not an image", 250, 10_000_000)
+    with pytest.raises(AvatarError):
+        process_avatar(image_bytes((200, 200)), 250, 100 * 100)
+
+
+@pytest.mark.asyncio
+async def test_read_stops_at_size_limit():
+    file = CountingFile(b"x" * 10_000)
+    pipeline = AvatarPipeline(MemoryStorage(), max_bytes=2_000, chunk_size=500)
+
+    with pytest.raises(AvatarTooLarge):
+        await pipeline.read(UploadFile(file))
+
+    assert file.reads == 5
+
+
+@pytest.mark.asyncio
+async def test_read_rejects_declared_size_without_reading():
+    file = CountingFile(b"x" * 10_000)
+    pipeline = AvatarPipeline(MemoryStorage(), max_bytes=2_000)
+
+    with pytest.raises(AvatarTooLarge):
+        await pipeline.read(UploadFile(file, size=10_000))
+
+    assert file.reads == 0
+
+
+@pytest.mark.asyncio
+async def test_update_saves_to_storage():
+    storage = MemoryStorage()
+    pipeline = AvatarPipeline(storage, size=64)
+
+    url = await pipeline.update(UploadFile(io.BytesIO(image_bytes((300, 200)))), "deadpool")
+
+    assert url.startswith("memory://avatars/deadpool?v=")
+    assert storage.files["deadpool"][1] == "image/jpeg"
+
+
+@pytest.mark.asyncio
+async def test_local_storage_writes_inside_root(tmp_path):
+    storage = LocalStorage(tmp_path, "/static/avatars/")
+
+    url = await storage.save("../evil/name", b"data", "image/jpeg")
+
+    assert [p.name for p in tmp_path.iterdir()] == ["..%2Fevil%2Fname.jpg"]
+    assert (tmp_path / "..%2Fevil%2Fname.jpg").read_bytes() == b"data"
+    assert urlsplit(url).path == "/static/avatars/..%252Fevil%252Fname.jpg"
+
+
+def test_create_avatar_storage():
+    assert isinstance(create_avatar_storage("memory"), MemoryStorage)
+    with pytest.raises(ValueError):
+        create_avatar_storage("ftp")
+
+
+def test_gravatar_is_not_an_upload_backend():
+    assert not isinstance(GravatarResolver(), AvatarStorage)
+    with pytest.raises(ValueError, match="Unknown avatar storage backend"):
+        create_avatar_storage("gravatar")
+
+
+def test_gravatar_url_is_computed_locally():
+    resolver = GravatarResolver()
+
+    assert resolver.url(" Foo@Example.com ") == (
+        "https://www.gravatar.com/avatar/b48def645758b95537d4424c84d1a9ff"
+    )
+    assert resolver.url("foo@example.com") == resolver.url("FOO@example.com ")
+
+
+def test_gravatar_cache_is_bounded():
+    resolver = GravatarResolver(cache_size=2)
+
+    for email in ("a@example.com", "b@example.com", "a@example.com", "c@example.com"):
+        resolver.url(email)
+
+    stats = resolver.cache.stats()
+    assert (stats["size"], stats["hits"], stats["evictions"]) == (2, 1, 1)
+
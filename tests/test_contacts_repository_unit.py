@@ -1,6 +1,7 @@
 import datetime
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.schemas import ContactBase, ContactUpdate
 
@@ -67,7 +68,7 @@ async def test_create_contact(contacts_repository, mock_session, user):
     # Setup
     contact_data = ContactBase(id=2, first_name="TTT", last_name="T", email="T@example.com", phone="0991111111", birthday="2020-10-20", additional_info="", user=None)
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
+    mock_result.scalar_one.return_value = Contact(
         id=1, first_name=contact_data.first_name, last_name=contact_data.last_name, email=contact_data.email,phone=contact_data.phone, birthday=contact_data.birthday, additional_info=contact_data.additional_info, user=user
     )
     mock_session.execute = AsyncMock(return_value=mock_result)
@@ -75,6 +76,11 @@ async def test_create_contact(contacts_repository, mock_session, user):
     # Call method
     result = await contacts_repository.create_contact(body=contact_data, user=user)
 
+    # Single INSERT ... RETURNING, no refresh or re-select
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+    mock_session.refresh.assert_not_awaited()
+
     # Assertions
     assert isinstance(result, Contact)
     assert result.first_name == "TTT"
@@ -84,14 +90,36 @@ async def test_create_contact(contacts_repository, mock_session, user):
     assert result.birthday == datetime.date(2020, 10, 20)
     assert result.additional_info == ""
 
+@pytest.mark.asyncio
+async def test_create_contacts(contacts_repository, mock_session, user):
+    # Setup
+    bodies = [
+        ContactBase(first_name="A", last_name="A", email="a@example.com", phone="0991111111", birthday="2020-10-20", additional_info=""),
+        ContactBase(first_name="B", last_name="B", email="b@example.com", phone="0992222222", birthday="2021-01-05", additional_info="note"),
+    ]
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [10, 11]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    # Call method
+    result = await contacts_repository.create_contacts(bodies, user)
+
+    # Assertions
+    assert result == [10, 11]
+    mock_session.execute.assert_awaited_once()
+    rows = mock_session.execute.await_args.args[1]
+    assert [row["birthday_md"] for row in rows] == [1020, 105]
+    assert {row["user_id"] for row in rows} == {user.id}
+    mock_session.commit.assert_awaited_once()
+
 @pytest.mark.asyncio
 async def test_update_contact(contacts_repository, mock_session, user):
     # Setup
     contact_data = ContactUpdate(id=2, first_name="UpdatedTTT", last_name="T", email="T@example.com", phone="0991111111", birthday="1997-10-20", additional_info="Good person", user=None)
-    existing_contact = Contact(id=2, first_name="TTT", last_name="T", email="T@example.com", phone="0991111111", birthday="2020-10-20", additional_info="", user=None)
+    updated_contact = Contact(id=1, user=None, **contact_data.model_dump())
 
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
+    mock_result.scalar_one_or_none.return_value = updated_contact
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     # Call method
@@ -107,8 +135,9 @@ async def test_update_contact(contacts_repository, mock_session, user):
     assert result.phone == "0991111111"
     assert result.birthday == datetime.date(1997, 10, 20)
     assert result.additional_info == "Good person"
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(existing_contact)
+    mock_session.refresh.assert_not_awaited()
 
 @pytest.mark.asyncio
 async def test_remove_contact(contacts_repository, mock_session, user):
@@ -129,5 +158,25 @@ async def test_remove_contact(contacts_repository, mock_session, user):
     assert result.phone == "0991111111"
     assert result.birthday == datetime.date(2020, 10, 20)
     assert result.additional_info == ""
-    mock_session.delete.assert_awaited_once_with(existing_contact)
+    mock_session.execute.assert_awaited_once()
+    mock_session.delete.assert_not_awaited()
     mock_session.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_search_contacts_uses_trigram_similarity_on_postgres(contacts_repository, mock_session, user):
+    # Setup
+    mock_session.bind = MagicMock()
+    mock_session.bind.dialect.name = "postgresql"
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    # Call method
+    await contacts_repository.search_contacts(query="alice", limit=10, user=user)
+
+    # Assertions
+    stmt = mock_session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "similarity(contacts.first_name" in sql
+    assert "contacts.last_name %% " in sql
+    assert "ORDER BY greatest(" in sql
@@ -0,0 +1,56 @@
+import pytest
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from src.services.email import TEMPLATE_FOLDER
+from src.services.email_templates import EmailTemplateRenderer
+
+
+jinja = Environment(
+    loader=FileSystemLoader(TEMPLATE_FOLDER), autoescape=select_autoescape(["html"])
+)
+
+
+@pytest.mark.parametrize("email_type", ["verify_email", "reset_password"])
+@pytest.mark.parametrize(
+    "username", ["deadpool", "<b>Tom & \"Jerry\"</b>", "Олена"]
+)
+def test_render_matches_jinja(email_type, username):
+    renderer = EmailTemplateRenderer(TEMPLATE_FOLDER)
+    fields = {"username": username, "host": "http://test/", "token": "a.b-c_d"}
+
+    expected = jinja.get_template(f"{email_type}.html").render(**fields)
+
+    assert renderer.render(email_type, **fields) == expected
+
+
+def test_templates_are_compiled_once(monkeypatch):
+    renderer = EmailTemplateRenderer(TEMPLATE_FOLDER)
+    renderer.load()
+    calls = []
+    original = renderer.env.get_template
+    monkeypatch.setattr(
+        renderer.env, "get_template", lambda name: calls.append(name) or original(name)
+    )
+
+    for _ in range(3):
+        renderer.render("verify_email", "deadpool", "http://test/", "token")
+
+    assert calls == []
+    assert renderer._compiled["verify_email"].parts is not None
+
+
+def test_template_with_filters_falls_back_to_jinja(tmp_path):
+    (tmp_path / "shout.html").write_text("<p>{{ username|upper }} {{ host }}{{ token }}</p>")
+    renderer = EmailTemplateRenderer(tmp_path)
+
+    html = renderer.render("shout", "deadpool", "http://test/", "t")
+
+    assert html == "<p>DEADPOOL http://test/t</p>"
+    assert renderer._compiled["shout"].parts is None
+
+
+def test_unknown_template():
+    renderer = EmailTemplateRenderer(TEMPLATE_FOLDER)
+
+    with pytest.raises(ValueError):
+        renderer.render("missing", "deadpool", "http://test/", "token")
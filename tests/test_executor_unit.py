@@ -0,0 +1,66 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.services.auth import Hash
+from src.services.executor import BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_run_executes_off_the_event_loop():
+    executor = BoundedExecutor(max_workers=1)
+    loop_thread = threading.get_ident()
+
+    worker_thread = await executor.run(threading.get_ident)
+
+    assert worker_thread != loop_thread
+    assert executor.stats()["completed"] == 1
+    executor.shutdown()
+
+@pytest.mark.asyncio
+async def test_queue_depth_is_tracked():
+    executor = BoundedExecutor(max_workers=1)
+    release = threading.Event()
+
+    tasks = [asyncio.create_task(executor.run(release.wait)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    assert executor.stats()["in_flight"] == 3
+    assert executor.stats()["queue_depth"] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert executor.stats()["queue_depth"] == 0
+    assert executor.stats()["max_queue_depth"] == 2
+    executor.shutdown()
+
+@pytest.mark.asyncio
+async def test_failures_are_counted():
+    executor = BoundedExecutor(max_workers=1)
+
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(divmod, 1, 0)
+
+    assert executor.stats()["failed"] == 1
+    executor.shutdown()
+
+def test_start_creates_the_pool_once():
+    executor = BoundedExecutor(max_workers=1)
+
+    executor.start()
+    pool = executor._executor
+    executor.start()
+
+    assert pool is not None and executor.executor is pool
+    executor.shutdown()
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        BoundedExecutor(max_workers=1, kind="fiber")
+
+@pytest.mark.asyncio
+async def test_hash_async_round_trip():
+    hashed = await Hash().get_password_hash_async("12345678")
+
+    assert await Hash().verify_password_async("12345678", hashed)
+    assert not await Hash().verify_password_async("password", hashed)
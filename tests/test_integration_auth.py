@@ -1,10 +1,11 @@
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
 
 from tests.conftest import TestingSessionLocal
-from src.database.models import User
+from src.database.models import EmailOutbox, EmailStatus, User
 from src.services.auth import create_email_token
 
 
@@ -16,20 +17,40 @@ user_data = {
 }
 
 
-def test_signup(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+@pytest.mark.asyncio
+async def test_signup(client):
     response = client.post("api/auth/register", json=user_data)
     assert response.status_code == 201, response.text
     data = response.json()
     assert data["username"] == user_data["username"]
     assert data["email"] == user_data["email"]
     assert "hashed_password" not in data
-    assert "avatar" in data
+    assert data["avatar"] == "https://www.gravatar.com/avatar/4b9bd404a9e8e28693d0ee079f3f3d57"
+
+    async with TestingSessionLocal() as session:
+        queued = (await session.execute(select(EmailOutbox))).scalars().all()
+    assert [(m.recipient, m.email_type, m.status) for m in queued] == [
+        (user_data["email"], "verify_email", EmailStatus.PENDING)
+    ]
+
+@pytest.mark.asyncio
+async def test_signup_and_email_are_committed_together(client, monkeypatch):
+    async def failing_enqueue(self, *args, **kwargs):
+        raise OperationalError("INSERT INTO email_outbox", {}, Exception("crash"))
+
+    monkeypatch.setattr("src.repository.outbox.OutboxRepository.enqueue", failing_enqueue)
+    body = {**user_data, "username": "crash", "email": "crash@example.com"}
+
+    with pytest.raises(OperationalError):
+        client.post("api/auth/register", json=body)
+
+    async with TestingSessionLocal() as session:
+        user = await session.scalar(select(User).filter_by(email=body["email"]))
+    assert user is None
 
 def test_repeat_signup(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    mock_queue_email = AsyncMock()
+    monkeypatch.setattr("src.api.auth.queue_email", mock_queue_email)
     response = client.post("api/auth/register", json=user_data)
     assert response.status_code == 409, response.text
     data = response.json()
@@ -132,8 +153,8 @@ def test_request_email(client, monkeypatch):
     monkeypatch.setattr(
         "src.services.users.UserService.get_user_by_email", mock_get_user_by_email
     )
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    mock_queue_email = AsyncMock()
+    monkeypatch.setattr("src.api.auth.queue_email", mock_queue_email)
     response = client.post("api/auth/request_email", json={"email": user_data["email"]})
     assert response.status_code == 200
     data = response.json()
@@ -141,8 +162,8 @@ def test_request_email(client, monkeypatch):
 
 @pytest.mark.asyncio
 async def test_reset_password(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    mock_queue_email = AsyncMock()
+    monkeypatch.setattr("src.api.auth.queue_email", mock_queue_email)
 
     body = {"email": user_data.get("email")}
     response = client.post("api/auth/request_password_reset", json=body)
@@ -151,16 +172,16 @@ async def test_reset_password(client, monkeypatch):
     assert response.json() == {
         "message": "Лист для скидання пароля надіслано на вашу електронну адресу"
     }
-    mock_send_email.assert_called_once()
+    mock_queue_email.assert_awaited_once()
 
 @pytest.mark.asyncio
 async def test_reset_password_not_confirmed(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    mock_queue_email = AsyncMock()
+    monkeypatch.setattr("src.api.auth.queue_email", mock_queue_email)
 
     body = {"email": "nonexistent@example.com"}
     response = client.post("api/auth/request_password_reset", json=body)
 
     assert response.status_code == 404
     assert response.json() == {"detail": "Користувач не знайдений"}
-    mock_send_email.assert_not_called()
+    mock_queue_email.assert_not_awaited()
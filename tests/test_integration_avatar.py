@@ -0,0 +1,106 @@
+import asyncio
+import io
+
+import pytest
+import pytest_asyncio
+from PIL import Image
+from sqlalchemy import select
+
+from conftest import TestingSessionLocal
+from main import app
+from src.database.models import User, UserRole
+from src.services.auth import Hash, create_access_token
+from src.services.avatar_storage import MemoryStorage
+from src.services.avatars import AvatarPipeline
+from src.services.resources import get_avatar_pipeline
+
+
+admin = {"username": "admin", "email": "admin@example.com", "password": "12345678"}
+storage = MemoryStorage()
+
+
+def image_bytes(size=(640, 480), fmt="PNG", mode="RGBA", color=(200, 10, 10, 255)):
+    out = io.BytesIO()
+    Image.new(mode, size, color[: len(mode)]).save(out, format=fmt)
+    return out.getvalue()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def admin_user():
+    async def create():
+        async with TestingSessionLocal() as session:
+            session.add(
+                User(
+                    username=admin["username"],
+                    email=admin["email"],
+                    hashed_password=Hash().get_password_hash(admin["password"]),
+                    confirmed=True,
+                    role=UserRole.ADMIN,
+                )
+            )
+            await session.commit()
+
+    asyncio.run(create())
+    app.dependency_overrides[get_avatar_pipeline] = lambda: AvatarPipeline(
+        storage, max_bytes=64 * 1024, chunk_size=1024
+    )
+    yield
+    app.dependency_overrides.pop(get_avatar_pipeline)
+
+
+@pytest_asyncio.fixture()
+async def headers():
+    token = await create_access_token(data={"sub": admin["username"]})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_update_avatar(client, headers):
+    files = {"file": ("avatar.png", image_bytes(), "image/png")}
+
+    response = client.patch("/api/users/avatar", headers=headers, files=files)
+
+    assert response.status_code == 200, response.text
+    avatar = response.json()["avatar"]
+    assert avatar.startswith("memory://avatars/admin?v=")
+    data, content_type = storage.files["admin"]
+    assert content_type == "image/jpeg"
+    with Image.open(io.BytesIO(data)) as stored:
+        assert (stored.format, stored.size) == ("JPEG", (250, 250))
+
+    async def saved_avatar():
+        async with TestingSessionLocal() as session:
+            user = await session.scalar(select(User).where(User.username == admin["username"]))
+            return user.avatar
+
+    assert asyncio.run(saved_avatar()) == avatar
+
+
+def test_update_avatar_too_large(client, headers):
+    files = {"file": ("avatar.bmp", b"\0" * (64 * 1024 + 1), "image/bmp")}
+
+    response = client.patch("/api/users/avatar", headers=headers, files=files)
+
+    assert response.status_code == 413, response.text
+    assert response.json()["detail"] == "Файл завеликий"
+
+
+def test_update_avatar_not_an_image(client, headers):
+    files = {"file": ("avatar.png", b"not an image", "image/png")}
+
+    response = client.patch("/api/users/avatar", headers=headers, files=files)
+
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Некоректне зображення"
+
+
+def test_me_reflects_avatar_update(client, headers):
+    before = client.get("/api/users/me", headers=headers)
+    assert before.status_code == 200, before.text
+    files = {"file": ("avatar.png", image_bytes(color=(10, 200, 10, 255)), "image/png")}
+
+    updated = client.patch("/api/users/avatar", headers=headers, files=files)
+    after = client.get("/api/users/me", headers=headers)
+
+    assert after.status_code == 200, after.text
+    assert after.json()["avatar"] == updated.json()["avatar"]
+    assert after.headers["etag"] != before.headers["etag"]
@@ -0,0 +1,68 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import TestingSessionLocal, test_user
+from src.database.models import Contact
+from src.repository.contacts import ContactRepository
+
+
+def make_contact(first_name, birthday):
+    return Contact(
+        first_name=first_name,
+        last_name="Birthday",
+        email=f"{first_name.lower()}@example.com",
+        phone="0999999999",
+        birthday=birthday,
+        additional_info="",
+        user_id=test_user["id"],
+    )
+
+@pytest.mark.asyncio
+async def test_birthday_md_follows_birthday():
+    contact = make_contact("Sync", date(1990, 12, 31))
+    assert contact.birthday_md == 1231
+
+    contact.birthday = date(1990, 2, 28)
+    assert contact.birthday_md == 228
+
+@pytest.mark.asyncio
+async def test_upcoming_birthdays_wrap_around_new_year():
+    async with TestingSessionLocal() as session:
+        session.add_all(
+            [
+                make_contact("Eve", date(1985, 12, 31)),
+                make_contact("Newyear", date(1990, 1, 1)),
+                make_contact("January", date(2000, 1, 3)),
+                make_contact("Late", date(1995, 1, 10)),
+                make_contact("Summer", date(1995, 6, 15)),
+            ]
+        )
+        await session.commit()
+
+        repository = ContactRepository(session)
+        user = SimpleNamespace(id=test_user["id"])
+        contacts = await repository.get_upcoming_birthdays(user, days=7, today=date(2026, 12, 28))
+
+    assert [c.first_name for c in contacts] == ["Eve", "Newyear", "January"]
+
+@pytest.mark.asyncio
+async def test_upcoming_birthdays_within_one_year():
+    async with TestingSessionLocal() as session:
+        repository = ContactRepository(session)
+        user = SimpleNamespace(id=test_user["id"])
+        contacts = await repository.get_upcoming_birthdays(user, days=30, today=date(2026, 6, 1))
+
+    assert [c.first_name for c in contacts] == ["Summer"]
+
+def test_birthdays_endpoint_window(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    response = client.get("/api/contacts/birthdays", headers=headers)
+    assert response.status_code == 200, response.text
+    assert "Alice" in [c["first_name"] for c in response.json()]
+
+    response = client.get("/api/contacts/birthdays", params={"days": 3}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert "Alice" not in [c["first_name"] for c in response.json()]
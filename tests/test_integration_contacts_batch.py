@@ -0,0 +1,107 @@
+import pytest
+
+
+def contact(first_name, **fields):
+    return {
+        "first_name": first_name,
+        "last_name": "Batch",
+        "email": f"{first_name.lower()}@example.com",
+        "phone": "0501234567",
+        "birthday": "1990-03-04",
+        "additional_info": "",
+        **fields,
+    }
+
+def batch(client, token, operations):
+    return client.post(
+        "/api/contacts/batch",
+        json={"operations": operations},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+def get_contact(client, token, contact_id):
+    return client.get(
+        f"/api/contacts/{contact_id}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+def test_batch_mixed_operations(client, get_token):
+    response = batch(
+        client,
+        get_token,
+        [
+            {"op": "create", "data": contact("First")},
+            {"op": "create", "data": contact("Second")},
+            {"op": "create", "data": contact("Third")},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    created = response.json()["results"]
+    assert [item["status"] for item in created] == ["created"] * 3
+    first_id, second_id, third_id = [item["id"] for item in created]
+    assert get_contact(client, get_token, second_id).json()["first_name"] == "Second"
+
+    response = batch(
+        client,
+        get_token,
+        [
+            {"op": "update", "id": first_id, "data": contact("Renamed", birthday="1991-12-31")},
+            {"op": "delete", "id": second_id},
+            {"op": "create", "data": contact("Fourth")},
+            {"op": "delete", "id": 999999},
+            {"op": "update", "id": third_id, "data": contact("Third", additional_info="vip")},
+        ],
+    )
+
+    assert response.status_code == 200, response.text
+    results = response.json()["results"]
+    assert [item["index"] for item in results] == [0, 1, 2, 3, 4]
+    assert [item["status"] for item in results] == [
+        "updated", "deleted", "created", "not_found", "updated",
+    ]
+    renamed = get_contact(client, get_token, first_id).json()
+    assert renamed["first_name"] == "Renamed"
+    assert renamed["birthday"] == "1991-12-31"
+    assert get_contact(client, get_token, second_id).status_code == 404
+    assert get_contact(client, get_token, third_id).json()["additional_info"] == "vip"
+    assert get_contact(client, get_token, results[2]["id"]).json()["first_name"] == "Fourth"
+
+def test_batch_rejects_repeated_ids(client, get_token):
+    response = batch(
+        client,
+        get_token,
+        [
+            {"op": "update", "id": 1, "data": contact("Again")},
+            {"op": "delete", "id": 1},
+        ],
+    )
+
+    assert response.status_code == 422, response.text
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"op": "create", "data": contact("Broken", birthday=None)},
+        {"op": "update", "id": 1, "data": contact("Broken", birthday=None)},
+    ],
+)
+def test_batch_with_null_birthday_is_rejected(client, get_token, operation):
+    response = batch(client, get_token, [{"op": "create", "data": contact("Kept")}, operation])
+
+    assert response.status_code == 422, response.text
+    assert "birthday: Field required" in response.text
+    listing = client.get(
+        "/api/contacts",
+        params={"query": "Kept"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert listing.json() == []
+
+def test_batch_defaults_null_additional_info(client, get_token):
+    response = batch(
+        client, get_token, [{"op": "create", "data": contact("NoInfo", additional_info=None)}]
+    )
+
+    assert response.status_code == 200, response.text
+    contact_id = response.json()["results"][0]["id"]
+    assert get_contact(client, get_token, contact_id).json()["additional_info"] == ""
@@ -0,0 +1,80 @@
+from conftest import fake_redis
+from main import app
+from src.database.db import get_read_db
+
+
+def auth(token, **headers):
+    return {"Authorization": f"Bearer {token}", **headers}
+
+def cached_keys():
+    return [key for key in fake_redis.store if key.startswith("contacts:resp:")]
+
+def test_list_is_cached_with_etag(client, get_token):
+    first = client.get("/api/contacts", headers=auth(get_token))
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert len(cached_keys()) == 1
+
+    second = client.get("/api/contacts", headers=auth(get_token))
+    assert second.headers["etag"] == etag
+    assert second.json() == first.json()
+
+    not_modified = client.get("/api/contacts", headers=auth(get_token, **{"If-None-Match": etag}))
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    other_params = client.get("/api/contacts", params={"limit": 5}, headers=auth(get_token))
+    assert other_params.headers["etag"] != etag
+
+def test_writes_invalidate_cached_lists(client, get_token):
+    before = client.get("/api/contacts", headers=auth(get_token))
+    birthdays_before = client.get("/api/contacts/birthdays", headers=auth(get_token))
+
+    response = client.post(
+        "/api/contacts",
+        json={
+            "first_name": "Cached",
+            "last_name": "Contact",
+            "email": "cached@example.com",
+            "phone": "0501234567",
+            "birthday": "1990-01-01",
+            "additional_info": "",
+        },
+        headers=auth(get_token),
+    )
+    assert response.status_code == 201, response.text
+    contact_id = response.json()["id"]
+
+    after = client.get(
+        "/api/contacts", headers=auth(get_token, **{"If-None-Match": before.headers["etag"]})
+    )
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert contact_id in [item["id"] for item in after.json()]
+
+    birthdays_after = client.get(
+        "/api/contacts/birthdays",
+        headers=auth(get_token, **{"If-None-Match": birthdays_before.headers["etag"]}),
+    )
+    assert birthdays_after.status_code == 200
+
+    response = client.delete(f"/api/contacts/{contact_id}", headers=auth(get_token))
+    assert response.status_code == 200
+    after_delete = client.get("/api/contacts", headers=auth(get_token))
+    assert contact_id not in [item["id"] for item in after_delete.json()]
+
+def test_cached_lists_are_filled_from_the_primary(client, get_token):
+    async def lagging_replica():
+        raise AssertionError("cached responses must not read from a replica")
+        yield
+
+    override = app.dependency_overrides[get_read_db]
+    app.dependency_overrides[get_read_db] = lagging_replica
+    fake_redis.store.clear()
+    try:
+        assert client.get("/api/contacts", headers=auth(get_token)).status_code == 200
+        assert client.get("/api/contacts/birthdays", headers=auth(get_token)).status_code == 200
+    finally:
+        app.dependency_overrides[get_read_db] = override
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from src.services.etag import parse_version_etag, version_etag
+
+
+def auth(token, **headers):
+    return {"Authorization": f"Bearer {token}", **headers}
+
+contact = {
+    "first_name": "Tagged",
+    "last_name": "Contact",
+    "email": "tagged@example.com",
+    "phone": "0501234567",
+    "birthday": "1990-01-01",
+    "additional_info": "",
+}
+
+def create(client, token):
+    response = client.post("/api/contacts", json=contact, headers=auth(token))
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+def test_read_contact_conditional_get(client, get_token):
+    contact_id = create(client, get_token)
+
+    response = client.get(f"/api/contacts/{contact_id}", headers=auth(get_token))
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert parse_version_etag(etag)[0] == contact_id
+
+    response = client.get(
+        f"/api/contacts/{contact_id}", headers=auth(get_token, **{"If-None-Match": etag})
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = client.get(
+        f"/api/contacts/{contact_id}", headers=auth(get_token, **{"If-None-Match": 'W/"0-0"'})
+    )
+    assert response.status_code == 200
+
+def test_update_with_if_match(client, get_token):
+    contact_id = create(client, get_token)
+    etag = client.get(f"/api/contacts/{contact_id}", headers=auth(get_token)).headers["etag"]
+    _, updated_at = parse_version_etag(etag)
+    stale = version_etag(contact_id, updated_at - timedelta(seconds=5))
+
+    response = client.put(
+        f"/api/contacts/{contact_id}",
+        json={**contact, "first_name": "Lost"},
+        headers=auth(get_token, **{"If-Match": stale}),
+    )
+    assert response.status_code == 412, response.text
+
+    response = client.put(
+        f"/api/contacts/{contact_id}",
+        json={**contact, "first_name": "Other"},
+        headers=auth(get_token, **{"If-Match": version_etag(contact_id + 1, updated_at)}),
+    )
+    assert response.status_code == 412, response.text
+
+    response = client.put(
+        f"/api/contacts/{contact_id}",
+        json={**contact, "first_name": "Kept"},
+        headers=auth(get_token, **{"If-Match": etag}),
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["first_name"] == "Kept"
+    assert parse_version_etag(response.headers["etag"])[0] == contact_id
+
+    current = client.get(f"/api/contacts/{contact_id}", headers=auth(get_token)).json()
+    assert current["first_name"] == "Kept"
+
+def test_update_missing_contact_with_if_match(client, get_token):
+    response = client.put(
+        "/api/contacts/999999",
+        json=contact,
+        headers=auth(get_token, **{"If-Match": version_etag(999999, None)}),
+    )
+
+    assert response.status_code == 404
+
+def test_update_with_if_match_list(client, get_token):
+    contact_id = create(client, get_token)
+    etag = client.get(f"/api/contacts/{contact_id}", headers=auth(get_token)).headers["etag"]
+    _, updated_at = parse_version_etag(etag)
+    stale = version_etag(contact_id, updated_at - timedelta(seconds=5))
+
+    response = client.put(
+        f"/api/contacts/{contact_id}",
+        json={**contact, "first_name": "Listed"},
+        headers=auth(get_token, **{"If-Match": f'{stale}, "unrelated", {etag}'}),
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["first_name"] == "Listed"
+
+    response = client.put(
+        f"/api/contacts/{contact_id}",
+        json={**contact, "first_name": "Lost"},
+        headers=auth(
+            get_token,
+            **{"If-Match": f'{stale}, {version_etag(contact_id + 1, updated_at)}'},
+        ),
+    )
+    assert response.status_code == 412, response.text
+
+def test_update_missing_contact_with_if_match_any(client, get_token):
+    response = client.put(
+        "/api/contacts/999999",
+        json=contact,
+        headers=auth(get_token, **{"If-Match": "*"}),
+    )
+
+    assert response.status_code == 412
@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+
+from src.services import contact_export
+
+
+def create_contact(client, token, first_name, last_name, **fields):
+    response = client.post(
+        "/api/contacts",
+        json={
+            "first_name": first_name,
+            "last_name": last_name,
+            "phone": "1987456321",
+            "email": f"{first_name.lower()}@example.com",
+            "birthday": "1998-10-01",
+            "additional_info": "",
+            **fields,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 201, response.text
+
+def export(client, token, fmt):
+    response = client.get(
+        "/api/contacts/export",
+        params={"format": fmt},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200, response.text
+    return response
+
+def test_export_csv_streams_in_batches(client, get_token, monkeypatch):
+    monkeypatch.setattr(contact_export.settings, "CONTACT_EXPORT_BATCH_SIZE", 2)
+    for i in range(4):
+        create_contact(client, get_token, f"Export{i}", "Csv", additional_info=f"note, {i}")
+
+    response = export(client, get_token, "csv")
+
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="contacts.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    exported = [row for row in rows if row["last_name"] == "Csv"]
+    assert [row["first_name"] for row in exported] == [f"Export{i}" for i in range(4)]
+    assert exported[1]["additional_info"] == "note, 1"
+    assert exported[0]["birthday"] == "1998-10-01"
+    assert response.text.count("first_name") == 1
+
+def test_export_ndjson(client, get_token):
+    response = export(client, get_token, "ndjson")
+
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert {item["first_name"] for item in items} >= {"Export0", "Export3"}
+    assert all(isinstance(item["id"], int) for item in items)
+
+def test_export_vcf_escapes_values(client, get_token):
+    create_contact(client, get_token, "Card", "Holder", additional_info="a;b\nc")
+
+    response = export(client, get_token, "vcf")
+
+    assert response.text.count("BEGIN:VCARD") == response.text.count("END:VCARD")
+    assert "N:Holder;Card;;;\r\nFN:Card Holder\r\n" in response.text
+    assert "NOTE:a\\;b\\nc\r\n" in response.text
+    assert "BDAY:1998-10-01\r\n" in response.text
+
+def test_export_rejects_unknown_format(client, get_token):
+    response = client.get(
+        "/api/contacts/export",
+        params={"format": "xml"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,101 @@
+import json
+
+from src.services import contact_import
+
+
+def upload(client, token, name, content, **params):
+    return client.post(
+        "/api/contacts/import",
+        params=params,
+        files={"file": (name, content)},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+def list_contacts(client, token, query):
+    response = client.get(
+        "/api/contacts",
+        params={"query": query, "limit": 1000},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_import_csv(client, get_token):
+    content = (
+        "first_name,last_name,email,phone,birthday,additional_info\n"
+        "Csv,One,csv1@example.com,0501234567,1990-05-01,\n"
+        "Csv,Two,csv2@example.com,0501234568,1991-06-02,friend\n"
+    )
+
+    response = upload(client, get_token, "contacts.csv", content)
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "created": 2,
+        "failed": 0,
+        "errors": [],
+        "errors_truncated": False,
+    }
+    names = {item["last_name"] for item in list_contacts(client, get_token, "Csv")}
+    assert names == {"One", "Two"}
+
+def test_import_ndjson_reports_invalid_rows(client, get_token):
+    valid = {
+        "first_name": "Nd",
+        "last_name": "Json",
+        "email": "nd@example.com",
+        "phone": "0501234567",
+        "birthday": "1990-05-01",
+        "additional_info": None,
+    }
+    content = "\n".join(
+        [
+            json.dumps(valid),
+            "{not json",
+            json.dumps({**valid, "birthday": "not a date"}),
+            "",
+            json.dumps({**valid, "birthday": None}),
+        ]
+    )
+
+    response = upload(client, get_token, "contacts.ndjson", content)
+
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["created"] == 1
+    assert data["failed"] == 3
+    assert [error["row"] for error in data["errors"]] == [2, 3, 5]
+    assert data["errors"][0]["errors"] == ["Invalid JSON"]
+    assert data["errors"][1]["errors"][0].startswith("birthday:")
+
+def test_import_in_chunks_truncates_errors(client, get_token, monkeypatch):
+    monkeypatch.setattr(contact_import.settings, "CONTACT_IMPORT_CHUNK_SIZE", 3)
+    monkeypatch.setattr(contact_import.settings, "CONTACT_IMPORT_MAX_ERRORS", 2)
+    lines = ["first_name,last_name,email,phone,birthday,additional_info"]
+    for i in range(10):
+        lines.append(f"Chunk,Row{i},chunk{i}@example.com,0501234567,1990-01-{i + 1:02d},")
+    for i in range(4):
+        lines.append(f"Chunk,Bad{i},bad{i}@example.com,0501234567,,")
+
+    response = upload(client, get_token, "chunks.txt", "\n".join(lines), format="csv")
+
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["created"] == 10
+    assert data["failed"] == 4
+    assert len(data["errors"]) == 2
+    assert data["errors_truncated"] is True
+    assert len(list_contacts(client, get_token, "Row")) == 10
+
+def test_import_unknown_format(client, get_token):
+    response = upload(client, get_token, "contacts.bin", b"\x00\x01")
+
+    assert response.status_code == 400, response.text
+
+def test_import_rejects_non_utf8(client, get_token):
+    response = upload(
+        client, get_token, "contacts.csv", "first_name\nÖ\n".encode("latin-1")
+    )
+
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "File must be UTF-8 encoded"
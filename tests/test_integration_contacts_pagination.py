@@ -0,0 +1,103 @@
+import pytest
+
+from src.repository.pagination import encode_cursor
+
+def create_contacts(client, token, last_names):
+    for i, last_name in enumerate(last_names):
+        response = client.post(
+            "/api/contacts",
+            json={
+                "first_name": f"Page{i}",
+                "last_name": last_name,
+                "phone": "1987456321",
+                "email": f"page{i}@example.com",
+                "birthday": "1998-10-01",
+                "additional_info": "",
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 201, response.text
+
+def fetch_all_pages(client, token, **params):
+    pages = []
+    cursor = None
+    while True:
+        query = dict(params)
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get(
+            "/api/contacts/page", params=query, headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200, response.text
+        data = response.json()
+        pages.append(data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return pages
+
+def test_pages_by_id(client, get_token):
+    create_contacts(client, get_token, ["Zed", "Adams", "Moss", "Adams"])
+
+    pages = fetch_all_pages(client, get_token, limit=2)
+
+    ids = [item["id"] for page in pages for item in page]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 5
+
+def test_pages_by_last_name(client, get_token):
+    pages = fetch_all_pages(client, get_token, limit=2, sort="last_name")
+
+    items = [item for page in pages for item in page]
+    keys = [(item["last_name"], item["first_name"], item["id"]) for item in items]
+    assert keys == sorted(keys)
+    assert len(items) == 5
+
+def test_pages_with_query(client, get_token):
+    pages = fetch_all_pages(client, get_token, limit=1, query="adams")
+
+    assert [item["last_name"] for page in pages for item in page] == ["Adams", "Adams"]
+
+def test_invalid_cursor(client, get_token):
+    response = client.get(
+        "/api/contacts/page",
+        params={"cursor": "not-a-cursor"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Invalid cursor"
+
+def test_cursor_from_other_ordering_is_rejected(client, get_token):
+    response = client.get(
+        "/api/contacts/page",
+        params={"limit": 1},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    cursor = response.json()["next_cursor"]
+
+    response = client.get(
+        "/api/contacts/page",
+        params={"cursor": cursor, "sort": "last_name"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 400, response.text
+
+
+@pytest.mark.parametrize(
+    "sort,values",
+    [
+        ("last_name", [1, 2, 3]),
+        ("last_name", ["Adams", "Alice", "3"]),
+        ("last_name", ["Adams", "Alice", True]),
+        ("last_name", ["Adams", 3]),
+        ("id", ["1"]),
+    ],
+)
+def test_cursor_with_mistyped_values_is_rejected(client, get_token, sort, values):
+    response = client.get(
+        "/api/contacts/page",
+        params={"cursor": encode_cursor(sort, values), "sort": sort},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,49 @@
+def create_contact(client, token, first_name, last_name, email):
+    response = client.post(
+        "/api/contacts",
+        json={
+            "first_name": first_name,
+            "last_name": last_name,
+            "phone": "1987456321",
+            "email": email,
+            "birthday": "1998-10-01",
+            "additional_info": "",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 201, response.text
+
+def search(client, token, q, **params):
+    response = client.get(
+        "/api/contacts/search",
+        params={"q": q, **params},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_search_ranks_exact_and_prefix_matches_first(client, get_token):
+    create_contact(client, get_token, "Annabel", "Lee", "annabel@example.com")
+    create_contact(client, get_token, "Joanna", "Ann", "joanna@example.com")
+    create_contact(client, get_token, "Marianne", "Smith", "m.smith@example.com")
+
+    data = search(client, get_token, "ann")
+
+    assert [item["first_name"] for item in data] == ["Joanna", "Annabel", "Marianne"]
+
+def test_search_matches_email(client, get_token):
+    data = search(client, get_token, "m.smith")
+
+    assert [item["first_name"] for item in data] == ["Marianne"]
+
+def test_search_escapes_wildcards(client, get_token):
+    assert search(client, get_token, "%") == []
+
+def test_search_limit(client, get_token):
+    assert len(search(client, get_token, "ann", limit=1)) == 1
+
+def test_search_requires_query(client, get_token):
+    response = client.get(
+        "/api/contacts/search", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == 422, response.text
@@ -0,0 +1,51 @@
+import pytest
+
+from conftest import test_user
+from src.conf.config import settings
+from src.services.rate_limit import rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def limits(monkeypatch):
+    monkeypatch.setattr(
+        settings, "RATE_LIMITS", {"auth_login": "2/minute", "contacts": "3/minute"}
+    )
+    rate_limiter.reset()
+    yield
+    rate_limiter.reset()
+
+
+def test_login_is_limited_per_client(client):
+    form = {"username": test_user["username"], "password": "wrong"}
+
+    statuses = [client.post("api/auth/login", data=form).status_code for _ in range(3)]
+
+    assert statuses == [401, 401, 429]
+
+
+def test_contacts_are_limited_per_user(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    responses = [client.get("api/contacts", headers=headers) for _ in range(4)]
+
+    assert [r.status_code for r in responses] == [200, 200, 200, 429]
+    assert responses[-1].json() == {"error": "Перевищено ліміт запитів. Спробуйте пізніше."}
+    assert int(responses[-1].headers["retry-after"]) > 0
+    assert responses[-1].headers["x-ratelimit-limit"] == "3"
+
+
+def test_unconfigured_route_is_not_limited(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    statuses = [client.get("api/users/me", headers=headers).status_code for _ in range(12)]
+
+    assert set(statuses) <= {200, 304}
+
+
+def test_rate_limit_can_be_disabled(client, get_token, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+    headers = {"Authorization": f"Bearer {get_token}"}
+
+    statuses = [client.get("api/contacts", headers=headers).status_code for _ in range(5)]
+
+    assert statuses == [200] * 5
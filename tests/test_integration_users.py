@@ -1,6 +1,8 @@
 from unittest.mock import patch
 
-from conftest import test_user
+from conftest import fake_redis, test_user
+from src.services.auth import create_email_token
+from src.services.local_cache import user_local_cache
 
 def test_get_me(client, get_token):
     token = get_token
@@ -12,6 +14,16 @@ def test_get_me(client, get_token):
     assert data["email"] == test_user["email"]
     assert "avatar" in data
 
+def test_get_me_etag(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get("api/users/me", headers=headers)
+    etag = response.headers["etag"]
+
+    response = client.get("api/users/me", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304, response.text
+    assert response.headers["etag"] == etag
+
 def test_get_me_unauthorized(client):
     token = "invalid token"
     headers = {"Authorization": f"Bearer {token}"}
@@ -20,7 +32,7 @@ def test_get_me_unauthorized(client):
     data = response.json()
     assert data["detail"] == "Could not validate credentials"
 
-@patch("src.services.upload_file.UploadFileService.upload_file")
+@patch("src.services.avatars.AvatarPipeline.update")
 def test_update_avatar_user_error(mock_upload_file, client, get_token):
     fake_url = "<http://example.com/avatar.jpg>"
     mock_upload_file.return_value = fake_url
@@ -35,3 +47,21 @@ def test_update_avatar_user_error(mock_upload_file, client, get_token):
 
     data = response.json()
     assert data["detail"] == "Недостатньо прав доступу"
+
+def test_me_after_password_update(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    user_local_cache.clear()
+    assert client.get("api/users/me", headers=headers).status_code == 200
+    assert fake_redis.store.get(test_user["username"]) is not None
+    token = create_email_token({"sub": test_user["email"]})
+
+    response = client.post(
+        f"api/auth/reset-password-confirm/{token}",
+        params={"new_password": test_user["password"]},
+    )
+
+    assert response.status_code == 200, response.text
+    assert fake_redis.store.get(test_user["username"]) is None
+    response = client.get("api/users/me", headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["email"] == test_user["email"]
@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from redis.asyncio import Redis
+
+from src.services.invalidation import UserInvalidationBus, RedisUserInvalidationBus
+
+
+@pytest.mark.asyncio
+async def test_local_bus_calls_sync_and_async_handlers():
+    bus = UserInvalidationBus()
+    sync_handler = Mock()
+    async_handler = AsyncMock()
+    bus.subscribe(sync_handler)
+    bus.subscribe(async_handler)
+
+    await bus.publish("deadpool")
+
+    sync_handler.assert_called_once_with("deadpool")
+    async_handler.assert_awaited_once_with("deadpool")
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "bus_factory",
+    [UserInvalidationBus, lambda store: RedisUserInvalidationBus("users", store=store)],
+)
+async def test_bus_drops_shared_entry_before_local_eviction(bus_factory):
+    calls = []
+    redis = AsyncMock()
+    redis.delete.side_effect = lambda key: calls.append(("shared", key))
+    bus = bus_factory(store=lambda: redis)
+    bus.subscribe(lambda username: calls.append(("local", username)))
+
+    await bus.publish("deadpool")
+
+    assert calls == [("shared", "deadpool"), ("local", "deadpool")]
+    redis.publish.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_bus_dispatches_when_shared_store_is_down():
+    def store():
+        raise ConnectionError("down")
+
+    bus = UserInvalidationBus(store=store)
+    handler = Mock()
+    bus.subscribe(handler)
+
+    await bus.publish("deadpool")
+
+    handler.assert_called_once_with("deadpool")
+
+@pytest.mark.asyncio
+async def test_redis_bus_without_client_dispatches_locally():
+    bus = RedisUserInvalidationBus("users")
+    handler = Mock()
+    bus.subscribe(handler)
+
+    await bus.publish("deadpool")
+
+    handler.assert_called_once_with("deadpool")
+
+@pytest.mark.asyncio
+async def test_redis_bus_publish_drops_shared_entry_and_broadcasts():
+    bus = RedisUserInvalidationBus("users")
+    redis = AsyncMock()
+    bus._redis = redis
+
+    await bus.publish("deadpool")
+
+    redis.delete.assert_awaited_once_with("deadpool")
+    channel, message = redis.publish.await_args.args
+    assert channel == "users"
+    assert json.loads(message) == {"origin": bus.origin, "username": "deadpool"}
+
+@pytest.mark.asyncio
+async def test_redis_bus_handles_events_from_other_workers_only():
+    bus = RedisUserInvalidationBus("users")
+    handler = Mock()
+    bus.subscribe(handler)
+
+    await bus._handle_message({"type": "subscribe", "data": 1})
+    await bus._handle_message(
+        {"type": "message", "data": json.dumps({"origin": bus.origin, "username": "self"})}
+    )
+    await bus._handle_message(
+        {"type": "message", "data": json.dumps({"origin": "other", "username": "deadpool"})}
+    )
+
+    handler.assert_called_once_with("deadpool")
+
+def resp_array(*items: bytes) -> bytes:
+    return b"*%d\r\n" % len(items) + b"".join(b"$%d\r\n%s\r\n" % (len(i), i) for i in items)
+
+class PubSubServer:
+    """Bare RESP server that acknowledges SUBSCRIBE and pushes messages on demand."""
+
+    def __init__(self):
+        self.subscriptions = 0
+        self.subscribers = []
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    return
+                command = []
+                for _ in range(int(header[1:])):
+                    size = int((await reader.readline())[1:])
+                    command.append((await reader.readexactly(size + 2))[:-2])
+                if command[0].upper() == b"SUBSCRIBE":
+                    self.subscriptions += 1
+                    self.subscribers.append(writer)
+                    writer.write(b"*3\r\n$9\r\nsubscribe\r\n$%d\r\n%s\r\n:1\r\n"
+                                 % (len(command[1]), command[1]))
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+
+    async def push(self, channel: str, data: str):
+        for writer in self.subscribers:
+            writer.write(resp_array(b"message", channel.encode(), data.encode()))
+            await writer.drain()
+
+@pytest.mark.asyncio
+async def test_idle_listener_keeps_subscription_and_delivers_later_messages(caplog):
+    server = PubSubServer()
+    listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    redis = Redis(host="127.0.0.1", port=port, socket_timeout=0.2)
+    bus = RedisUserInvalidationBus("users", reconnect_delay=0.05, poll_interval=0.05)
+    handler = Mock()
+    bus.subscribe(handler)
+
+    await bus.start(redis)
+    try:
+        # Stay idle for several socket timeouts before anything is published.
+        await asyncio.sleep(1.0)
+        await server.push("users", json.dumps({"origin": "other", "username": "deadpool"}))
+        for _ in range(50):
+            if handler.called:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        await bus.stop()
+        await redis.aclose()
+        listener.close()
+        await listener.wait_closed()
+
+    handler.assert_called_once_with("deadpool")
+    assert server.subscriptions == 1
+    assert "Invalidation listener failed" not in caplog.text
@@ -0,0 +1,50 @@
+from src.services.local_cache import LocalCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_counts_hits_and_misses():
+    cache = LocalCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_evicts_least_recently_used():
+    cache = LocalCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+def test_entries_expire():
+    timer = FakeTimer()
+    cache = LocalCache(maxsize=2, ttl=5, timer=timer)
+    cache.set("a", 1)
+
+    timer.now = 4.9
+    assert cache.get("a") == 1
+    timer.now = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_pop_invalidates_entry():
+    cache = LocalCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+
+    assert cache.pop("a") == 1
+    assert cache.get("a") is None
+    assert cache.pop("a") is None
@@ -0,0 +1,166 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from conftest import TestingSessionLocal
+from src.database.models import EmailOutbox, EmailStatus
+from src.repository.outbox import OutboxRepository
+from src.services.email import build_message
+from src.services.mail_transport import MemoryTransport, SMTPTransport
+from src.services.mail_worker import MailWorker
+
+
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def _queue(*recipients):
+    async with TestingSessionLocal() as session:
+        repository = OutboxRepository(session)
+        for recipient in recipients:
+            await repository.enqueue(recipient, "agent", "http://test/", "verify_email", NOW)
+
+
+async def _outbox():
+    async with TestingSessionLocal() as session:
+        result = await session.execute(select(EmailOutbox).order_by(EmailOutbox.id))
+        return {m.recipient: m for m in result.scalars().all()}
+
+
+@pytest_asyncio.fixture
+async def clean_outbox():
+    async with TestingSessionLocal() as session:
+        await session.execute(EmailOutbox.__table__.delete())
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_worker_delivers_batches(clean_outbox):
+    await _queue("a@example.com", "b@example.com", "c@example.com")
+    transport = MemoryTransport()
+    worker = MailWorker(TestingSessionLocal, transport, batch_size=2, clock=Clock(NOW))
+
+    assert await worker.run_once() == 2
+    assert await worker.run_once() == 1
+    assert await worker.run_once() == 0
+
+    assert [m["To"] for m in transport.sent] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert "http://test/" in transport.sent[0].get_content()
+    outbox = await _outbox()
+    assert all(m.status == EmailStatus.SENT and m.sent_at == NOW for m in outbox.values())
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_with_backoff_then_fails(clean_outbox):
+    await _queue("ok@example.com", "bad@example.com")
+    clock = Clock(NOW)
+    transport = MemoryTransport(failing={"bad@example.com"})
+    worker = MailWorker(
+        TestingSessionLocal, transport, max_attempts=3, retry_base=10, retry_max=15, clock=clock
+    )
+
+    assert await worker.run_once() == 2
+    outbox = await _outbox()
+    assert outbox["ok@example.com"].status == EmailStatus.SENT
+    bad = outbox["bad@example.com"]
+    assert (bad.status, bad.attempts) == (EmailStatus.PENDING, 1)
+    assert bad.next_attempt_at == NOW + timedelta(seconds=10)
+    assert "Mailbox unavailable" in bad.last_error
+
+    assert await worker.run_once() == 0
+
+    clock.now = NOW + timedelta(seconds=10)
+    assert await worker.run_once() == 1
+    bad = (await _outbox())["bad@example.com"]
+    assert bad.next_attempt_at == clock.now + timedelta(seconds=15)
+
+    clock.now += timedelta(seconds=15)
+    assert await worker.run_once() == 1
+    bad = (await _outbox())["bad@example.com"]
+    assert (bad.status, bad.attempts) == (EmailStatus.FAILED, 3)
+    assert [m["To"] for m in transport.sent] == ["ok@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_worker_run_stops_on_event(clean_outbox):
+    await _queue("a@example.com")
+    transport = MemoryTransport()
+    worker = MailWorker(TestingSessionLocal, transport, poll_interval=0.01, clock=Clock(NOW))
+    stop = asyncio.Event()
+
+    task = asyncio.create_task(worker.run(stop))
+    for _ in range(100):
+        if transport.sent:
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert len(transport.sent) == 1
+
+
+class FakeSMTPServer:
+    """Minimal SMTP server that records sessions and messages."""
+
+    def __init__(self):
+        self.connections = 0
+        self.messages = []
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        writer.write(b"220 localhost ESMTP\r\n")
+        await writer.drain()
+        while line := await reader.readline():
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                writer.write(b"250-localhost\r\n250 8BITMIME\r\n")
+            elif command == "DATA":
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                await writer.drain()
+                data = []
+                while (body := await reader.readline()) != b".\r\n":
+                    data.append(body)
+                self.messages.append(b"".join(data))
+                writer.write(b"250 OK\r\n")
+            elif command == "QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+        writer.close()
+
+
+@pytest.mark.asyncio
+async def test_smtp_transport_reuses_connection():
+    fake = FakeSMTPServer()
+    server = await asyncio.start_server(fake.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    transport = SMTPTransport("127.0.0.1", port, validate_certs=False)
+    messages = [
+        build_message(recipient, "agent", "http://test/", "verify_email")
+        for recipient in ("a@example.com", "b@example.com", "c@example.com")
+    ]
+
+    try:
+        for message in messages:
+            await transport.send(message)
+        await transport.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert transport.connections == 1
+    assert fake.connections == 1
+    assert len(fake.messages) == 3
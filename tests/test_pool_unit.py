@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database.pool import MeteredAsyncAdaptedQueuePool, engine_options
+
+settings = SimpleNamespace(
+    DB_POOL_SIZE=5,
+    DB_MAX_OVERFLOW=2,
+    DB_POOL_TIMEOUT=3.0,
+    DB_POOL_RECYCLE=600,
+    DB_POOL_PRE_PING=True,
+    DB_STATEMENT_CACHE_SIZE=50,
+    DB_APPLICATION_NAME="contacts-test",
+    DB_STATEMENT_TIMEOUT_MS=2000,
+)
+
+
+def test_engine_options_for_asyncpg():
+    options = engine_options("postgresql+asyncpg://u:p@localhost/db", settings)
+
+    assert options["poolclass"] is MeteredAsyncAdaptedQueuePool
+    assert options["pool_size"] == 5
+    assert options["max_overflow"] == 2
+    assert options["pool_timeout"] == 3.0
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {
+        "prepared_statement_cache_size": 50,
+        "server_settings": {
+            "application_name": "contacts-test",
+            "statement_timeout": "2000",
+        },
+    }
+
+
+def test_engine_options_for_sqlite():
+    file_options = engine_options("sqlite+aiosqlite:///./app.db", settings)
+    memory_options = engine_options("sqlite+aiosqlite://", settings)
+
+    assert file_options["pool_size"] == 5
+    assert "connect_args" not in file_options
+    assert memory_options == {"pool_pre_ping": True}
+
+
+@pytest.mark.asyncio
+async def test_metered_pool_reports_wait_and_saturation(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/pool.db",
+        poolclass=MeteredAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        stats = engine.pool.status_dict()
+        assert stats["checked_out"] == 1
+        assert stats["saturation"] == 1.0
+
+        with pytest.raises(PoolTimeoutError):
+            async with engine.connect():
+                pass
+
+    stats = engine.pool.status_dict()
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["peak_checked_out"] == 1
+    assert stats["wait_seconds_max"] >= 0
+
+    metrics = engine.pool.metrics
+    await engine.dispose()
+    assert engine.pool.metrics is metrics
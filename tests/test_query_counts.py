@@ -0,0 +1,99 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from conftest import engine, test_user
+from src.services.auth import create_access_token
+
+contact = {
+    "first_name": "Counted",
+    "last_name": "Queries",
+    "phone": "0501234567",
+    "email": "counted@example.com",
+    "birthday": "1990-02-03",
+    "additional_info": "",
+}
+
+
+@contextmanager
+def count_statements():
+    """Collect every SQL statement sent to the test database."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest_asyncio.fixture()
+async def headers():
+    principal = SimpleNamespace(id=test_user["id"], role="user", confirmed=True)
+    token = await create_access_token(data={"sub": test_user["username"]}, user=principal)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def request(client, headers, method, url, **kwargs):
+    with count_statements() as statements:
+        response = client.request(method, url, headers=headers, **kwargs)
+    assert response.status_code < 300, response.text
+    return response, statements
+
+
+def test_write_endpoints_use_one_statement(client, headers):
+    response, statements = request(client, headers, "POST", "/api/contacts", json=contact)
+    assert len(statements) == 1, statements
+    assert statements[0].startswith("INSERT")
+    contact_id = response.json()["id"]
+    assert response.json()["created_at"] is not None
+
+    response, statements = request(
+        client, headers, "PUT", f"/api/contacts/{contact_id}",
+        json={**contact, "first_name": "Recounted"},
+    )
+    assert len(statements) == 1, statements
+    assert statements[0].startswith("UPDATE")
+    assert response.json()["first_name"] == "Recounted"
+
+    response, statements = request(client, headers, "GET", f"/api/contacts/{contact_id}")
+    assert len(statements) == 1, statements
+
+    response, statements = request(client, headers, "DELETE", f"/api/contacts/{contact_id}")
+    assert len(statements) == 1, statements
+    assert statements[0].startswith("DELETE")
+    assert response.json()["first_name"] == "Recounted"
+
+
+def test_missing_contact_costs_one_statement(client, headers):
+    with count_statements() as statements:
+        response = client.put(
+            "/api/contacts/999999", json=contact, headers=headers
+        )
+    assert response.status_code == 404
+    assert len(statements) == 1, statements
+
+    with count_statements() as statements:
+        response = client.delete("/api/contacts/999999", headers=headers)
+    assert response.status_code == 404
+    assert len(statements) == 1, statements
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/contacts",
+        "/api/contacts/page",
+        "/api/contacts/search?q=ali",
+        "/api/contacts/birthdays",
+    ],
+)
+def test_read_endpoints_use_one_statement(client, headers, url):
+    response, statements = request(client, headers, "GET", url)
+    assert len(statements) == 1, statements
@@ -0,0 +1,72 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from conftest import engine
+from src.repository.contacts import ContactRepository
+from src.repository.pagination import encode_cursor
+
+user = SimpleNamespace(id=1)
+
+
+async def captured_statement(call):
+    """Run a repository method against a mock session and return its statement."""
+    session = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    await call(ContactRepository(session))
+    return session.execute.await_args.args[0]
+
+async def query_plan(stmt) -> str:
+    """Return SQLite's EXPLAIN QUERY PLAN output for a statement."""
+    sql = stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    async with engine.connect() as conn:
+        rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+        return "\n".join(row[-1] for row in rows)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "call, index",
+    [
+        (lambda r: r.get_contacts(0, 10, None, user), "ix_contacts_user_id_id"),
+        (lambda r: r.get_contacts_page(10, None, "id", None, user), "ix_contacts_user_id_id"),
+        (
+            lambda r: r.get_contacts_page(10, encode_cursor("id", [5]), "id", None, user),
+            "ix_contacts_user_id_id",
+        ),
+        (
+            lambda r: r.get_contacts_page(10, None, "last_name", None, user),
+            "ix_contacts_user_id_last_name_first_name",
+        ),
+        (
+            lambda r: r.get_contacts_page(
+                10, encode_cursor("last_name", ["Black", "Alice", 1]), "last_name", None, user
+            ),
+            "ix_contacts_user_id_last_name_first_name",
+        ),
+        (lambda r: r.get_upcoming_birthdays(user, days=7), "ix_contacts_user_id_birthday_md"),
+        (
+            lambda r: r.get_upcoming_birthdays(user, days=7, today=date(2026, 12, 28)),
+            "ix_contacts_user_id_birthday_md",
+        ),
+    ],
+)
+async def test_contact_queries_use_user_indexes(call, index):
+    plan = await query_plan(await captured_statement(call))
+
+    assert f"USING INDEX {index}" in plan or f"USING COVERING INDEX {index}" in plan, plan
+    assert "SCAN contacts" not in plan, plan
+
+@pytest.mark.asyncio
+async def test_email_lookup_uses_user_email_index():
+    async with engine.connect() as conn:
+        rows = await conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM contacts WHERE user_id = 1 AND email = 'a@b.c'"
+        )
+        plan = "\n".join(row[-1] for row in rows)
+
+    assert "ix_contacts_user_id_email" in plan, plan
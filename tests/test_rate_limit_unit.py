@@ -0,0 +1,110 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.exceptions import ConnectionError
+
+from src.services.rate_limit import Rate, RateLimiter, parse_rate
+
+
+class Clock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class BrokenRedis:
+    def register_script(self, script):
+        async def call(keys, args):
+            raise ConnectionError("down")
+
+        return call
+
+
+@pytest.fixture
+def redis():
+    return FakeAsyncRedis()
+
+
+def test_parse_rate():
+    assert parse_rate("10/minute") == Rate(10, 60)
+    assert parse_rate(" 5 / seconds ") == Rate(5, 1)
+    for value in ("10", "0/minute", "10/week"):
+        with pytest.raises(ValueError):
+            parse_rate(value)
+
+
+async def _hits(limiter, redis, rate, count, key="user:1"):
+    return [(await limiter.hit(redis, key, rate)).allowed for _ in range(count)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage", ["redis", "memory"])
+async def test_sliding_window(redis, storage):
+    clock = Clock()
+    limiter = RateLimiter("sliding_window", storage=storage, clock=clock)
+    rate = Rate(3, 10)
+
+    assert await _hits(limiter, redis, rate, 4) == [True, True, True, False]
+    assert await _hits(limiter, redis, rate, 1, key="user:2") == [True]
+
+    clock.now += 4
+    result = await limiter.hit(redis, "user:1", rate)
+    assert (result.allowed, result.remaining) == (False, 0)
+    assert result.retry_after == pytest.approx(6, abs=0.01)
+
+    clock.now += 6
+    assert await _hits(limiter, redis, rate, 4) == [True, True, True, False]
+    assert await redis.exists("ratelimit:sliding_window:user:1") == (storage == "redis")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage", ["redis", "memory"])
+async def test_token_bucket(redis, storage):
+    clock = Clock()
+    limiter = RateLimiter("token_bucket", storage=storage, clock=clock)
+    rate = Rate(4, 2)
+
+    assert await _hits(limiter, redis, rate, 5) == [True, True, True, True, False]
+    result = await limiter.hit(redis, "user:1", rate)
+    assert result.retry_after == pytest.approx(0.5, abs=0.01)
+
+    clock.now += 0.5
+    assert await _hits(limiter, redis, rate, 2) == [True, False]
+
+    clock.now += 10
+    result = await limiter.hit(redis, "user:1", rate)
+    assert (result.allowed, result.remaining) == (True, 3)
+    assert await redis.exists("ratelimit:token_bucket:user:1") == (storage == "redis")
+
+
+@pytest.mark.asyncio
+async def test_redis_counters_are_shared_between_limiters(redis):
+    clock = Clock()
+    rate = Rate(2, 60)
+    first = RateLimiter("sliding_window", storage="redis", clock=clock)
+    second = RateLimiter("sliding_window", storage="redis", clock=clock)
+
+    assert await _hits(first, redis, rate, 1) == [True]
+    assert await _hits(second, redis, rate, 2) == [True, False]
+    assert await redis.ttl("ratelimit:sliding_window:user:1") == 60
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_counters_when_redis_fails():
+    limiter = RateLimiter("sliding_window", storage="redis", clock=Clock())
+
+    assert await _hits(limiter, BrokenRedis(), Rate(2, 60), 3) == [True, True, False]
+
+    limiter.reset()
+    assert await _hits(limiter, None, Rate(2, 60), 1) == [True]
+
+
+@pytest.mark.asyncio
+async def test_local_store_is_bounded():
+    limiter = RateLimiter("sliding_window", storage="memory", local_max_keys=2, clock=Clock())
+
+    for key in ("a", "b", "c"):
+        await limiter.hit(None, key, Rate(1, 60))
+
+    assert len(limiter._local) == 2
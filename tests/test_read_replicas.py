@@ -0,0 +1,120 @@
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import insert, select, update
+
+from src.database.db import DatabaseSessionManager, StickyMarkers
+from src.database.models import Base, User
+
+
+async def seed(engine, username):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(User).values(username=username, email=f"{username}@example.com", hashed_password="x")
+        )
+
+
+def create_manager(tmp_path, redis):
+    return DatabaseSessionManager(
+        f"sqlite+aiosqlite:///{tmp_path}/primary.db",
+        replica_urls=[f"sqlite+aiosqlite:///{tmp_path}/replica.db"],
+        sticky_markers=StickyMarkers(lambda: redis, 60),
+    )
+
+
+@pytest.fixture()
+def redis():
+    return FakeAsyncRedis()
+
+
+@pytest_asyncio.fixture()
+async def manager(tmp_path, redis):
+    manager = create_manager(tmp_path, redis)
+    await seed(manager._engine, "primary")
+    await seed(manager._replicas[0], "replica")
+    yield manager
+    await manager.close()
+
+
+async def usernames(session):
+    result = await session.execute(select(User.username).order_by(User.id))
+    return result.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_and_writes_to_primary(manager):
+    async with manager.read_session() as session:
+        assert await usernames(session) == ["replica"]
+
+    async with manager.session() as session:
+        assert await usernames(session) == ["primary"]
+
+
+@pytest.mark.asyncio
+async def test_session_sticks_to_primary_after_write(manager):
+    async with manager.read_session() as session:
+        assert await usernames(session) == ["replica"]
+        await session.execute(update(User).values(avatar="changed"))
+        await session.commit()
+        assert await usernames(session) == ["primary"]
+
+    async with manager.session() as session:
+        avatars = (await session.execute(select(User.avatar))).scalars().all()
+    assert avatars == ["changed"]
+
+
+@pytest.mark.asyncio
+async def test_client_reads_own_writes_within_window(manager):
+    async with manager.session("client-a") as session:
+        session.add(User(username="new", email="new@example.com", hashed_password="x"))
+        await session.commit()
+
+    async with manager.read_session("client-a") as session:
+        assert await usernames(session) == ["primary", "new"]
+
+    async with manager.read_session("client-b") as session:
+        assert await usernames(session) == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_reads_without_writes_do_not_stick(manager):
+    async with manager.session("client-a") as session:
+        await usernames(session)
+
+    async with manager.read_session("client-a") as session:
+        assert await usernames(session) == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_other_workers_read_own_writes(manager, tmp_path, redis):
+    other_worker = create_manager(tmp_path, redis)
+    try:
+        async with manager.session("client-a") as session:
+            session.add(User(username="new", email="new@example.com", hashed_password="x"))
+            await session.commit()
+
+        async with other_worker.read_session("client-a") as session:
+            assert await usernames(session) == ["primary", "new"]
+        assert await redis.ttl("db:sticky:client-a") == 60
+    finally:
+        await other_worker.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_primary_when_markers_are_unavailable(tmp_path):
+    def broken():
+        raise ConnectionError("down")
+
+    manager = DatabaseSessionManager(
+        f"sqlite+aiosqlite:///{tmp_path}/primary.db",
+        replica_urls=[f"sqlite+aiosqlite:///{tmp_path}/replica.db"],
+        sticky_markers=StickyMarkers(broken, 60),
+    )
+    try:
+        await seed(manager._engine, "primary")
+        await seed(manager._replicas[0], "replica")
+        async with manager.read_session("client-a") as session:
+            assert await usernames(session) == ["primary"]
+    finally:
+        await manager.close()
@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.conf.config import settings
+from src.services import resources as resources_module
+from src.services.resources import AppResources
+
+
+def test_clients_are_created_once():
+    resources = AppResources()
+
+    assert resources.avatars is resources.avatars
+    assert resources.hasher is resources.hasher
+
+
+@pytest.mark.asyncio
+async def test_startup_and_shutdown_manage_shared_clients(monkeypatch):
+    redis_manager = MagicMock()
+    redis_manager.connect = AsyncMock()
+    redis_manager.close = AsyncMock()
+    redis_manager.client.ping = AsyncMock()
+    bus = MagicMock(start=AsyncMock(), stop=AsyncMock())
+    sessionmanager = MagicMock(close=AsyncMock())
+    session = AsyncMock()
+    sessionmanager.session.return_value.__aenter__.return_value = session
+    hash_executor = MagicMock()
+    monkeypatch.setattr(resources_module, "redis_manager", redis_manager)
+    monkeypatch.setattr(resources_module, "user_invalidation_bus", bus)
+    monkeypatch.setattr(resources_module, "sessionmanager", sessionmanager)
+    monkeypatch.setattr(resources_module, "hash_executor", hash_executor)
+    resources = AppResources()
+
+    await resources.startup()
+
+    redis_manager.connect.assert_awaited_once()
+    bus.start.assert_awaited_once_with(redis_manager.client)
+    session.execute.assert_awaited_once()
+    redis_manager.client.ping.assert_awaited_once()
+    hash_executor.start.assert_called_once()
+    assert resources._avatars is not None
+    assert resources._hasher is not None
+
+    await resources.shutdown()
+
+    bus.stop.assert_awaited_once()
+    redis_manager.close.assert_awaited_once()
+    sessionmanager.close.assert_awaited_once()
+    hash_executor.shutdown.assert_called_once()
+    assert resources._hasher is None
+
+
+@pytest.mark.asyncio
+async def test_startup_survives_failed_warm_up(monkeypatch):
+    redis_manager = MagicMock(connect=AsyncMock())
+    redis_manager.client.ping = AsyncMock(side_effect=ConnectionError("down"))
+    sessionmanager = MagicMock()
+    sessionmanager.session.side_effect = OSError("down")
+    monkeypatch.setattr(resources_module, "redis_manager", redis_manager)
+    monkeypatch.setattr(resources_module, "user_invalidation_bus", MagicMock(start=AsyncMock()))
+    monkeypatch.setattr(resources_module, "sessionmanager", sessionmanager)
+    monkeypatch.setattr(resources_module, "hash_executor", MagicMock())
+
+    await AppResources().startup()
+
+
+@pytest.mark.asyncio
+async def test_startup_rejects_gravatar_as_avatar_storage(monkeypatch):
+    redis_manager = MagicMock(connect=AsyncMock())
+    monkeypatch.setattr(resources_module, "redis_manager", redis_manager)
+    monkeypatch.setattr(resources_module, "user_invalidation_bus", MagicMock(start=AsyncMock()))
+    monkeypatch.setattr(settings, "AVATAR_STORAGE", "gravatar")
+
+    with pytest.raises(ValueError, match="Unknown avatar storage backend"):
+        await AppResources().startup()
@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.etag import etag_matches, make_etag
+from src.services.response_cache import ContactResponseCache
+
+
+def test_make_etag_is_weak_and_stable():
+    assert make_etag(1, "a") == make_etag(1, "a")
+    assert make_etag(1, "a") != make_etag(1, "b")
+    assert make_etag(1).startswith('W/"')
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", W/"abc"', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, 'W/"abc"') is expected
+
+def request(headers=None):
+    return MagicMock(headers=headers or {})
+
+def memory_redis():
+    store = {}
+
+    async def set_(key, value, ex=None, nx=False):
+        if nx and key in store:
+            return None
+        store[key] = value
+        return True
+
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=lambda key: store.get(key))
+    redis.set = AsyncMock(side_effect=set_)
+    return redis, store
+
+@pytest.mark.asyncio
+async def test_respond_serves_uncached_when_redis_fails():
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=ConnectionError("down"))
+    produce = AsyncMock(return_value=b"[]")
+
+    response = await ContactResponseCache(redis, ttl=10).respond(request(), 1, "list", (0,), produce)
+
+    assert response.status_code == 200
+    assert response.body == b"[]"
+    assert "etag" not in response.headers
+    produce.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_respond_stores_body_and_reuses_it():
+    redis, store = memory_redis()
+    produce = AsyncMock(return_value=b'[{"id": 1}]')
+    cache = ContactResponseCache(redis, ttl=10)
+
+    first = await cache.respond(request(), 1, "list", (0, 100, None), produce)
+    second = await cache.respond(request(), 1, "list", (0, 100, None), produce)
+
+    assert first.body == second.body == b'[{"id": 1}]'
+    produce.assert_awaited_once()
+    body_writes = [c for c in redis.set.await_args_list if c.args[0].startswith("contacts:resp:")]
+    assert len(body_writes) == 1
+    assert body_writes[0].kwargs["ex"] == 10
+
+@pytest.mark.asyncio
+async def test_invalidate_replaces_generation():
+    redis = MagicMock(set=AsyncMock(return_value=True))
+
+    await ContactResponseCache(redis).invalidate(7)
+    await ContactResponseCache(redis).invalidate(7)
+
+    first, second = (call.args for call in redis.set.await_args_list)
+    assert first[0] == second[0] == "contacts:gen:7"
+    assert first[1] != second[1]
+
+@pytest.mark.asyncio
+async def test_lost_generation_does_not_revive_old_etags():
+    redis, store = memory_redis()
+    produce = AsyncMock(return_value=b"[]")
+    cache = ContactResponseCache(redis, ttl=10)
+    etag = (await cache.respond(request(), 1, "list", (0,), produce)).headers["etag"]
+
+    store.clear()
+    response = await cache.respond(request({"if-none-match": etag}), 1, "list", (0,), produce)
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -0,0 +1,46 @@
+from src.services.token_cache import VerifiedTokenCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_verified_token_is_served_from_cache():
+    cache = VerifiedTokenCache(maxsize=4, clock=FakeClock())
+    cache.set("token", {"sub": "deadpool", "exp": 2_000})
+
+    assert cache.get("token") == {"sub": "deadpool", "exp": 2_000}
+    assert cache.get("other") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_expired_or_unbounded_tokens_are_not_cached():
+    cache = VerifiedTokenCache(maxsize=4, clock=FakeClock())
+    cache.set("expired", {"sub": "deadpool", "exp": 999})
+    cache.set("no-exp", {"sub": "deadpool"})
+
+    assert cache.get("expired") is None
+    assert cache.get("no-exp") is None
+
+def test_revoke_single_token():
+    cache = VerifiedTokenCache(maxsize=4, clock=FakeClock())
+    cache.set("token", {"sub": "deadpool", "exp": 2_000})
+
+    cache.revoke("token")
+
+    assert cache.get("token") is None
+
+def test_revoke_subject_drops_all_of_its_tokens():
+    cache = VerifiedTokenCache(maxsize=4, clock=FakeClock())
+    cache.set("first", {"sub": "deadpool", "exp": 2_000})
+    cache.set("second", {"sub": "deadpool", "exp": 2_000})
+    cache.set("third", {"sub": "agent007", "exp": 2_000})
+
+    assert cache.revoke_subject("deadpool") == 2
+    assert cache.get("first") is None
+    assert cache.get("second") is None
+    assert cache.get("third") is not None
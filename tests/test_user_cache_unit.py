@@ -0,0 +1,41 @@
+import json
+
+from src.database.models import User, UserRole
+from src.services.user_cache import CACHE_VERSION, CachedUser, encode_user, decode_user
+
+
+def make_user():
+    return User(
+        id=1,
+        username="Test",
+        email="testo@gmail.com",
+        hashed_password="secret-hash",
+        avatar="https://example.com/avatar.jpg",
+        confirmed=True,
+        role=UserRole.ADMIN,
+    )
+
+def test_round_trip():
+    cached = CachedUser.from_user(make_user())
+
+    decoded = decode_user(encode_user(cached))
+
+    assert decoded == cached
+    assert decoded.role is UserRole.ADMIN
+    assert decoded.confirmed is True
+
+def test_payload_has_no_password_hash():
+    payload = encode_user(CachedUser.from_user(make_user()))
+
+    assert b"secret-hash" not in payload
+
+def test_version_mismatch_is_a_miss():
+    payload = json.loads(encode_user(CachedUser.from_user(make_user())))
+    payload[0] = CACHE_VERSION + 1
+
+    assert decode_user(json.dumps(payload)) is None
+
+def test_malformed_payload_is_a_miss():
+    assert decode_user(None) is None
+    assert decode_user(b"not json") is None
+    assert decode_user(b'{"py/object": "src.database.models.User"}') is None
@@ -5,6 +5,7 @@ from src.schemas import UserCreate
 
 from src.database.models import Contact, User
 from src.repository.users import UserRepository
+from src.services.local_cache import user_local_cache
 
 @pytest.fixture
 def mock_session():
@@ -116,3 +117,18 @@ async def test_update_avatar_url(users_repository, mock_session):
     assert result.avatar == new_avatar_url
     mock_session.commit.assert_awaited_once()
     mock_session.refresh.assert_awaited_once_with(result)
+
+@pytest.mark.asyncio
+async def test_update_avatar_url_invalidates_local_cache(users_repository, mock_session):
+    # Setup mock
+    user_data = User(id=1, username="Test", email="testo@gmail.com", avatar="https://example.com/avatar.jpg", role="user")
+    mock_session.execute = AsyncMock(
+        return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=user_data))
+    )
+    user_local_cache.set(user_data.username, object())
+
+    # Run test
+    await users_repository.update_avatar_url(user_data.email, "https://example.com/new_avatar.jpg")
+
+    # Assert
+    assert user_local_cache.get(user_data.username) is None